@@ -5,7 +5,7 @@ Redirects to login page if JWT is missing or invalid.
 
 from fastapi import Request
 from fastapi.responses import RedirectResponse
-from service.auth.auth import AuthService
+from service.auth.auth import auth_service, authenticate_token
 
 
 async def auth_middleware(request: Request, call_next):
@@ -28,7 +28,6 @@ async def auth_middleware(request: Request, call_next):
 
     # If not a public endpoint, require authentication
     if not is_public_endpoint:
-        auth_service = AuthService()
         token = request.cookies.get(auth_service.cookie_name)
 
         if not token:
@@ -36,8 +35,8 @@ async def auth_middleware(request: Request, call_next):
             return RedirectResponse(url="/login", status_code=302)
 
         try:
-            # Verify the JWT token
-            auth_service.verify_jwt(token)
+            # Verify the JWT token, shares the verified token cache with get_current_user
+            authenticate_token(token)
         except Exception as e:
             # Redirect to login page if token is invalid/expired
             return RedirectResponse(url="/login", status_code=302)
@@ -1,12 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from datetime import datetime
 
 # Simplified imports for Makefile compatibility
 from service.audittrail.audittrail_service import AuditTrailService
-from service.audittrail.audittrail_model import AuditTrailListResponse
-from service.db import get_db
+from service.audittrail.audittrail_model import AuditTrailListResponse, AuditTrailFilterRequest, AuditExportFormat
+from service.audittrail.action_const import UserAction
+from service.db import get_db, async_session
 from service.auth.auth import get_current_user
 from core.settings import config
+from core import CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE
 
 router = APIRouter(tags=["audittrail"])
 
@@ -14,12 +19,68 @@ router = APIRouter(tags=["audittrail"])
 async def list_audit_entries(
     limit: int = Query(config.PAGINATION.AUDIT_TRAIL_DEFAULT_LIMIT, ge=1, le=config.PAGINATION.MAX_LIMIT),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor/prev_cursor from a previous page"),
+    user_action: Optional[UserAction] = Query(None),
+    email: Optional[str] = Query(None),
+    created_by: Optional[str] = Query(None, description="Only applies to users who can view all audit entries"),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    estimate_count: bool = Query(False, description="Use a fast approximate total for the unfiltered system wide view"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """List audit trail entries with pagination based on permissions"""
+    """List audit trail entries with filtering and pagination based on permissions"""
     service = AuditTrailService(db)
     try:
-        return await service.list_audit_entries(current_user["email"], limit=limit, offset=offset, user_permissions=current_user.get("role"))
+        filters = AuditTrailFilterRequest(
+            user_action=user_action,
+            email=email,
+            created_by=created_by,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset,
+            cursor=cursor
+        )
+        return await service.list_audit_entries(current_user["email"], filters=filters, user_permissions=current_user.get("permissions"), estimate_count=estimate_count)
     except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/audittrail/export")
+async def export_audit_entries(
+    format: AuditExportFormat = Query(AuditExportFormat.CSV),
+    user_action: Optional[UserAction] = Query(None),
+    email: Optional[str] = Query(None),
+    created_by: Optional[str] = Query(None, description="Only applies to users who can view all audit entries"),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    current_user: dict = Depends(get_current_user)
+):
+    """Stream every matching audit trail entry as CSV or NDJSON, scoped by permissions"""
+    try:
+        filters = AuditTrailFilterRequest(
+            user_action=user_action,
+            email=email,
+            created_by=created_by,
+            start_date=start_date,
+            end_date=end_date
+        )
+        # rejected here, before the response has started
+        AuditTrailService.audit_scope(current_user["email"], current_user.get("permissions"))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def export_stream():
+        # the server side cursor needs a connection for the whole stream, so the
+        # stream owns its session instead of borrowing the request scoped one
+        async with async_session() as db:
+            service = AuditTrailService(db)
+            async for chunk in service.export_audit_entries(current_user["email"], filters=filters, user_permissions=current_user.get("permissions"), export_format=format):
+                yield chunk
+
+    filename = f"audit_trail_{datetime.now().strftime('%Y%m%d%H%M%S')}.{format.value}"
+    return StreamingResponse(
+        export_stream(),
+        media_type=CSV_MEDIA_TYPE if format == AuditExportFormat.CSV else NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "X-Accel-Buffering": "no"}
+    )
@@ -1,17 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Request, Response, Header
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, StreamingResponse, FileResponse
+from starlette.background import BackgroundTask
+from typing import Optional
+from datetime import datetime
+import os
+import json
 
 # Simplified imports for Makefile compatibility
 from service.incident.incident_service import IncidentService
 from service.incident.model import (
     CreateIncidentRequest, UpdateIncidentRequest, IncidentResponse,
     IncidentListResponse, AddChatMessageRequest, IncidentConfigResponse,
-    IncidentUploadResponse
+    IncidentUploadResponse, IncidentFilterRequest, IncidentStatus, IncidentPriority,
+    ChatMessageResponse, ChatMessageListResponse, IncidentExportFormat,
+    BulkIncidentRequest, BulkIncidentResponse
 )
-from service.db import get_db
+from service.db import get_db, async_session
+from service.uploadjob import UploadJobService, UploadJobResponse
+from service.realtime import hub
 from service.auth.auth import get_current_user
 from core.settings import config
+from core import CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE, PreconditionFailedError, make_etag, parse_if_match
 
 router = APIRouter(tags=["incidents"])
 
@@ -25,6 +35,70 @@ async def get_incident_config():
         upload_max_size_mb=config.INCIDENT.UPLOAD_MAX_SIZE_MB
     )
 
+EXPORT_MEDIA_TYPES = {
+    IncidentExportFormat.CSV: CSV_MEDIA_TYPE,
+    IncidentExportFormat.NDJSON: NDJSON_MEDIA_TYPE,
+    IncidentExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    IncidentExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+@router.get("/incidents/export")
+async def export_incidents(
+    format: IncidentExportFormat = Query(IncidentExportFormat.CSV),
+    status: Optional[IncidentStatus] = Query(None),
+    priority: Optional[IncidentPriority] = Query(None),
+    q: Optional[str] = Query(None, max_length=200, description="Ranked full text search in title and description"),
+    search: Optional[str] = Query(None, max_length=200, description="Deprecated alias of q"),
+    assigned_to: Optional[str] = Query(None),
+    created_from: Optional[datetime] = Query(None),
+    created_to: Optional[datetime] = Query(None),
+    sort: Optional[str] = Query(None, description="Comma separated fields, '-' prefix for descending"),
+    current_user: dict = Depends(get_current_user)
+):
+    """Export every incident the list shows for these filters. CSV and NDJSON stream, XLSX and Parquet download once built"""
+    filename = f"incidents_{datetime.now().strftime('%Y%m%d%H%M%S')}.{format.value}"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    try:
+        filters = IncidentFilterRequest(
+            status=status,
+            priority=priority,
+            q=q,
+            search=search,
+            assigned_to=assigned_to,
+            created_from=created_from,
+            created_to=created_to,
+            sort=sort
+        )
+
+        if format in (IncidentExportFormat.XLSX, IncidentExportFormat.PARQUET):
+            async with async_session() as db:
+                path = await IncidentService(db).build_incident_export(current_user["email"], filters, current_user.get("permissions"), format)
+            return FileResponse(path, media_type=EXPORT_MEDIA_TYPES[format], headers=headers, background=BackgroundTask(os.remove, path))
+
+        # the server side cursor needs a connection for the whole stream, so the
+        # stream owns its session instead of borrowing the request scoped one
+        async def export_stream():
+            async with async_session() as db:
+                async for chunk in IncidentService(db).export_incidents(current_user["email"], filters, current_user.get("permissions"), format):
+                    yield chunk
+
+        # pull the first chunk here so permission and query errors are still a 400
+        stream = export_stream()
+        first = await anext(stream, b"")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def body():
+        try:
+            yield first
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
+
+    headers["X-Accel-Buffering"] = "no"
+    return StreamingResponse(body(), media_type=EXPORT_MEDIA_TYPES[format], headers=headers)
+
 @router.post("/incidents/upload", response_model=IncidentUploadResponse)
 async def upload_incidents(
     file: UploadFile = File(...),
@@ -32,17 +106,18 @@ async def upload_incidents(
     current_user: dict = Depends(get_current_user)
 ):
     """Upload incidents from CSV/Excel file"""
+    # Reject oversized files up front when the size is known, the reader enforces it regardless
+    if file.size is not None and file.size > config.INCIDENT.UPLOAD_MAX_SIZE_MB * 1024 * 1024:
+        raise HTTPException(status_code=413, detail=f"File size exceeds maximum limit of {config.INCIDENT.UPLOAD_MAX_SIZE_MB}MB")
+
     service = IncidentService(db)
     try:
-        # Read file content
-        file_content = await file.read()
-
-        # Process the upload
+        # The spooled upload is streamed in batches instead of read into memory
         result = await service.bulk_upload_incidents(
-            file_content=file_content,
+            file=file.file,
             filename=file.filename,
             uploaded_by=current_user["email"],
-            user_permissions=current_user.get("role")
+            user_permissions=current_user.get("permissions")
         )
 
         return IncidentUploadResponse(
@@ -52,6 +127,38 @@ async def upload_incidents(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/incidents/upload/jobs", response_model=UploadJobResponse, status_code=202)
+async def create_upload_job(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """Queue a CSV/Excel upload for background processing, poll the returned job for progress"""
+    # Reject oversized files up front when the size is known, the copy enforces it regardless
+    if file.size is not None and file.size > config.INCIDENT.UPLOAD_MAX_SIZE_MB * 1024 * 1024:
+        raise HTTPException(status_code=413, detail=f"File size exceeds maximum limit of {config.INCIDENT.UPLOAD_MAX_SIZE_MB}MB")
+
+    service = UploadJobService(db)
+    try:
+        return await service.enqueue_upload(file.file, file.filename, current_user["email"], current_user.get("role"))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/incidents/upload/{job_id}", response_model=UploadJobResponse)
+async def get_upload_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get the status, progress and row errors of an upload job - only if uploaded by the same user"""
+    service = UploadJobService(db)
+    try:
+        return await service.get_job(job_id, current_user["email"])
+    except Exception as e:
+        if "not found" in str(e).lower():
+            raise HTTPException(status_code=404, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/incidents", response_model=IncidentResponse)
 async def create_incident(
     request: CreateIncidentRequest = Depends(CreateIncidentRequest.as_form),
@@ -61,28 +168,63 @@ async def create_incident(
     """Create a new incident"""
     service = IncidentService(db)
     try:
-        await service.create_incident(request, current_user["email"], current_user.get("role"))
+        await service.create_incident(request, current_user["email"], current_user.get("permissions"))
         # Create HTML redirect response with 303 See Other
         response = RedirectResponse(url="/home", status_code=303)
         return response
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/incidents/bulk", response_model=BulkIncidentResponse)
+async def bulk_update_incidents(
+    request: BulkIncidentRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """Set status, priority or assignee of, or delete, many incidents in one request"""
+    service = IncidentService(db)
+    try:
+        return await service.bulk_update_incidents(request, current_user["email"], current_user.get("permissions"))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/incidents", response_model=IncidentListResponse)
 async def list_incidents(
     limit: int = Query(config.PAGINATION.INCIDENT_DEFAULT_LIMIT, ge=1, le=config.PAGINATION.MAX_LIMIT),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor/prev_cursor from a previous page"),
+    status: Optional[IncidentStatus] = Query(None),
+    priority: Optional[IncidentPriority] = Query(None),
+    q: Optional[str] = Query(None, max_length=200, description="Ranked full text search in title and description"),
+    search: Optional[str] = Query(None, max_length=200, description="Deprecated alias of q"),
+    assigned_to: Optional[str] = Query(None),
+    created_from: Optional[datetime] = Query(None),
+    created_to: Optional[datetime] = Query(None),
+    sort: Optional[str] = Query(None, description="Comma separated fields, '-' prefix for descending"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """List incidents with pagination filtered by created_by"""
+    """List incidents with filtering, sorting and pagination filtered by created_by"""
     service = IncidentService(db)
     try:
-        return await service.list_incidents(current_user["email"], limit=limit, offset=offset, user_permissions=current_user.get("role"))
+        filters = IncidentFilterRequest(
+            status=status,
+            priority=priority,
+            q=q,
+            search=search,
+            assigned_to=assigned_to,
+            created_from=created_from,
+            created_to=created_to,
+            sort=sort,
+            limit=limit,
+            offset=offset,
+            cursor=cursor
+        )
+        return await service.list_incidents(current_user["email"], filters=filters, user_permissions=current_user.get("permissions"))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.post("/incidents/{id}/chat", response_model=IncidentResponse)
+@router.post("/incidents/{id}/chat", response_model=ChatMessageResponse)
 async def add_chat_message(
     id: str,
     request: AddChatMessageRequest,
@@ -92,41 +234,114 @@ async def add_chat_message(
     """Add a chat message to an incident"""
     service = IncidentService(db)
     try:
-        return await service.add_chat_message(id, request.content, current_user["email"], current_user["email"], current_user.get("role"))
+        return await service.add_chat_message(id, request.content, current_user["email"], current_user["email"], current_user.get("permissions"))
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(status_code=404, detail=str(e))
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/incidents/{id}/chat", response_model=ChatMessageListResponse)
+async def get_chat(
+    id: str,
+    before: Optional[str] = Query(None, description="before_cursor from a previous page, omit for the latest messages"),
+    limit: int = Query(config.PAGINATION.CHAT_DEFAULT_LIMIT, ge=1, le=config.PAGINATION.MAX_LIMIT),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get a page of an incident's chat, newest page first"""
+    service = IncidentService(db)
+    try:
+        return await service.get_chat(id, current_user["email"], current_user.get("permissions"), before=before, limit=limit)
+    except Exception as e:
+        if "not found" in str(e).lower():
+            raise HTTPException(status_code=404, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/incidents/{id}/events")
+async def incident_events(
+    id: str,
+    request: Request,
+    current_user: dict = Depends(get_current_user)
+):
+    """Stream live chat messages and updates of an incident as server-sent events"""
+    # Access is checked once in a short lived session so the stream does not hold a connection
+    async with async_session() as db:
+        service = IncidentService(db)
+        try:
+            incident = await service.get_incident(id, current_user["email"], current_user.get("permissions"))
+        except Exception as e:
+            if "not found" in str(e).lower():
+                raise HTTPException(status_code=404, detail=str(e))
+            raise HTTPException(status_code=400, detail=str(e))
+
+    subscription = hub.subscribe(int(incident.id))
+
+    async def event_stream():
+        try:
+            yield ": connected\n\n"
+            while True:
+                if await request.is_disconnected():
+                    break
+                event = await subscription.next_event(config.REALTIME.HEARTBEAT_SECONDS)
+                if subscription.lagged:
+                    # client fell too far behind, it refetches the incident and reconnects
+                    yield "event: lagged\ndata: {}\n\n"
+                    break
+                if event is None:
+                    yield ": ping\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/incidents/{id}", response_model=IncidentResponse)
 async def get_incident(
     id: str,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get a single incident by ID - only if created by the same user"""
+    """Get a single incident by ID - only if created by the same user. The ETag carries its version"""
     service = IncidentService(db)
     try:
-        return await service.get_incident(id, current_user["email"], current_user.get("role"))
+        incident = await service.get_incident(id, current_user["email"], current_user.get("permissions"))
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(status_code=404, detail=str(e))
         raise HTTPException(status_code=400, detail=str(e))
+    response.headers["ETag"] = make_etag(incident.version)
+    return incident
 
 @router.put("/incidents/{id}")
 async def update_incident(
     id: str,
     request: UpdateIncidentRequest = Depends(UpdateIncidentRequest.as_form),
+    if_match: Optional[str] = Header(None, description="ETag from GET /incidents/{id}, rejects the update with 412 if the incident changed since"),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Update an existing incident - only if created by the same user"""
     service = IncidentService(db)
     try:
-        await service.update_incident(id, request, current_user["email"], current_user["email"], current_user.get("role"))
+        incident = await service.update_incident(
+            id, request, current_user["email"], current_user["email"], current_user.get("permissions"),
+            expected_versions=parse_if_match(if_match)
+        )
         # Create HTML redirect response with 303 See Other
         response = RedirectResponse(url="/home", status_code=303)
+        response.headers["ETag"] = make_etag(incident.version)
         return response
+    except PreconditionFailedError as e:
+        headers = {}
+        if "current_version" in e.details:
+            headers["ETag"] = make_etag(e.details["current_version"])
+        raise HTTPException(status_code=412, detail=str(e), headers=headers)
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(status_code=404, detail=str(e))
@@ -141,7 +356,7 @@ async def delete_incident(
     """Soft delete an incident - only if created by the same user"""
     service = IncidentService(db)
     try:
-        success = await service.delete_incident(id, current_user["email"], current_user["email"], current_user.get("role"))
+        success = await service.delete_incident(id, current_user["email"], current_user["email"], current_user.get("permissions"))
         if success:
             return {"message": "Incident deleted successfully"}
         else:
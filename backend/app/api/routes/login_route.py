@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import JSONResponse, RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -6,7 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from service.login.login_service import LoginService
 from service.login.model import RegisterRequest, LoginRequest
 from service.db import get_db
-from service.auth.auth import AuthService
+from core import ServiceUnavailableError, AuthenticationError, LOGGER
+from service.auth.auth import auth_service
 from service.rbac.master_permission import roles
 
 router = APIRouter(tags=["login-register"])
@@ -18,18 +19,20 @@ async def login_user(
 ):
     """Login user endpoint - accepts both JSON and Form data"""
     service = LoginService(db)
-    auth_service = AuthService()
     try:
         result = await service.login_user(request)
 
         # Create HTML redirect response with 303 See Other
         response = RedirectResponse(url="/home", status_code=303)
         
-        # Set the authentication cookie
+        # Set the authentication and refresh cookies
         auth_service.set_auth_cookie(response, result.token)
+        auth_service.set_refresh_cookie(response, result.refresh_token)
         
         return response
         # return result
+    except ServiceUnavailableError as e:
+        raise HTTPException(status_code=503, detail=e.message, headers={"Retry-After": str(e.retry_after)})
     except Exception as e: # TODO: we might need to display it in the ui or error pop up
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -40,28 +43,53 @@ async def register_user(
 ):
     """Register a new user"""
     service = LoginService(db)
-    auth_service = AuthService()
     try:
         result = await service.register_user(request)
 
         # Create HTML redirect response with 303 See Other
         response = RedirectResponse(url="/home", status_code=303)
 
-        # Set the authentication cookie
+        # Set the authentication and refresh cookies
         auth_service.set_auth_cookie(response, result.token)
+        auth_service.set_refresh_cookie(response, result.refresh_token)
 
         return response
+    except ServiceUnavailableError as e:
+        raise HTTPException(status_code=503, detail=e.message, headers={"Retry-After": str(e.retry_after)})
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/refresh")
+async def refresh_session(request: Request, db: AsyncSession = Depends(get_db)):
+    """Issue a new access token from the refresh token cookie, rotating the refresh token"""
+    service = LoginService(db)
+    try:
+        result = await service.refresh_session(request.cookies.get(auth_service.refresh_cookie_name))
+
+        response = JSONResponse({"message": result.message, "email": result.email})
+        auth_service.set_auth_cookie(response, result.token)
+        auth_service.set_refresh_cookie(response, result.refresh_token)
+        return response
+    except AuthenticationError as e:
+        response = JSONResponse({"detail": e.message}, status_code=401)
+        auth_service.clear_refresh_cookie(response)
+        return response
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/logout")
-async def logout_user():
-    """Logout user by clearing the authentication cookie"""
-    auth_service = AuthService()
+async def logout_user(request: Request, db: AsyncSession = Depends(get_db)):
+    """Logout user by revoking the refresh token and clearing the authentication cookies"""
+    try:
+        await LoginService(db).logout_user(request.cookies.get(auth_service.refresh_cookie_name))
+    except Exception as e:
+        # the cookies are cleared regardless, a token left unrevoked still expires on its own
+        LOGGER.error(f"Failed to revoke refresh token on logout: {str(e)}")
 
     # Create HTML redirect response with 303 See Other
     response = RedirectResponse(url="/login", status_code=303)
 
-    # Clear the authentication cookie
+    # Clear the authentication cookies
     auth_service.clear_auth_cookie(response)
-    return response
\ No newline at end of file
+    auth_service.clear_refresh_cookie(response)
+    return response
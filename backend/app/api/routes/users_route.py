@@ -1,22 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Simplified imports for Makefile compatibility
 from service.users.users_service import UserService
-from service.users.model import EmailListResponse
+from service.users.model import EmailListResponse, UserSearchResponse
 from service.db import get_db
 from service.auth.auth import get_current_user
+from core import config
 
 router = APIRouter(tags=["users"])
 
-@router.get("/users/emails", response_model=EmailListResponse)
+@router.get("/users/emails", response_model=EmailListResponse, deprecated=True)
 async def list_user_emails(
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """List all user email addresses"""
+    """List all active user email addresses. Unbounded, use /users/search instead"""
     service = UserService(db)
     try:
         return await service.list_emails()
     except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/users/search", response_model=UserSearchResponse)
+async def search_user_emails(
+    response: Response,
+    prefix: str = Query("", max_length=255),
+    limit: int = Query(config.USERS.SEARCH_DEFAULT_LIMIT, ge=1, le=config.USERS.SEARCH_MAX_LIMIT),
+    after: Optional[str] = Query(None, max_length=255),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """Typeahead over active user emails starting with prefix, pass the last email as after for more"""
+    service = UserService(db)
+    try:
+        result = await service.search_emails(prefix, limit, after)
+        # the browser may reuse a result for as long as the server side cache would
+        response.headers["Cache-Control"] = f"private, max-age={config.USERS.SEARCH_CACHE_TTL_SECONDS}"
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
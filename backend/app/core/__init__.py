@@ -12,9 +12,15 @@ from .exceptions import (
     AuthorizationError,
     NotFoundError,
     ConflictError,
+    PreconditionFailedError,
+    ServiceUnavailableError,
     DatabaseError,
     ExternalServiceError
 )
+from .pagination import encode_cursor, decode_cursor, CURSOR_NEXT, CURSOR_PREV
+from .cache import TTLCache
+from .etag import make_etag, parse_if_match
+from .export import csv_header, encode_csv, encode_ndjson, CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE
 
 __all__ = [
     "setup_logging",
@@ -29,6 +35,20 @@ __all__ = [
     "AuthorizationError",
     "NotFoundError",
     "ConflictError",
+    "PreconditionFailedError",
+    "ServiceUnavailableError",
     "DatabaseError",
-    "ExternalServiceError"
+    "ExternalServiceError",
+    "encode_cursor",
+    "decode_cursor",
+    "CURSOR_NEXT",
+    "CURSOR_PREV",
+    "TTLCache",
+    "make_etag",
+    "parse_if_match",
+    "csv_header",
+    "encode_csv",
+    "encode_ndjson",
+    "CSV_MEDIA_TYPE",
+    "NDJSON_MEDIA_TYPE"
 ]
\ No newline at end of file
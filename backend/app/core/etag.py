@@ -0,0 +1,30 @@
+"""
+ETag helpers for optimistic concurrency.
+A resource's ETag is its version number as a strong entity tag, e.g. "3".
+"""
+
+from typing import List, Optional
+
+
+def make_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def parse_if_match(header: Optional[str]) -> Optional[List[int]]:
+    """
+    Versions an If-Match header accepts. None when the header is absent or "*",
+    meaning any version. Weak and malformed tags never match (strong comparison),
+    so they leave an empty list, which fails the precondition.
+    """
+    if header is None:
+        return None
+    header = header.strip()
+    if header == "*":
+        return None
+
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+            versions.append(int(tag[1:-1]))
+    return versions
@@ -66,6 +66,26 @@ class ConflictError(AppException):
         )
 
 
+class PreconditionFailedError(AppException):
+    """Conditional request failed, e.g. If-Match did not match the current version"""
+    def __init__(self, message: str, resource: Optional[str] = None, current_version: Optional[int] = None):
+        details = {"resource": resource} if resource else {}
+        if current_version is not None:
+            details["current_version"] = current_version
+        super().__init__(message=message, status_code=412, details=details)
+
+
+class ServiceUnavailableError(AppException):
+    """Capacity errors, the request was shed and can be retried after retry_after seconds"""
+    def __init__(self, message: str, retry_after: Optional[int] = None):
+        super().__init__(
+            message=message,
+            status_code=503,
+            details={"retry_after": retry_after} if retry_after is not None else {}
+        )
+        self.retry_after = retry_after
+
+
 class DatabaseError(AppException):
     """Database related errors"""
     def __init__(self, message: str, operation: Optional[str] = None):
@@ -0,0 +1,43 @@
+"""
+Encoders for streamed exports.
+Rows are encoded one batch at a time so an export of any size only ever holds
+a single batch in memory.
+"""
+
+import io
+import csv
+import json
+from datetime import datetime, date
+from enum import Enum
+from typing import Any, Iterable, Sequence
+
+CSV_MEDIA_TYPE = "text/csv"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def csv_header(columns: Sequence[str]) -> bytes:
+    return encode_csv([columns])
+
+
+def encode_csv(rows: Iterable[Sequence[Any]]) -> bytes:
+    """Encode rows as CSV lines, None becomes an empty field"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows([_plain(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def encode_ndjson(rows: Iterable[Sequence[Any]], columns: Sequence[str]) -> bytes:
+    """Encode rows as one JSON object per line keyed by column name"""
+    return "".join(
+        json.dumps({column: _plain(value) for column, value in zip(columns, row)}) + "\n"
+        for row in rows
+    ).encode("utf-8")
@@ -0,0 +1,52 @@
+"""
+Keyset (cursor) pagination helpers.
+Cursors are opaque url-safe strings carrying the sort key of a boundary row
+and the direction to page in, so the next query can seek straight to it.
+"""
+
+import json
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from .exceptions import ValidationError
+
+CURSOR_NEXT = "next"
+CURSOR_PREV = "prev"
+
+
+def _to_json(value: Any) -> Any:
+    # datetimes are tagged so they come back as datetimes and not plain strings
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _from_json(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(values: List[Any], direction: str = CURSOR_NEXT) -> str:
+    """Encode the sort key values of a boundary row into an opaque cursor"""
+    payload = {"v": [_to_json(v) for v in values], "d": direction}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[List[Any], str]]:
+    """Decode a cursor into (sort key values, direction). Returns None for an empty cursor"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = [_from_json(v) for v in payload["v"]]
+        direction = payload.get("d", CURSOR_NEXT)
+    except Exception:
+        raise ValidationError("Invalid pagination cursor", field="cursor")
+
+    if direction not in (CURSOR_NEXT, CURSOR_PREV):
+        raise ValidationError("Invalid pagination cursor", field="cursor")
+    return values, direction
@@ -0,0 +1,29 @@
+import time
+from .cache import TTLCache
+
+class TestTTLCache:
+    def test_set_get_invalidate(self):
+        """Test values are returned until invalidated"""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("a@example.com", 12)
+        assert cache.get("a@example.com") == 12
+        cache.invalidate("a@example.com", "missing@example.com")
+        assert cache.get("a@example.com") is None
+
+    def test_entries_expire(self):
+        """Test entries are dropped once their ttl has passed"""
+        cache = TTLCache(ttl_seconds=0.01)
+        cache.set("key", "value")
+        time.sleep(0.02)
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_evicted(self):
+        """Test the cache never grows beyond max_entries"""
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
@@ -0,0 +1,16 @@
+from .etag import make_etag, parse_if_match
+
+class TestETag:
+    def test_round_trip(self):
+        """Test an ETag parses back to its version"""
+        assert parse_if_match(make_etag(7)) == [7]
+
+    def test_any_version(self):
+        """Test a missing header and * accept any version"""
+        assert parse_if_match(None) is None
+        assert parse_if_match(" * ") is None
+
+    def test_list_and_invalid_tags(self):
+        """Test tag lists are parsed and weak or malformed tags never match"""
+        assert parse_if_match('"1", "2"') == [1, 2]
+        assert parse_if_match('W/"3", abc, ""') == []
@@ -0,0 +1,22 @@
+from datetime import datetime
+from enum import Enum
+from .export import csv_header, encode_csv, encode_ndjson
+
+class Color(str, Enum):
+    RED = "red"
+
+class TestExportEncoders:
+    def test_csv_quotes_and_blanks(self):
+        """Test CSV escapes separators and quotes and writes None as an empty field"""
+        assert csv_header(["id", "note"]) == b"id,note\n"
+        assert encode_csv([[1, 'a, "b"'], [2, None]]) == b'1,"a, ""b"""\n2,\n'
+
+    def test_ndjson_plain_values(self):
+        """Test NDJSON lines are keyed by column with datetimes and enums as plain values"""
+        line = encode_ndjson([(datetime(2025, 1, 2, 3, 4, 5), Color.RED)], ["created_on", "color"])
+        assert line == b'{"created_on": "2025-01-02T03:04:05", "color": "red"}\n'
+
+    def test_empty_batch(self):
+        """Test an empty batch encodes to nothing"""
+        assert encode_csv([]) == b""
+        assert encode_ndjson([], ["id"]) == b""
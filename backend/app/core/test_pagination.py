@@ -0,0 +1,33 @@
+import pytest
+from datetime import datetime
+from .pagination import encode_cursor, decode_cursor, CURSOR_NEXT, CURSOR_PREV
+from .exceptions import ValidationError
+
+class TestCursorPagination:
+    def test_cursor_round_trip(self):
+        """Test sort key values survive encode/decode including datetimes"""
+        created_on = datetime(2025, 1, 2, 3, 4, 5, 678901)
+        cursor = encode_cursor([created_on, 42], CURSOR_PREV)
+        values, direction = decode_cursor(cursor)
+        assert values == [created_on, 42]
+        assert direction == CURSOR_PREV
+
+    def test_cursor_is_url_safe(self):
+        """Test cursor can be passed as a query parameter without escaping"""
+        cursor = encode_cursor([datetime(2025, 1, 1), 1])
+        assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+    def test_default_direction_is_next(self):
+        """Test cursors default to paging forwards"""
+        _, direction = decode_cursor(encode_cursor([1]))
+        assert direction == CURSOR_NEXT
+
+    def test_empty_cursor(self):
+        """Test missing cursor decodes to None"""
+        assert decode_cursor(None) is None
+        assert decode_cursor("") is None
+
+    def test_invalid_cursor(self):
+        """Test tampered cursor raises a validation error"""
+        with pytest.raises(ValidationError):
+            decode_cursor("not-a-cursor")
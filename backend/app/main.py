@@ -8,6 +8,11 @@ import os
 from api.api_handler import api_router
 from api.middleware.auth_middleware import auth_middleware
 from core import setup_logging, LOGGER, AppException, config
+from service.realtime import start_realtime, stop_realtime
+from service.uploadjob import start_upload_workers, stop_upload_workers
+from service.incident.upload import shutdown_excel_pool
+from service.auth.hashing import shutdown_bcrypt_pool
+from service.audittrail import start_audit_writer, stop_audit_writer, start_audit_maintenance, stop_audit_maintenance
 
 # Setup logging
 setup_logging(config.LOGGING.LEVEL, config.LOGGING.MAX_BYTES, config.LOGGING.BACKUP_COUNT)
@@ -53,6 +58,10 @@ async def app_exception_handler(request: Request, exc: AppException):
 async def startup_event():
     LOGGER.info("Application startup initiated")
     # Add any startup tasks here (database initialization, etc.)
+    await start_audit_maintenance()
+    await start_audit_writer()
+    await start_realtime()
+    await start_upload_workers()
     LOGGER.info("Application startup completed")
 
 # Shutdown event
@@ -60,6 +69,13 @@ async def startup_event():
 async def shutdown_event():
     LOGGER.info("Application shutdown initiated")
     # Add any cleanup tasks here
+    await stop_upload_workers()
+    await stop_realtime()
+    shutdown_excel_pool()
+    shutdown_bcrypt_pool()
+    await stop_audit_maintenance()
+    # last, so audit entries of everything stopped above are drained
+    await stop_audit_writer()
     LOGGER.info("Application shutdown completed")
 
 # Mount static files for React app
@@ -5,5 +5,8 @@ Provides audit logging functionality for the incident tracker.
 
 from .audittrail_service import AuditTrailService
 from .action_const import UserAction
+from .write_behind import start_audit_writer, stop_audit_writer
+from .retention import start_audit_maintenance, stop_audit_maintenance
 
-__all__ = ["AuditTrailService", "UserAction"]
\ No newline at end of file
+__all__ = ["AuditTrailService", "UserAction", "start_audit_writer", "stop_audit_writer",
+           "start_audit_maintenance", "stop_audit_maintenance"]
\ No newline at end of file
@@ -3,6 +3,7 @@ Pydantic models for audittrail service.
 Contains request/response models for audit trail operations.
 """
 
+from enum import Enum
 from pydantic import BaseModel, Field, field_validator, EmailStr
 from typing import Optional, List
 from datetime import datetime
@@ -10,6 +11,15 @@ from .action_const import UserAction
 from core.settings import config
 
 
+class AuditExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+# Columns of an audit export, in file order
+AUDIT_EXPORT_COLUMNS = ("id", "user_action", "description", "email", "created_on", "created_by")
+
+
 class AuditTrailEntry(BaseModel):
     """Model for audit trail entry"""
     id: str = Field(..., min_length=1)
@@ -38,6 +48,17 @@ class CreateAuditTrailRequest(BaseModel):
         return v
 
 
+class BulkCreateAuditTrailRequest(BaseModel):
+    """Request model for writing many audit entries that share an action and email"""
+    user_action: UserAction
+    email: EmailStr
+    descriptions: List[Optional[str]]
+
+    @field_validator("descriptions")
+    def sanitize_descriptions(cls, v: List[Optional[str]]) -> List[Optional[str]]:
+        return [(d.strip() or None) if d is not None else None for d in v]
+
+
 class AuditTrailListResponse(BaseModel):
     """Response model for audit trail list with pagination"""
     entries: List[AuditTrailEntry]
@@ -45,20 +66,39 @@ class AuditTrailListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    total_count_estimated: bool = False  # total_count is the planner estimate, not an exact count
+    next_cursor: Optional[str] = None  # opaque keyset cursor for the following (older) page
+    prev_cursor: Optional[str] = None  # opaque keyset cursor for the preceding (newer) page
 
 
 class AuditTrailFilterRequest(BaseModel):
-    """Request model for filtering audit trail entries"""
+    """Request model for filtering and paginating audit trail entries, newest first"""
     user_action: Optional[UserAction] = None
     email: Optional[EmailStr] = None
+    created_by: Optional[str] = None  # only honoured for the system wide view
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     limit: int = Field(config.PAGINATION.AUDIT_TRAIL_DEFAULT_LIMIT, ge=1, le=config.PAGINATION.MAX_LIMIT)
     offset: int = Field(0, ge=0)
+    cursor: Optional[str] = None
+
+    @field_validator("created_by")
+    def blank_to_none(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None:
+            v = v.strip()
+            if not v:
+                return None
+        return v
 
     @field_validator("end_date")
     def validate_date_range(cls, v: Optional[datetime], values) -> Optional[datetime]:
         if v is not None and values.data.get("start_date") is not None:
             if v < values.data["start_date"]:
                 raise ValueError("end_date must be after start_date")
-        return v
\ No newline at end of file
+        return v
+
+    def has_filters(self) -> bool:
+        """Whether any filter narrows the entries (paging does not)"""
+        return any(value is not None for value in (
+            self.user_action, self.email, self.created_by, self.start_date, self.end_date
+        ))
@@ -4,12 +4,15 @@ Contains business logic for audit trail operations with proper logging and error
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, AsyncIterator
 from core import LOGGER, ValidationError, NotFoundError, DatabaseError
-from .data.data import AuditTrailDataAccess
+from core import encode_cursor, decode_cursor, CURSOR_NEXT, CURSOR_PREV
+from core import csv_header, encode_csv, encode_ndjson
+from .data.data import AuditTrailDataAccess, audit_row
+from .write_behind import defer_audit_rows
 from .audittrail_model import (
-    CreateAuditTrailRequest, AuditTrailEntry,
-    AuditTrailListResponse
+    CreateAuditTrailRequest, BulkCreateAuditTrailRequest, AuditTrailEntry,
+    AuditTrailListResponse, AuditTrailFilterRequest, AuditExportFormat, AUDIT_EXPORT_COLUMNS
 )
 from service.rbac import has_permission, Permission
 from core.settings import config
@@ -27,6 +30,12 @@ class AuditTrailService:
         LOGGER.info(f"Processing audit entry creation for action: {request.user_action}")
 
         try:
+            # With write-behind on, the entry is queued once the caller's transaction commits
+            row = audit_row(request.user_action.value, request.description, request.email, created_by)
+            if defer_audit_rows(self.db, [row]):
+                LOGGER.debug(f"Audit entry queued for write-behind with ID: {row['id']}")
+                return AuditTrailEntry(**{**row, 'user_action': request.user_action})
+
             # Create audit entry through data layer
             audit_entry = await self.audit_data.create_audit_entry(
                 user_action=request.user_action.value,
@@ -56,28 +65,84 @@ class AuditTrailService:
                 raise
             raise DatabaseError(f"Audit entry creation failed: {str(e)}", operation="create_audit_entry")
 
-    async def list_audit_entries(self, created_by: str, limit: int = config.PAGINATION.AUDIT_TRAIL_DEFAULT_LIMIT, offset: int = 0, user_permissions: bytes = None) -> AuditTrailListResponse:
-        """List audit entries with pagination based on permissions"""
-        LOGGER.info(f"Processing audit entries list request with pagination: limit={limit}, offset={offset}")
+    async def create_audittrail_entries(self, request: BulkCreateAuditTrailRequest, created_by: str) -> int:
+        """Create one audit entry per description in a single write, for bulk operations"""
+        LOGGER.info(f"Processing bulk audit entry creation for action: {request.user_action}, count: {len(request.descriptions)}")
+
+        try:
+            if defer_audit_rows(self.db, [
+                audit_row(request.user_action.value, description, request.email, created_by)
+                for description in request.descriptions
+            ]):
+                LOGGER.debug(f"Bulk audit entries queued for write-behind: {len(request.descriptions)}")
+                return len(request.descriptions)
+
+            created_count = await self.audit_data.create_audit_entries(
+                user_action=request.user_action.value,
+                email=request.email,
+                descriptions=request.descriptions,
+                created_by=created_by
+            )
+
+            LOGGER.info(f"Bulk audit entries created successfully: {created_count}")
+            return created_count
 
-        # Check permissions and choose appropriate data method
+        except Exception as e:
+            LOGGER.error(f"Bulk audit entry creation failed for action {request.user_action}: {str(e)}")
+            if isinstance(e, (ValidationError, DatabaseError)):
+                raise
+            raise DatabaseError(f"Bulk audit entry creation failed: {str(e)}", operation="create_audit_entries")
+
+    @staticmethod
+    def audit_scope(created_by: str, user_permissions: bytes | int = None) -> str | None:
+        """Whose audit entries the user may see: None for everyone's, otherwise their own"""
+        # Check permissions and choose the scope of entries
         if has_permission(user_permissions, Permission.PermViewAllAuditTrail):
             # User can view all audit entries
-            entries, total_count = await self.audit_data.list_all_audit_entries_paginated(limit, offset, created_by)
             LOGGER.debug("Listing all audit entries (PermViewAllAuditTrail)")
-        elif has_permission(user_permissions, Permission.PermViewAuditTrail):
+            return None
+        if has_permission(user_permissions, Permission.PermViewAuditTrail):
             # User can only view their own audit entries
-            entries, total_count = await self.audit_data.list_user_audit_entries_paginated(limit, offset, created_by)
             LOGGER.debug("Listing user audit entries (PermViewAuditTrail)")
-        else:
-            # User has no permission to view audit entries
-            LOGGER.warning(f"User {created_by} does not have permission to view audit entries")
-            raise ValidationError("You do not have permission to view audit entries")
+            return created_by
+        # User has no permission to view audit entries
+        LOGGER.warning(f"User {created_by} does not have permission to view audit entries")
+        raise ValidationError("You do not have permission to view audit entries")
+
+    async def list_audit_entries(self, created_by: str, filters: AuditTrailFilterRequest = None, user_permissions: bytes | int = None, estimate_count: bool = False) -> AuditTrailListResponse:
+        """List audit entries with filtering and pagination based on permissions. A cursor takes precedence over offset.
+        estimate_count only applies to the unfiltered system wide view, where an exact count is the costly part."""
+        filters = filters or AuditTrailFilterRequest()
+        limit, offset = filters.limit, filters.offset
+        LOGGER.info(f"Processing audit entries list request with pagination: limit={limit}, offset={offset}, cursor={filters.cursor}")
+
+        scope = self.audit_scope(created_by, user_permissions)
+
+        decoded = decode_cursor(filters.cursor)
+        cursor_values, direction = decoded if decoded else (None, CURSOR_NEXT)
+        entries, total_count, count_estimated, has_more = await self.audit_data.list_audit_entries_paginated(
+            limit, offset, created_by=scope, filters=filters, cursor_values=cursor_values,
+            direction=direction, estimate_count=estimate_count
+        )
 
         try:
             # Calculate total pages
             total_pages = (total_count + limit - 1) // limit
 
+            # Work out which neighbouring pages exist. Paging backwards, has_more refers to
+            # newer entries; paging forwards (or from an offset), it refers to older entries.
+            if direction == CURSOR_PREV:
+                has_prev, has_next = has_more, True
+            else:
+                has_prev, has_next = cursor_values is not None or offset > 0, has_more
+
+            next_cursor = prev_cursor = None
+            if entries:
+                if has_next:
+                    next_cursor = encode_cursor([entries[-1].created_on, entries[-1].id], CURSOR_NEXT)
+                if has_prev:
+                    prev_cursor = encode_cursor([entries[0].created_on, entries[0].id], CURSOR_PREV)
+
             # Convert to response models
             audit_responses = []
             for entry in entries:
@@ -100,11 +165,32 @@ class AuditTrailService:
                 total_count=total_count,
                 page=(offset // limit) + 1,
                 page_size=limit,
-                total_pages=total_pages
+                total_pages=total_pages,
+                total_count_estimated=count_estimated,
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor
             )
 
         except Exception as e:
             LOGGER.error(f"Audit entries list retrieval failed: {str(e)}")
             if isinstance(e, DatabaseError):
                 raise
-            raise DatabaseError(f"Audit entries list retrieval failed: {str(e)}", operation="list_audit_entries")
\ No newline at end of file
+            raise DatabaseError(f"Audit entries list retrieval failed: {str(e)}", operation="list_audit_entries")
+
+    async def export_audit_entries(self, created_by: str, filters: AuditTrailFilterRequest = None, user_permissions: bytes | int = None,
+                                   export_format: AuditExportFormat = AuditExportFormat.CSV) -> AsyncIterator[bytes]:
+        """Stream every audit entry the user may see that matches the filters, encoded in chunks"""
+        scope = self.audit_scope(created_by, user_permissions)
+        LOGGER.info(f"Processing audit export request: format={export_format.value}, user={created_by}")
+
+        exported = 0
+        if export_format == AuditExportFormat.CSV:
+            yield csv_header(AUDIT_EXPORT_COLUMNS)
+        async for batch in self.audit_data.stream_audit_entries(scope, filters, config.AUDIT.EXPORT_BATCH_ROWS):
+            if export_format == AuditExportFormat.CSV:
+                yield encode_csv(batch)
+            else:
+                yield encode_ndjson(batch, AUDIT_EXPORT_COLUMNS)
+            exported += len(batch)
+
+        LOGGER.info(f"Audit export completed: {exported} entries for user: {created_by}")
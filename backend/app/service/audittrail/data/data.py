@@ -5,10 +5,29 @@ Handles all database operations for audit trail management with proper logging.
 
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc
-from core import LOGGER, DatabaseError
+from sqlalchemy import select, insert, func, asc, desc, text, and_, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from core import LOGGER, DatabaseError, ValidationError, config, CURSOR_NEXT, CURSOR_PREV
 from service.db.models.audittrail_model import AuditTrail
+from service.audittrail.audittrail_model import AuditTrailFilterRequest, AUDIT_EXPORT_COLUMNS
 from datetime import datetime
+from typing import AsyncIterator
+
+def audit_row(user_action: str, description: str | None, email: str, created_by: str, created_on: datetime = None) -> dict:
+    """Column values of a new audit entry"""
+    created_on = created_on or datetime.now()
+    return {
+        'id': str(uuid.uuid4()),
+        'user_action': user_action,
+        'description': description,
+        'email': email,
+        'created_on': created_on,
+        'created_by': created_by,
+        'updated_on': created_on,
+        'updated_by': created_by,
+        'is_deleted': False
+    }
+
 
 class AuditTrailDataAccess:
     """Data access class for audit trail operations"""
@@ -53,59 +72,168 @@ class AuditTrailDataAccess:
             # Note: Transaction rollback handled by service layer
             raise DatabaseError(f"Failed to create audit entry: {str(e)}", operation="create_audit_entry")
 
-    async def list_all_audit_entries_paginated(self, limit: int, offset: int, created_by: str) -> tuple[list[AuditTrail], int]:
-        """List all audit entries with pagination"""
+    async def create_audit_entries(self, user_action: str, email: str, descriptions: list[str | None], created_by: str) -> int:
+        """
+        Create one audit entry per description in a single executemany INSERT, which
+        SQLAlchemy sends as batched multi-row VALUES statements. Returns the number written
+        """
         try:
-            LOGGER.debug(f"Querying all audit entries with pagination: limit={limit}, offset={offset}")
-
-            # Build base query - exclude deleted entries
-            query = select(AuditTrail).where(AuditTrail.is_deleted == False)
+            LOGGER.debug(f"Creating {len(descriptions)} audit entries for action: {user_action}")
+            if not descriptions:
+                return 0
 
-            # Get total count
-            count_query = select(func.count()).select_from(query.subquery())
-            total_count_result = await self.db.execute(count_query)
-            total_count = total_count_result.scalar()
-
-            # Apply ordering (latest first) and pagination
-            query = query.order_by(desc(AuditTrail.created_on)).offset(offset).limit(limit)
+            current_time = datetime.now()
+            rows = [audit_row(user_action, description, email, created_by, current_time) for description in descriptions]
+            await self.db.execute(insert(AuditTrail), rows)
 
-            # Execute query
-            result = await self.db.execute(query)
-            entries = result.scalars().all()
+            LOGGER.info(f"Created {len(rows)} audit entries for action: {user_action}")
+            return len(rows)
 
-            LOGGER.debug(f"Found {len(entries)} audit entries out of {total_count} total")
-            return entries, total_count
+        except Exception as e:
+            LOGGER.error(f"Failed to create audit entries {user_action}: {str(e)}")
+            raise DatabaseError(f"Failed to create audit entries: {str(e)}", operation="create_audit_entries")
+
+    async def insert_audit_rows(self, rows: list[dict]) -> None:
+        """
+        Insert complete audit rows (see audit_row), skipping ids that already exist.
+        Used by the write-behind pipeline, where a batch may be replayed after a crash.
+        """
+        try:
+            if not rows:
+                return
+            await self.db.execute(pg_insert(AuditTrail).on_conflict_do_nothing(), rows)
+            LOGGER.debug(f"Inserted {len(rows)} audit rows")
 
+        except Exception as e:
+            LOGGER.error(f"Failed to insert audit rows: {str(e)}")
+            raise DatabaseError(f"Failed to insert audit rows: {str(e)}", operation="insert_audit_rows")
+
+    async def _estimated_count(self) -> int | None:
+        """Planner row estimate for audit_trail, None when no partition was ever analyzed"""
+        # the partitioned parent holds no rows itself, so sum the estimates of its partitions
+        result = await self.db.execute(text(
+            "SELECT sum(c.reltuples)::bigint FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'audit_trail'::regclass AND c.reltuples >= 0"
+        ))
+        return result.scalar()
+
+    @staticmethod
+    def _filter_conditions(filters: AuditTrailFilterRequest | None, created_by: str | None) -> list:
+        """WHERE conditions for the optional filters. created_by scopes the entries to one user"""
+        conditions = [AuditTrail.is_deleted == False]
+        if filters is not None:
+            if filters.created_by is not None and created_by is None:
+                created_by = filters.created_by
+            if filters.user_action is not None:
+                conditions.append(AuditTrail.user_action == filters.user_action.value)
+            if filters.email is not None:
+                conditions.append(AuditTrail.email == filters.email)
+            # created_on is the partition key, so date bounds prune to the months they cover
+            if filters.start_date is not None:
+                conditions.append(AuditTrail.created_on >= filters.start_date)
+            if filters.end_date is not None:
+                conditions.append(AuditTrail.created_on <= filters.end_date)
+        if created_by is not None:
+            conditions.append(AuditTrail.created_by == created_by)
+        return conditions
+
+    async def list_audit_entries_paginated(self, limit: int, offset: int, created_by: str | None = None,
+                                           filters: AuditTrailFilterRequest | None = None,
+                                           cursor_values: list | None = None,
+                                           direction: str = CURSOR_NEXT,
+                                           estimate_count: bool = False) -> tuple[list[AuditTrail], int, bool, bool]:
+        """
+        List audit entries newest first, ordered by (created_on, id). created_by limits the
+        entries to that user, None lists everyone's (narrowed by filters.created_by if set).
+        When cursor_values (created_on, id) are given, seeks past that row instead of using
+        OFFSET, so paging deep into months of entries costs the same as the first page.
+        estimate_count uses the planner estimate for the unfiltered system wide total.
+        Returns the page, the total count, whether the count is an estimate and whether
+        more rows exist in the paging direction.
+        """
+        try:
+            LOGGER.debug(f"Querying audit entries with pagination: limit={limit}, offset={offset}, cursor={cursor_values}, direction={direction}, user={created_by}")
+
+            conditions = self._filter_conditions(filters, created_by)
+            query = select(AuditTrail).where(and_(*conditions))
+            count_query = select(func.count()).select_from(AuditTrail).where(and_(*conditions))
+
+            total_count, count_estimated = None, False
+            if estimate_count and created_by is None and (filters is None or not filters.has_filters()):
+                total_count = await self._estimated_count()
+                count_estimated = total_count is not None
+
+            window_count = False
+            if total_count is None:
+                if config.PAGINATION.COUNT_MODE == "window":
+                    # evaluated once as an InitPlan over the filters only, so a cursor page reports
+                    # the same total as the first page without counting past the LIMIT
+                    query = query.add_columns(count_query.scalar_subquery().label("total_count"))
+                    window_count = True
+                else:
+                    total_count = (await self.db.execute(count_query)).scalar()
+
+            if cursor_values is not None:
+                if len(cursor_values) != 2 or not isinstance(cursor_values[0], datetime):
+                    raise ValidationError("Invalid pagination cursor", field="cursor")
+                created_on, entry_id = cursor_values
+                row, cursor_row = tuple_(AuditTrail.created_on, AuditTrail.id), tuple_(created_on, entry_id)
+                # walking backwards (towards newer entries) flips the order, the page is flipped back below
+                if direction == CURSOR_PREV:
+                    query = query.where(row > cursor_row).order_by(asc(AuditTrail.created_on), asc(AuditTrail.id))
+                else:
+                    query = query.where(row < cursor_row).order_by(desc(AuditTrail.created_on), desc(AuditTrail.id))
+            else:
+                query = query.order_by(desc(AuditTrail.created_on), desc(AuditTrail.id)).offset(offset)
+
+            # Fetch one extra row to know whether another page exists
+            result = await self.db.execute(query.limit(limit + 1))
+            rows = result.all()
+            entries = [row[0] for row in rows]
+
+            if window_count:
+                if rows:
+                    total_count = rows[0].total_count
+                elif cursor_values is None and offset == 0:
+                    total_count = 0
+                else:
+                    # paged past the end, the window had no rows to report the total on
+                    total_count = (await self.db.execute(count_query)).scalar()
+
+            has_more = len(entries) > limit
+            entries = entries[:limit]
+            if cursor_values is not None and direction == CURSOR_PREV:
+                entries.reverse()
+
+            LOGGER.debug(f"Found {len(entries)} audit entries out of {'~' if count_estimated else ''}{total_count} total")
+            return entries, total_count, count_estimated, has_more
+
+        except ValidationError:
+            raise
         except Exception as e:
             LOGGER.error(f"Failed to query audit entries with pagination: {str(e)}")
             raise DatabaseError(f"Failed to query audit entries: {str(e)}", operation="list_audit_entries_paginated")
 
-    async def list_user_audit_entries_paginated(self, limit: int, offset: int, created_by: str) -> tuple[list[AuditTrail], int]:
-        """List audit entries created by the user with pagination"""
+    async def stream_audit_entries(self, created_by: str | None, filters: AuditTrailFilterRequest | None,
+                                   batch_rows: int) -> AsyncIterator[list]:
+        """
+        Yield every matching audit entry newest first, batch_rows at a time, as tuples of
+        AUDIT_EXPORT_COLUMNS. Rows come from a server side cursor, so only one batch is
+        held in memory however large the result is. Paging fields of filters are ignored.
+        """
         try:
-            LOGGER.debug(f"Querying user audit entries with pagination: limit={limit}, offset={offset}, user={created_by}")
-
-            # Build base query - exclude deleted entries and filter by created_by
-            query = select(AuditTrail).where(
-                AuditTrail.is_deleted == False,
-                AuditTrail.created_by == created_by
+            LOGGER.debug(f"Streaming audit entries: batch_rows={batch_rows}, user={created_by}")
+            conditions = self._filter_conditions(filters, created_by)
+            query = (
+                select(*[getattr(AuditTrail, column) for column in AUDIT_EXPORT_COLUMNS])
+                .where(and_(*conditions))
+                .order_by(desc(AuditTrail.created_on), desc(AuditTrail.id))
+                .execution_options(yield_per=batch_rows)
             )
-
-            # Get total count
-            count_query = select(func.count()).select_from(query.subquery())
-            total_count_result = await self.db.execute(count_query)
-            total_count = total_count_result.scalar()
-
-            # Apply ordering (latest first) and pagination
-            query = query.order_by(desc(AuditTrail.created_on)).offset(offset).limit(limit)
-
-            # Execute query
-            result = await self.db.execute(query)
-            entries = result.scalars().all()
-
-            LOGGER.debug(f"Found {len(entries)} user audit entries out of {total_count} total")
-            return entries, total_count
+            result = await self.db.stream(query)
+            async for batch in result.partitions():
+                yield batch
 
         except Exception as e:
-            LOGGER.error(f"Failed to query user audit entries with pagination: {str(e)}")
-            raise DatabaseError(f"Failed to query user audit entries: {str(e)}", operation="list_user_audit_entries_paginated")
\ No newline at end of file
+            LOGGER.error(f"Failed to stream audit entries: {str(e)}")
+            raise DatabaseError(f"Failed to stream audit entries: {str(e)}", operation="stream_audit_entries")
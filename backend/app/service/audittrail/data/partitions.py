@@ -0,0 +1,163 @@
+"""
+Data access for audit_trail partition maintenance.
+audit_trail is range partitioned by month into tables named audit_trail_yYYYYmMM.
+Everything here runs on a dedicated AUTOCOMMIT connection so each DDL step
+commits on its own and holds its locks only briefly.
+"""
+
+import os
+import re
+import gzip
+import asyncio
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from core import LOGGER, DatabaseError
+
+PARENT_TABLE = "audit_trail"
+DEFAULT_PARTITION = "audit_trail_default"
+PARTITION_PATTERN = re.compile(r"^audit_trail_y(\d{4})m(\d{2})$")
+# session level advisory lock so only one worker runs maintenance at a time
+MAINTENANCE_LOCK_KEY = 0x41554454  # "AUDT"
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"audit_trail_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Month a partition table holds, None for names that are not monthly partitions"""
+    match = PARTITION_PATTERN.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+class AuditPartitionDataAccess:
+    """Data access class for audit_trail partition maintenance"""
+
+    def __init__(self, conn: AsyncConnection):
+        self.conn = conn
+
+    async def try_lock(self) -> bool:
+        result = await self.conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+        return bool(result.scalar())
+
+    async def unlock(self) -> None:
+        await self.conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+
+    async def list_attached(self) -> List[str]:
+        """Monthly partitions currently attached to audit_trail"""
+        result = await self.conn.execute(text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'audit_trail'::regclass"
+        ))
+        return [name for name in result.scalars().all() if partition_month(name)]
+
+    async def list_detached(self) -> List[str]:
+        """Monthly partition tables that were detached but not archived and dropped yet"""
+        result = await self.conn.execute(text(
+            "SELECT c.relname FROM pg_class c "
+            "WHERE c.relkind = 'r' AND c.relname LIKE 'audit\\_trail\\_y%' "
+            "AND c.relnamespace = 'public'::regnamespace "
+            "AND NOT EXISTS (SELECT 1 FROM pg_inherits i WHERE i.inhrelid = c.oid)"
+        ))
+        return [name for name in result.scalars().all() if partition_month(name)]
+
+    async def create_partition(self, month: date) -> bool:
+        """Create the partition for a month, moving any rows that landed in the default partition"""
+        name = partition_name(month)
+        lower, upper = month.isoformat(), add_months(month, 1).isoformat()
+        bounds = {"lower": lower, "upper": upper}
+        try:
+            exists = await self.conn.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name})
+            if exists.scalar():
+                return False
+
+            stray = await self.conn.execute(text(
+                f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "
+                "WHERE created_on >= CAST(:lower AS timestamp) AND created_on < CAST(:upper AS timestamp))"
+            ), bounds)
+            if not stray.scalar():
+                await self.conn.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+                    f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+                ))
+            else:
+                # a partition cannot be created over rows sitting in the default partition, so
+                # move them into a new table and attach it. One DO block is one transaction
+                await self.conn.execute(text(
+                    "DO $$ BEGIN "
+                    f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS); "
+                    f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                    f"WHERE created_on >= '{lower}' AND created_on < '{upper}' RETURNING *) "
+                    f"INSERT INTO {name} SELECT * FROM moved; "
+                    f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{lower}') TO ('{upper}'); "
+                    "END $$"
+                ))
+                LOGGER.warning(f"Moved rows from {DEFAULT_PARTITION} into new partition {name}")
+
+            LOGGER.info(f"Created audit partition {name}")
+            return True
+
+        except Exception as e:
+            LOGGER.error(f"Failed to create audit partition {name}: {str(e)}")
+            raise DatabaseError(f"Failed to create audit partition: {str(e)}", operation="create_partition")
+
+    async def detach_partition(self, name: str) -> None:
+        try:
+            await self.conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+            LOGGER.info(f"Detached audit partition {name}")
+
+        except Exception as e:
+            LOGGER.error(f"Failed to detach audit partition {name}: {str(e)}")
+            raise DatabaseError(f"Failed to detach audit partition: {str(e)}", operation="detach_partition")
+
+    async def archive_partition(self, name: str, path: str) -> None:
+        """COPY a detached partition into a gzip compressed CSV file, written atomically"""
+        temp_path = f"{path}.tmp"
+        try:
+            raw = await self.conn.get_raw_connection()
+            archive = await asyncio.to_thread(gzip.open, temp_path, "wb")
+            try:
+                async def write(chunk: bytes) -> None:
+                    await asyncio.to_thread(archive.write, chunk)
+
+                await raw.driver_connection.copy_from_table(name, output=write, format="csv", header=True)
+            finally:
+                await asyncio.to_thread(archive.close)
+
+            await asyncio.to_thread(_fsync_path, temp_path)
+            os.replace(temp_path, path)
+            LOGGER.info(f"Archived audit partition {name} to {path}")
+
+        except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            LOGGER.error(f"Failed to archive audit partition {name}: {str(e)}")
+            raise DatabaseError(f"Failed to archive audit partition: {str(e)}", operation="archive_partition")
+
+    async def drop_partition(self, name: str) -> None:
+        try:
+            await self.conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            LOGGER.info(f"Dropped archived audit partition {name}")
+
+        except Exception as e:
+            LOGGER.error(f"Failed to drop audit partition {name}: {str(e)}")
+            raise DatabaseError(f"Failed to drop audit partition: {str(e)}", operation="drop_partition")
+
+
+def _fsync_path(path: str) -> None:
+    with open(path, "rb") as archive:
+        os.fsync(archive.fileno())
@@ -0,0 +1,115 @@
+"""
+Partition maintenance and retention for audit_trail.
+On startup and every AUDIT.MAINTENANCE_INTERVAL_SECONDS one process (guarded by a
+postgres advisory lock) makes sure monthly partitions exist up to
+AUDIT.PARTITION_MONTHS_AHEAD months ahead. With AUDIT.RETENTION_ENABLED, months
+older than AUDIT.RETENTION_MONTHS are detached, archived to a gzip CSV under
+AUDIT.ARCHIVE_DIR and dropped. Retention is off by default: the archive is the
+only copy left of a dropped month, so ARCHIVE_DIR must be durable storage that
+outlives the container before it is turned on.
+
+Crash safety: detach, archive and drop are separate steps. A detached table is
+no longer visible to queries but is only dropped after its archive file was
+written and renamed into place, so an interrupted run is picked up by the next
+one from wherever it stopped.
+"""
+
+import asyncio
+from pathlib import Path
+from datetime import date
+from typing import Optional
+
+from core import LOGGER, config
+from .data.partitions import AuditPartitionDataAccess, month_start, add_months, partition_month
+
+
+def archive_dir() -> Path:
+    path = Path(config.AUDIT.ARCHIVE_DIR)
+    if not path.is_absolute():
+        path = Path(__file__).parent.parent.parent / path
+    return path
+
+
+async def run_audit_maintenance(today: Optional[date] = None) -> None:
+    """Create upcoming partitions and retire expired ones. Skipped when another process holds the lock"""
+    # imported here so the package imports without a configured database
+    from service.db import engine
+
+    current = month_start(today or date.today())
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        partitions = AuditPartitionDataAccess(conn)
+        if not await partitions.try_lock():
+            LOGGER.debug("Audit partition maintenance already running elsewhere, skipping")
+            return
+        try:
+            for months in range(config.AUDIT.PARTITION_MONTHS_AHEAD + 1):
+                await partitions.create_partition(add_months(current, months))
+
+            if not config.AUDIT.RETENTION_ENABLED:
+                return
+            cutoff = add_months(current, -config.AUDIT.RETENTION_MONTHS)
+
+            for name in await partitions.list_attached():
+                if partition_month(name) < cutoff:
+                    await partitions.detach_partition(name)
+
+            expired = [name for name in await partitions.list_detached() if partition_month(name) < cutoff]
+            if expired:
+                target = archive_dir()
+                target.mkdir(parents=True, exist_ok=True)
+            for name in sorted(expired):
+                await partitions.archive_partition(name, str(target / f"{name}.csv.gz"))
+                await partitions.drop_partition(name)
+        finally:
+            await partitions.unlock()
+
+
+class AuditMaintenance:
+    """Runs audit partition maintenance periodically in the background"""
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        # first run before serving, so the current month's partition exists
+        await self._run_once()
+        self._task = asyncio.create_task(self._run())
+        LOGGER.info(f"Audit partition maintenance scheduled every {self.interval_seconds}s")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self._run_once()
+
+    async def _run_once(self) -> None:
+        try:
+            await run_audit_maintenance()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # rows still land in the default partition, so a failed run is not fatal
+            LOGGER.error(f"Audit partition maintenance failed: {str(e)}")
+
+
+_maintenance: Optional[AuditMaintenance] = None
+
+
+async def start_audit_maintenance() -> None:
+    global _maintenance
+    _maintenance = AuditMaintenance(config.AUDIT.MAINTENANCE_INTERVAL_SECONDS)
+    await _maintenance.start()
+
+
+async def stop_audit_maintenance() -> None:
+    global _maintenance
+    if _maintenance is not None:
+        await _maintenance.stop()
+        _maintenance = None
@@ -0,0 +1,35 @@
+from datetime import datetime
+from sqlalchemy import and_
+from sqlalchemy.dialects import postgresql
+from .audittrail_model import AuditTrailFilterRequest
+from .action_const import UserAction
+from .data.data import AuditTrailDataAccess
+
+def _where(filters, created_by=None) -> str:
+    conditions = AuditTrailDataAccess._filter_conditions(filters, created_by)
+    return str(and_(*conditions).compile(dialect=postgresql.dialect()))
+
+class TestAuditTrailFilters:
+    def test_filters_become_conditions(self):
+        """Test every filter narrows the query and date bounds apply to created_on"""
+        filters = AuditTrailFilterRequest(
+            user_action=list(UserAction)[0], email="a@b.io",
+            start_date=datetime(2025, 1, 1), end_date=datetime(2025, 2, 1)
+        )
+        where = _where(filters)
+        assert "audit_trail.user_action =" in where
+        assert "audit_trail.email =" in where
+        assert "audit_trail.created_on >=" in where and "audit_trail.created_on <=" in where
+        assert filters.has_filters()
+
+    def test_user_scope_overrides_created_by_filter(self):
+        """Test a user limited to their own entries cannot widen the scope with created_by"""
+        filters = AuditTrailFilterRequest(created_by="other@b.io")
+        conditions = AuditTrailDataAccess._filter_conditions(filters, "me@b.io")
+        values = [c.right.value for c in conditions if getattr(c.left, "name", None) == "created_by"]
+        assert values == ["me@b.io"]
+
+    def test_no_filters(self):
+        """Test an empty filter only excludes deleted entries"""
+        assert not AuditTrailFilterRequest().has_filters()
+        assert _where(None) == "audit_trail.is_deleted = false"
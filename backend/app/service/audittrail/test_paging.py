@@ -0,0 +1,37 @@
+import asyncio
+from datetime import datetime
+from sqlalchemy.dialects import postgresql
+from .data.data import AuditTrailDataAccess
+
+class _Result:
+    def all(self):
+        return []
+
+    def scalar(self):
+        return 0
+
+class _Session:
+    """Stands in for AsyncSession, keeps the SQL of every query and finds no rows"""
+    def __init__(self):
+        self.queries = []
+
+    async def execute(self, query):
+        self.queries.append(str(query.compile(dialect=postgresql.dialect())))
+        return _Result()
+
+def _page_sql(cursor_values=None) -> str:
+    db = _Session()
+    asyncio.run(AuditTrailDataAccess(db).list_audit_entries_paginated(10, 0, "me@b.io", cursor_values=cursor_values))
+    return db.queries[0]
+
+def _total_sql(sql: str) -> str:
+    return sql[sql.index("(SELECT count(*)"):sql.index("AS total_count")]
+
+class TestAuditTrailPaging:
+    def test_cursor_page_reports_the_first_page_total(self):
+        """Test the total is counted over the filters only, not the rows past the cursor"""
+        first, cursor = _page_sql(), _page_sql([datetime(2025, 1, 2), 42])
+        assert "(audit_trail.created_on, audit_trail.id) <" in cursor
+        assert _total_sql(cursor) == _total_sql(first)
+        assert "audit_trail.created_on, audit_trail.id" not in _total_sql(cursor)
+        assert "OVER" not in cursor
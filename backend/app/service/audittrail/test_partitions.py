@@ -0,0 +1,20 @@
+from datetime import date
+from .data.partitions import month_start, add_months, partition_name, partition_month
+
+class TestAuditPartitions:
+    def test_add_months_crosses_year_boundaries(self):
+        """Test month arithmetic wraps forwards and backwards across years"""
+        assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+        assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+        assert add_months(date(2025, 6, 1), -12) == date(2024, 6, 1)
+
+    def test_partition_name_round_trips(self):
+        """Test a partition name maps back to the month it holds"""
+        month = month_start(date(2025, 3, 17))
+        assert partition_name(month) == "audit_trail_y2025m03"
+        assert partition_month(partition_name(month)) == month
+
+    def test_other_tables_are_not_partitions(self):
+        """Test the default partition and unrelated tables are never treated as monthly partitions"""
+        assert partition_month("audit_trail_default") is None
+        assert partition_month("audit_trail_y2025m03_old") is None
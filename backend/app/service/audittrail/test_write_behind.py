@@ -0,0 +1,63 @@
+import asyncio
+from datetime import datetime
+from .write_behind import AuditWriteBehind, _read_rows
+from .data.data import audit_row
+
+class RecordingWriter(AuditWriteBehind):
+    """Writes batches to a list instead of the database"""
+    def __init__(self, spill_dir, **kwargs):
+        super().__init__(spill_dir, **kwargs)
+        self.inserted = []
+
+    async def _insert_file(self, path):
+        rows = _read_rows(path)
+        self.inserted.extend(rows)
+        return len(rows)
+
+class TestAuditWriteBehind:
+    def test_rows_round_trip_through_spill_file(self, tmp_path):
+        """Test queued rows are flushed with their ids and timestamps intact"""
+        row = audit_row("create_incident", "Created incident", "a@b.io", "a@b.io", datetime(2025, 1, 2, 3, 4, 5))
+
+        async def run():
+            writer = RecordingWriter(tmp_path, flush_max_entries=100, flush_interval_seconds=60)
+            await writer.start()
+            writer.enqueue([row])
+            await writer.stop()
+            return writer.inserted
+
+        assert asyncio.run(run()) == [row]
+        assert list(tmp_path.glob("*.jsonl")) == []
+
+    def test_size_trigger_flushes_without_waiting_for_interval(self, tmp_path):
+        """Test reaching flush_max_entries wakes the flusher"""
+        async def run():
+            writer = RecordingWriter(tmp_path, flush_max_entries=2, flush_interval_seconds=60)
+            await writer.start()
+            writer.enqueue([audit_row("login", None, "a@b.io", "a@b.io") for _ in range(2)])
+            await asyncio.sleep(0.1)
+            flushed = len(writer.inserted)
+            await writer.stop()
+            return flushed
+
+        assert asyncio.run(run()) == 2
+
+    def test_orphaned_spill_file_is_replayed_on_start(self, tmp_path):
+        """Test entries left behind by a crashed process are written on next start"""
+        async def crash():
+            writer = RecordingWriter(tmp_path, flush_max_entries=100, flush_interval_seconds=60)
+            await writer.start()
+            writer.enqueue([audit_row("logout", None, "a@b.io", "a@b.io")])
+            # simulate a crash: the flusher dies and the file lock is released
+            writer._task.cancel()
+            writer._spill.close()
+
+        async def restart():
+            writer = RecordingWriter(tmp_path, flush_max_entries=100, flush_interval_seconds=60)
+            await writer.start()
+            await writer.stop()
+            return writer.inserted
+
+        asyncio.run(crash())
+        assert len(asyncio.run(restart())) == 1
+        assert list(tmp_path.glob("*.jsonl")) == []
@@ -0,0 +1,218 @@
+"""
+Write-behind pipeline for audit trail entries (AUDIT.WRITE_BEHIND).
+Instead of inserting inside the request transaction, entries are handed over
+once that transaction commits, appended to a local spill file and inserted in
+batches by a background flusher when AUDIT.FLUSH_MAX_ENTRIES are pending or
+every AUDIT.FLUSH_INTERVAL_SECONDS.
+
+The spill file is the queue. Memory only holds a pending counter, and an entry
+is on disk before the request returns. A flush rotates the current file and
+inserts its rows with ON CONFLICT DO NOTHING, so a file replayed after a crash
+never duplicates entries. Each process holds an exclusive lock on the files it
+owns; on startup any unlocked spill file is an orphan of a dead process and is
+replayed. Shutdown drains whatever is pending.
+"""
+
+import os
+import json
+import fcntl
+import asyncio
+from pathlib import Path
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core import LOGGER, config
+from .data.data import AuditTrailDataAccess
+
+SPILL_SUFFIX = ".jsonl"
+
+
+def _to_line(row: dict) -> str:
+    return json.dumps({k: v.isoformat() if isinstance(v, datetime) else v for k, v in row.items()}) + "\n"
+
+
+def _from_line(line: str) -> dict:
+    row = json.loads(line)
+    for key in ("created_on", "updated_on"):
+        row[key] = datetime.fromisoformat(row[key])
+    return row
+
+
+def _read_rows(path: Path) -> List[dict]:
+    rows = []
+    with open(path, "r", encoding="utf-8") as spill:
+        for line in spill:
+            # a crash mid-write can leave a partial last line, which was never acknowledged
+            try:
+                rows.append(_from_line(line))
+            except (ValueError, KeyError):
+                LOGGER.warning(f"Skipping unreadable audit spill line in {path.name}")
+    return rows
+
+
+def _try_lock(handle) -> bool:
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+
+
+class AuditWriteBehind:
+    """Spill-file backed queue of audit rows with a batching background flusher"""
+
+    def __init__(self, spill_dir: Path, flush_max_entries: int, flush_interval_seconds: float):
+        self.spill_dir = spill_dir
+        self.flush_max_entries = flush_max_entries
+        self.flush_interval_seconds = flush_interval_seconds
+        self.pending = 0
+        self._spill = None
+        self._spill_path: Optional[Path] = None
+        self._sequence = 0
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        self.spill_dir.mkdir(parents=True, exist_ok=True)
+        await self._recover_orphans()
+        self._open_spill()
+        self._task = asyncio.create_task(self._run())
+        LOGGER.info(f"Audit write-behind started, spilling to: {self.spill_dir}")
+
+    async def stop(self) -> None:
+        """Flush everything pending and stop. Unflushed files are replayed on next start"""
+        self._stopping = True
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+            if self.pending == 0:
+                os.remove(self._spill_path)
+        LOGGER.info("Audit write-behind stopped")
+
+    def enqueue(self, rows: List[dict]) -> None:
+        """Append committed audit rows to the spill file. Runs on the event loop thread"""
+        if not rows:
+            return
+        if self._spill is None:
+            # committed after stop(), kept on disk for the next start to replay
+            self._open_spill()
+        self._spill.write("".join(_to_line(row) for row in rows))
+        self._spill.flush()
+        self.pending += len(rows)
+        if self.pending >= self.flush_max_entries:
+            self._wake.set()
+
+    def _open_spill(self) -> None:
+        self._sequence += 1
+        self._spill_path = self.spill_dir / f"audit-{os.getpid()}-{self._sequence}{SPILL_SUFFIX}"
+        self._spill = open(self._spill_path, "a", encoding="utf-8")
+        _try_lock(self._spill)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            if self.pending:
+                await self._flush()
+            if self._stopping:
+                return
+
+    async def _flush(self) -> None:
+        # rotate: new entries go to a fresh file while this one is inserted
+        handle, path = self._spill, self._spill_path
+        self.pending = 0
+        self._open_spill()
+        try:
+            os.fsync(handle.fileno())
+            while True:
+                try:
+                    count = await self._insert_file(path)
+                    LOGGER.debug(f"Flushed {count} audit entries")
+                    break
+                except Exception as e:
+                    LOGGER.error(f"Audit write-behind flush failed, retrying: {str(e)}")
+                    if self._stopping:
+                        # left on disk, replayed on next start
+                        return
+                    await asyncio.sleep(self.flush_interval_seconds)
+            os.remove(path)
+        finally:
+            handle.close()
+
+    async def _insert_file(self, path: Path) -> int:
+        # imported here so the package imports without a configured database
+        from service.db import async_session
+
+        rows = await asyncio.to_thread(_read_rows, path)
+        for start in range(0, len(rows), self.flush_max_entries):
+            async with async_session() as db:
+                async with db.begin():
+                    await AuditTrailDataAccess(db).insert_audit_rows(rows[start:start + self.flush_max_entries])
+        return len(rows)
+
+    async def _recover_orphans(self) -> None:
+        for path in sorted(self.spill_dir.glob(f"*{SPILL_SUFFIX}")):
+            handle = open(path, "a", encoding="utf-8")
+            try:
+                if not _try_lock(handle):
+                    continue  # owned by a live process
+                count = await self._insert_file(path)
+                os.remove(path)
+                LOGGER.info(f"Recovered {count} audit entries from {path.name}")
+            except Exception as e:
+                LOGGER.error(f"Failed to recover audit spill file {path.name}: {str(e)}")
+            finally:
+                handle.close()
+
+
+_writer: Optional[AuditWriteBehind] = None
+
+
+def defer_audit_rows(db: AsyncSession, rows: List[dict]) -> bool:
+    """
+    Queue audit rows to be written once the session's transaction commits; rolled back
+    work is never audited. Returns False when write-behind is off and the caller must
+    insert the rows itself.
+    """
+    writer = _writer
+    if writer is None:
+        return False
+
+    def _after_commit(session):
+        writer.enqueue(rows)
+
+    sa_event.listen(db.sync_session, "after_commit", _after_commit, once=True)
+    return True
+
+
+async def start_audit_writer() -> None:
+    """Start the write-behind pipeline when AUDIT.WRITE_BEHIND is enabled"""
+    global _writer
+    if not config.AUDIT.WRITE_BEHIND:
+        LOGGER.info("Audit write-behind disabled, audit entries are written in the request transaction")
+        return
+    spill_dir = Path(config.AUDIT.SPILL_DIR)
+    if not spill_dir.is_absolute():
+        spill_dir = Path(__file__).parent.parent.parent / spill_dir
+    writer = AuditWriteBehind(spill_dir, config.AUDIT.FLUSH_MAX_ENTRIES, config.AUDIT.FLUSH_INTERVAL_SECONDS)
+    await writer.start()
+    _writer = writer
+
+
+async def stop_audit_writer() -> None:
+    global _writer
+    if _writer is not None:
+        writer, _writer = _writer, None
+        await writer.stop()
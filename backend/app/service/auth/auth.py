@@ -3,15 +3,19 @@ Authentication service for JWT token management and password hashing.
 """
 
 import os
+import time
 import base64
-import bcrypt
+import hashlib
+import secrets
 import jwt
 from datetime import datetime, timezone,timedelta
 from typing import Dict, Any
 from fastapi import Response, Request, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from core import LOGGER
+from core import LOGGER, TTLCache, ServiceUnavailableError, config
+from service.rbac import bytes_to_permissions
+from .hashing import bcrypt_pool, hash_password_sync, verify_password_sync, hash_rounds
 
 
 class AuthService:
@@ -22,29 +26,33 @@ class AuthService:
         self.cookie_name = os.getenv("COOKIE_NAME", "auth_token")
         self.cookie_age = int(os.getenv("COOKIE_AGE", "600"))  # 24 hours in seconds
         self.cookie_secure = bool(os.getenv("COOKIE_SECURE","true")) #https
+        self.refresh_cookie_name = os.getenv("REFRESH_COOKIE_NAME", "refresh_token")
+        self.refresh_token_age = int(config.AUTH.REFRESH_TOKEN_DAYS) * 24 * 60 * 60
 
-    def hash_password(self, password: str) -> str:
-        """Hash a password using bcrypt"""
+    async def hash_password(self, password: str) -> str:
+        """Hash a password using bcrypt at the configured work factor, off the event loop"""
         try:
-            salt = bcrypt.gensalt()
-            # i am using Blowfish cipher algo because i like it:)
-            hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-            return hashed.decode('utf-8')
+            return await bcrypt_pool().run(hash_password_sync, password, config.AUTH.BCRYPT_ROUNDS)
+        except ServiceUnavailableError:
+            raise
         except Exception as e:
             LOGGER.error(f"Failed to hash password: {str(e)}")
             raise
 
-    def verify_password(self, password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash"""
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash, off the event loop"""
         try:
-            # I didnt store the salt because,
-            # bcrypt automatically extracts the salt from the stored hash string.
-            # It then rehashes the input password with that salt.
-            return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+            return await bcrypt_pool().run(verify_password_sync, password, hashed_password)
+        except ServiceUnavailableError:
+            raise
         except Exception as e:
             LOGGER.error(f"Failed to verify password: {str(e)}")
             return False
 
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """True when a stored hash was made with a different work factor than configured"""
+        return hash_rounds(hashed_password) != config.AUTH.BCRYPT_ROUNDS
+
     def generate_jwt(self, user_id: str, email: str, role: bytes = None) -> str:
         """Generate a JWT token for the user"""
         try:
@@ -91,6 +99,49 @@ class AuthService:
             LOGGER.error(f"Failed to clear auth cookie: {str(e)}")
             raise
 
+    def generate_refresh_token(self) -> tuple[str, str]:
+        """New opaque refresh token and the digest stored for it. 256 random bits, so sha256 is enough, no bcrypt"""
+        token = secrets.token_urlsafe(32)
+        return token, self.hash_refresh_token(token)
+
+    def hash_refresh_token(self, token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def refresh_token_expiry(self) -> datetime:
+        return datetime.now(timezone.utc) + timedelta(seconds=self.refresh_token_age)
+
+    def set_refresh_cookie(self, response: Response, token: str) -> None:
+        """Set the refresh token cookie, only sent to /api where refresh and logout live"""
+        try:
+            response.set_cookie(
+                key=self.refresh_cookie_name,
+                value=token,
+                httponly=True,
+                secure=self.cookie_secure,
+                samesite="strict",
+                max_age=self.refresh_token_age,
+                path="/api"
+            )
+            LOGGER.debug("Refresh cookie set successfully")
+        except Exception as e:
+            LOGGER.error(f"Failed to set refresh cookie: {str(e)}")
+            raise
+
+    def clear_refresh_cookie(self, response: Response) -> None:
+        """Clear the refresh token cookie in the response"""
+        try:
+            response.delete_cookie(
+                key=self.refresh_cookie_name,
+                httponly=True,
+                secure=self.cookie_secure,
+                samesite="strict",
+                path="/api"
+            )
+            LOGGER.debug("Refresh cookie cleared successfully")
+        except Exception as e:
+            LOGGER.error(f"Failed to clear refresh cookie: {str(e)}")
+            raise
+
     def verify_jwt(self, token: str) -> Dict[str, Any]:
         """Verify and decode a JWT token"""
         try:
@@ -107,10 +158,39 @@ class AuthService:
             raise
 
 
+# Process wide instance, the settings come from the environment once at import
+auth_service = AuthService()
+
+# Verified token payloads keyed by token digest. An entry never outlives its token's exp,
+# so serving it is exactly as correct as decoding the token again. Per worker.
+VERIFIED_TOKEN_CACHE = TTLCache(
+    ttl_seconds=config.AUTH.TOKEN_CACHE_TTL_SECONDS,
+    max_entries=config.AUTH.TOKEN_CACHE_MAX_ENTRIES
+)
+
+
+def authenticate_token(token: str) -> Dict[str, Any]:
+    """
+    Verify a JWT and return its payload with role decoded to bytes and the parsed permission
+    integer under "permissions". Repeat verifications of a token are a cache lookup.
+    Raises ValueError for invalid or expired tokens.
+    """
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    user = VERIFIED_TOKEN_CACHE.get(key)
+    if user is None:
+        user = auth_service.verify_jwt(token)
+        # Decode role from base64 to bytes if present
+        if user.get('role'):
+            user['role'] = base64.b64decode(user['role'])
+        user['permissions'] = bytes_to_permissions(user['role']) if user.get('role') else None
+        VERIFIED_TOKEN_CACHE.set(key, user, ttl_seconds=min(user['exp'] - time.time(), VERIFIED_TOKEN_CACHE.ttl_seconds))
+    # callers get their own copy so the cached payload cannot be changed through them
+    return dict(user)
+
+
 # Dependency function to get current user from JWT token in cookies
 async def get_current_user(request: Request) -> Dict[str, Any]:
     """Extract and verify JWT token from cookies, return user payload"""
-    auth_service = AuthService()
     token = request.cookies.get(auth_service.cookie_name)
 
     if not token:
@@ -118,10 +198,7 @@ async def get_current_user(request: Request) -> Dict[str, Any]:
         raise HTTPException(status_code=401, detail="Authentication required")
 
     try:
-        payload = auth_service.verify_jwt(token)
-        # Decode role from base64 to bytes if present
-        if payload.get('role'):
-            payload['role'] = base64.b64decode(payload['role'])
+        payload = authenticate_token(token)
         LOGGER.debug(f"User authenticated: {payload.get('email')}")
         return payload
     except ValueError as e:
@@ -129,4 +206,4 @@ async def get_current_user(request: Request) -> Dict[str, Any]:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
     except Exception as e:
         LOGGER.error(f"Authentication error: {str(e)}")
-        raise HTTPException(status_code=401, detail="Authentication failed")
\ No newline at end of file
+        raise HTTPException(status_code=401, detail="Authentication failed")
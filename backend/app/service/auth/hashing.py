@@ -0,0 +1,110 @@
+"""
+Password hashing off the event loop.
+bcrypt is deliberately slow (hundreds of milliseconds at the default work factor)
+and holds a CPU for the whole time. Running it inline on the event loop stalls
+every other request, so hashes and checks run in a small thread pool instead.
+The bcrypt module releases the GIL while hashing, so the pool uses real cores.
+
+Admission control: at most AUTH.BCRYPT_WORKERS hashes run at once and up to
+AUTH.BCRYPT_MAX_QUEUE more may wait. Beyond that new work is rejected straight
+away with ServiceUnavailableError, so a login storm gets fast 503s instead of
+an ever growing queue whose callers time out anyway.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import bcrypt
+
+from core import LOGGER, ServiceUnavailableError, config
+
+
+def hash_rounds(hashed_password: str) -> Optional[int]:
+    """Work factor of a bcrypt hash ($2b$12$...), None when it cannot be read"""
+    try:
+        return int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def hash_password_sync(password: str, rounds: int) -> str:
+    # i am using Blowfish cipher algo because i like it:)
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def verify_password_sync(password: str, hashed_password: str) -> bool:
+    # I didnt store the salt because,
+    # bcrypt automatically extracts the salt from the stored hash string.
+    # It then rehashes the input password with that salt.
+    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+class BcryptPool:
+    """Bounded thread pool for bcrypt work that sheds load once its queue is full"""
+
+    def __init__(self, workers: int, max_queue: int, retry_after: int = 1):
+        self.workers = workers
+        self.max_pending = workers + max_queue
+        self.retry_after = retry_after
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Hashes running or waiting for a worker"""
+        with self._lock:
+            return self._pending
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                LOGGER.debug(f"bcrypt pool saturated ({self._pending} pending), shedding request")
+                raise ServiceUnavailableError("Too many login attempts in progress, try again shortly",
+                                              retry_after=self.retry_after)
+            self._pending += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+            executor = self._executor
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        # released when the hash finishes, not when the caller stops waiting, so a
+        # disconnected client still counts until its worker is actually free
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_bcrypt_pool: Optional[BcryptPool] = None
+
+
+def bcrypt_pool() -> BcryptPool:
+    global _bcrypt_pool
+    if _bcrypt_pool is None:
+        _bcrypt_pool = BcryptPool(
+            workers=config.AUTH.BCRYPT_WORKERS,
+            max_queue=config.AUTH.BCRYPT_MAX_QUEUE,
+            retry_after=config.AUTH.BCRYPT_RETRY_AFTER_SECONDS
+        )
+    return _bcrypt_pool
+
+
+def shutdown_bcrypt_pool() -> None:
+    global _bcrypt_pool
+    if _bcrypt_pool is not None:
+        _bcrypt_pool.shutdown()
+        _bcrypt_pool = None
@@ -0,0 +1,61 @@
+import time
+import pytest
+from fastapi import Response
+from service.auth.auth import auth_service, authenticate_token, VERIFIED_TOKEN_CACHE
+from service.rbac import get_role_permissions, bytes_to_permissions
+
+class TestAuthenticateToken:
+    def setup_method(self):
+        VERIFIED_TOKEN_CACHE.clear()
+
+    def test_payload_carries_parsed_permissions(self):
+        """Test the verified payload has the role as bytes and the permission integer"""
+        role = get_role_permissions("User")
+        payload = authenticate_token(auth_service.generate_jwt(None, "a@example.com", role))
+        assert payload["email"] == "a@example.com"
+        assert payload["role"] == role
+        assert payload["permissions"] == bytes_to_permissions(role)
+
+    def test_repeat_verification_is_cached(self, monkeypatch):
+        """Test a token is decoded once and later calls are served from the cache"""
+        token = auth_service.generate_jwt(None, "a@example.com", get_role_permissions("Admin"))
+        authenticate_token(token)
+        monkeypatch.setattr(auth_service, "verify_jwt", lambda _: pytest.fail("token decoded again"))
+        assert authenticate_token(token)["email"] == "a@example.com"
+
+    def test_callers_cannot_change_the_cached_payload(self):
+        """Test each caller gets its own copy of the cached payload"""
+        token = auth_service.generate_jwt(None, "a@example.com", get_role_permissions("User"))
+        authenticate_token(token)["email"] = "b@example.com"
+        assert authenticate_token(token)["email"] == "a@example.com"
+
+    def test_entry_never_outlives_the_token(self):
+        """Test an almost expired token is cached only until its exp"""
+        token = auth_service.generate_jwt(None, "a@example.com", get_role_permissions("User"))
+        payload = authenticate_token(token)
+        expires_at, _ = next(iter(VERIFIED_TOKEN_CACHE._entries.values()))
+        assert expires_at - time.monotonic() <= max(payload["exp"] - time.time(), 0) + 1
+
+    def test_invalid_token_raises(self):
+        """Test an invalid token is rejected and not cached"""
+        with pytest.raises(ValueError):
+            authenticate_token("not-a-token")
+        assert len(VERIFIED_TOKEN_CACHE) == 0
+
+class TestRefreshToken:
+    def test_only_the_digest_is_stored(self):
+        """Test a refresh token is random and maps to a stable sha256 digest"""
+        token, token_hash = auth_service.generate_refresh_token()
+        other, _ = auth_service.generate_refresh_token()
+        assert token != other
+        assert token_hash == auth_service.hash_refresh_token(token)
+        assert len(token_hash) == 64 and token not in token_hash
+
+    def test_refresh_cookie_is_scoped_to_the_api(self):
+        """Test the refresh cookie is http only and only sent to /api"""
+        response = Response()
+        auth_service.set_refresh_cookie(response, "abc")
+        cookie = response.headers["set-cookie"]
+        assert "Path=/api" in cookie
+        assert "HttpOnly" in cookie
+        assert f"Max-Age={auth_service.refresh_token_age}" in cookie
@@ -0,0 +1,49 @@
+import asyncio
+import threading
+import pytest
+from core import ServiceUnavailableError
+from service.auth.hashing import BcryptPool, hash_password_sync, verify_password_sync, hash_rounds
+
+class TestPasswordHashing:
+    def test_hash_uses_requested_work_factor(self):
+        """Test the work factor is stored in the hash and checks still pass"""
+        hashed = hash_password_sync("secret", 4)
+        assert hash_rounds(hashed) == 4
+        assert verify_password_sync("secret", hashed)
+        assert not verify_password_sync("wrong", hashed)
+
+    def test_unreadable_hash_has_no_rounds(self):
+        """Test a malformed hash reports no work factor, so it is rehashed"""
+        assert hash_rounds("plain-text") is None
+
+class TestBcryptPool:
+    def test_runs_off_the_event_loop(self):
+        """Test work runs in a pool thread and its result is returned"""
+        pool = BcryptPool(workers=1, max_queue=0)
+        try:
+            name = asyncio.run(pool.run(lambda: threading.current_thread().name))
+            assert name.startswith("bcrypt")
+            assert pool.pending == 0
+        finally:
+            pool.shutdown()
+
+    def test_sheds_work_when_queue_is_full(self):
+        """Test work beyond workers plus queue depth is rejected straight away"""
+        pool = BcryptPool(workers=1, max_queue=1, retry_after=2)
+        release = threading.Event()
+
+        async def storm():
+            running = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0)
+            with pytest.raises(ServiceUnavailableError) as shed:
+                await pool.run(release.wait)
+            assert shed.value.status_code == 503
+            assert shed.value.retry_after == 2
+            release.set()
+            await asyncio.gather(*running)
+
+        try:
+            asyncio.run(storm())
+            assert pool.pending == 0
+        finally:
+            pool.shutdown()
@@ -8,6 +8,6 @@ and more importantly since db is a critical system,
 I want to only expose limited functions as part of db pkg
 """
 
-from .db import get_db , engine
+from .db import get_db , engine, async_session
 
-__all__ = ["get_db", "engine"]
\ No newline at end of file
+__all__ = ["get_db", "engine", "async_session"]
\ No newline at end of file
@@ -18,27 +18,151 @@ description TEXT,
 status VARCHAR(50) CHECK (status IN ('Open', 'In Progress', 'Resolved')) DEFAULT 'Open',
 priority VARCHAR(50) CHECK (priority IN ('Low', 'Medium', 'High')) DEFAULT 'Medium',
 assigned_to TEXT NOT NULL,
-chat JSONB DEFAULT '[]'::jsonb,
 created_on TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 created_by TEXT NOT NULL,
 updated_on TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 updated_by TEXT NOT NULL,
-is_deleted BOOLEAN DEFAULT FALSE
+is_deleted BOOLEAN DEFAULT FALSE,
+-- bumped by every update, exposed as the ETag for optimistic concurrency
+version INTEGER NOT NULL DEFAULT 1,
+-- full text search document, title matches weigh more than description matches
+search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+) STORED
 );
 
+CREATE INDEX if not exists idx_incident_tracker_search_vector ON incident_tracker USING GIN (search_vector);
+
 CREATE INDEX if not exists idx_incident_tracker_status ON incident_tracker(status);
 
 CREATE INDEX if not exists idx_incident_tracker_created_on ON incident_tracker(created_on);
 
+-- keyset pagination: list pages seek on (created_on, id) per creator / assignee, one UNION ALL arm each
+CREATE INDEX if not exists idx_incident_tracker_created_by_keyset ON incident_tracker(created_by, created_on DESC, id DESC) WHERE is_deleted = FALSE;
+
+CREATE INDEX if not exists idx_incident_tracker_assigned_to_keyset ON incident_tracker(assigned_to, created_on DESC, id DESC) WHERE is_deleted = FALSE;
+
+-- list filters: status / priority narrowed within a user's incidents, still in keyset order
+CREATE INDEX if not exists idx_incident_tracker_created_by_status ON incident_tracker(created_by, status, created_on DESC, id DESC) WHERE is_deleted = FALSE;
+
+CREATE INDEX if not exists idx_incident_tracker_assigned_to_status ON incident_tracker(assigned_to, status, created_on DESC, id DESC) WHERE is_deleted = FALSE;
 
+CREATE INDEX if not exists idx_incident_tracker_created_by_priority ON incident_tracker(created_by, priority, created_on DESC, id DESC) WHERE is_deleted = FALSE;
+
+CREATE INDEX if not exists idx_incident_tracker_assigned_to_priority ON incident_tracker(assigned_to, priority, created_on DESC, id DESC) WHERE is_deleted = FALSE;
+
+
+-- chat messages, one append only row per message
+CREATE TABLE IF NOT exists incident_chat (
+id BIGSERIAL PRIMARY KEY,
+incident_id INTEGER NOT NULL REFERENCES incident_tracker(id),
+useremail TEXT NOT NULL,
+content TEXT NOT NULL,
+created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX if not exists idx_incident_chat_incident_created ON incident_chat(incident_id, created_at, id);
+
+
+-- audit entries, range partitioned by month so date bounded queries prune to the
+-- relevant months and retention detaches whole partitions instead of deleting rows
 CREATE TABLE IF NOT exists audit_trail (
-id TEXT PRIMARY KEY,
+id TEXT NOT NULL,
 user_action TEXT NOT NULL,
 description TEXT,
 email TEXT NOT NULL,
-created_on TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+created_on TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
 created_by TEXT NOT NULL,
 updated_on TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 updated_by TEXT NOT NULL,
-is_deleted BOOLEAN DEFAULT FALSE
-);
\ No newline at end of file
+is_deleted BOOLEAN DEFAULT FALSE,
+PRIMARY KEY (id, created_on)
+) PARTITION BY RANGE (created_on);
+
+-- catches rows outside every monthly partition, normally stays empty because the
+-- app creates partitions AUDIT.PARTITION_MONTHS_AHEAD months in advance
+CREATE TABLE IF NOT EXISTS audit_trail_default PARTITION OF audit_trail DEFAULT;
+
+-- latest first listing, merged across partitions
+CREATE INDEX IF NOT EXISTS idx_audit_trail_created_on
+ON audit_trail(created_on DESC, id DESC);
+
+-- audit filters: each narrows the entries while keeping the (created_on, id) keyset order,
+-- and a date range additionally prunes to the months it covers
+CREATE INDEX IF NOT EXISTS idx_audit_trail_created_by_keyset
+ON audit_trail(created_by, created_on DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_audit_trail_user_action_keyset
+ON audit_trail(user_action, created_on DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_audit_trail_email_keyset
+ON audit_trail(email, created_on DESC, id DESC);
+
+-- monthly partitions named audit_trail_yYYYYmMM
+DO $$
+DECLARE
+    month DATE := date_trunc('month', now())::date;
+    last_month DATE := (date_trunc('month', now()) + interval '3 months')::date;
+BEGIN
+    WHILE month <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_trail FOR VALUES FROM (%L) TO (%L)',
+            'audit_trail_y' || to_char(month, 'YYYY') || 'm' || to_char(month, 'MM'),
+            month,
+            (month + interval '1 month')::date
+        );
+        month := (month + interval '1 month')::date;
+    END LOOP;
+END $$;
+
+-- background bulk upload jobs, claimed by workers with FOR UPDATE SKIP LOCKED
+CREATE TABLE IF NOT EXISTS incident_upload_job (
+id TEXT PRIMARY KEY,
+filename TEXT NOT NULL,
+file_path TEXT NOT NULL,
+status VARCHAR(20) NOT NULL DEFAULT 'queued',
+uploaded_by TEXT NOT NULL,
+user_permissions BYTEA,
+rows_processed INTEGER NOT NULL DEFAULT 0,
+uploaded_count INTEGER NOT NULL DEFAULT 0,
+error_count INTEGER NOT NULL DEFAULT 0,
+errors JSONB NOT NULL DEFAULT '[]'::jsonb,
+error_message TEXT,
+attempts INTEGER NOT NULL DEFAULT 0,
+worker_id TEXT,
+heartbeat_at TIMESTAMP,
+created_on TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+started_on TIMESTAMP,
+finished_on TIMESTAMP
+);
+
+-- only unfinished jobs are scanned when claiming
+CREATE INDEX IF NOT EXISTS idx_incident_upload_job_claim
+ON incident_upload_job(created_on, id) WHERE status IN ('queued', 'running');
+
+CREATE INDEX IF NOT EXISTS idx_incident_upload_job_uploaded_by
+ON incident_upload_job(uploaded_by, created_on DESC);
+
+-- rotating refresh tokens, only the sha256 of each token is stored. A family is one
+-- login session, every refresh revokes the presented token and adds the next one
+CREATE TABLE IF NOT EXISTS refresh_token (
+id TEXT PRIMARY KEY,
+user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+family_id TEXT NOT NULL,
+token_hash VARCHAR(64) NOT NULL UNIQUE,
+expires_at TIMESTAMPTZ NOT NULL,
+created_on TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+revoked_on TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_refresh_token_family
+ON refresh_token(family_id) WHERE revoked_on IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_refresh_token_user_expires
+ON refresh_token(user_id, expires_at);
+
+-- assignee typeahead: prefix range scans over active users' emails, in result order.
+-- The C collation makes a plain btree behave like text_pattern_ops and also serve ORDER BY
+CREATE INDEX IF NOT EXISTS idx_users_email_prefix
+ON users ((lower(email) COLLATE "C")) WHERE is_deleted = FALSE;
@@ -0,0 +1,187 @@
+-- migration script from version 1.0.1 ->1.0.2
+
+-- keyset (cursor) pagination for incident lists
+-- list pages are ordered by (created_on, id) and scoped to the creator or the assignee.
+-- Postgres answers an OR of the two with a BitmapOr and a full sort, so the page query is a
+-- UNION ALL of one arm per side, each an ordered range of its own index cut at the page size
+CREATE INDEX IF NOT EXISTS idx_incident_tracker_created_by_keyset
+ON incident_tracker(created_by, created_on DESC, id DESC) WHERE is_deleted = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_incident_tracker_assigned_to_keyset
+ON incident_tracker(assigned_to, created_on DESC, id DESC) WHERE is_deleted = FALSE;
+
+-- server side list filters
+-- status / priority filters narrowed within a user's incidents, still in keyset order
+CREATE INDEX IF NOT EXISTS idx_incident_tracker_created_by_status
+ON incident_tracker(created_by, status, created_on DESC, id DESC) WHERE is_deleted = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_incident_tracker_assigned_to_status
+ON incident_tracker(assigned_to, status, created_on DESC, id DESC) WHERE is_deleted = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_incident_tracker_created_by_priority
+ON incident_tracker(created_by, priority, created_on DESC, id DESC) WHERE is_deleted = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_incident_tracker_assigned_to_priority
+ON incident_tracker(assigned_to, priority, created_on DESC, id DESC) WHERE is_deleted = FALSE;
+
+-- full text search over title and description
+-- generated column keeps the document in sync on every insert/update, title weighs more than description
+ALTER TABLE incident_tracker
+ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_incident_tracker_search_vector
+ON incident_tracker USING GIN (search_vector);
+
+-- move chat out of the incident_tracker.chat JSONB array into an append only table
+-- so posting a message is a single INSERT instead of rewriting the whole array
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS incident_chat (
+id BIGSERIAL PRIMARY KEY,
+incident_id INTEGER NOT NULL REFERENCES incident_tracker(id),
+useremail TEXT NOT NULL,
+content TEXT NOT NULL,
+created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_incident_chat_incident_created
+ON incident_chat(incident_id, created_at, id);
+
+-- copy existing messages in their array order, so ids follow the original order for equal timestamps
+INSERT INTO incident_chat (incident_id, useremail, content, created_at)
+SELECT i.id,
+       msg.value->>'useremail',
+       msg.value->>'content',
+       COALESCE((msg.value->>'timestamp')::timestamptz, i.updated_on)
+FROM incident_tracker i
+CROSS JOIN LATERAL jsonb_array_elements(COALESCE(i.chat, '[]'::jsonb)) WITH ORDINALITY AS msg(value, position)
+ORDER BY i.id, msg.position;
+
+ALTER TABLE incident_tracker DROP COLUMN chat;
+
+COMMIT;
+
+-- background bulk upload jobs, claimed by workers with FOR UPDATE SKIP LOCKED
+CREATE TABLE IF NOT EXISTS incident_upload_job (
+id TEXT PRIMARY KEY,
+filename TEXT NOT NULL,
+file_path TEXT NOT NULL,
+status VARCHAR(20) NOT NULL DEFAULT 'queued',
+uploaded_by TEXT NOT NULL,
+user_permissions BYTEA,
+rows_processed INTEGER NOT NULL DEFAULT 0,
+uploaded_count INTEGER NOT NULL DEFAULT 0,
+error_count INTEGER NOT NULL DEFAULT 0,
+errors JSONB NOT NULL DEFAULT '[]'::jsonb,
+error_message TEXT,
+attempts INTEGER NOT NULL DEFAULT 0,
+worker_id TEXT,
+heartbeat_at TIMESTAMP,
+created_on TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+started_on TIMESTAMP,
+finished_on TIMESTAMP
+);
+
+-- only unfinished jobs are scanned when claiming
+CREATE INDEX IF NOT EXISTS idx_incident_upload_job_claim
+ON incident_upload_job(created_on, id) WHERE status IN ('queued', 'running');
+
+CREATE INDEX IF NOT EXISTS idx_incident_upload_job_uploaded_by
+ON incident_upload_job(uploaded_by, created_on DESC);
+
+-- range partition audit_trail by month: date bounded queries prune to the relevant
+-- months and retention detaches whole partitions instead of running huge DELETEs.
+-- the primary key has to include the partition key, so it becomes (id, created_on)
+BEGIN;
+
+ALTER TABLE audit_trail RENAME TO audit_trail_unpartitioned;
+ALTER INDEX audit_trail_pkey RENAME TO audit_trail_unpartitioned_pkey;
+
+CREATE TABLE audit_trail (
+id TEXT NOT NULL,
+user_action TEXT NOT NULL,
+description TEXT,
+email TEXT NOT NULL,
+created_on TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+created_by TEXT NOT NULL,
+updated_on TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+updated_by TEXT NOT NULL,
+is_deleted BOOLEAN DEFAULT FALSE,
+PRIMARY KEY (id, created_on)
+) PARTITION BY RANGE (created_on);
+
+-- catches rows outside every monthly partition, normally stays empty because the
+-- app creates partitions AUDIT.PARTITION_MONTHS_AHEAD months in advance
+CREATE TABLE IF NOT EXISTS audit_trail_default PARTITION OF audit_trail DEFAULT;
+
+-- latest first listing, merged across partitions
+CREATE INDEX IF NOT EXISTS idx_audit_trail_created_on
+ON audit_trail(created_on DESC, id DESC);
+
+-- monthly partitions named audit_trail_yYYYYmMM
+DO $$
+DECLARE
+    month DATE := date_trunc('month', COALESCE((SELECT min(created_on) FROM audit_trail_unpartitioned), now()))::date;
+    last_month DATE := (date_trunc('month', now()) + interval '3 months')::date;
+BEGIN
+    WHILE month <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_trail FOR VALUES FROM (%L) TO (%L)',
+            'audit_trail_y' || to_char(month, 'YYYY') || 'm' || to_char(month, 'MM'),
+            month,
+            (month + interval '1 month')::date
+        );
+        month := (month + interval '1 month')::date;
+    END LOOP;
+END $$;
+
+INSERT INTO audit_trail (id, user_action, description, email, created_on, created_by, updated_on, updated_by, is_deleted)
+SELECT id, user_action, description, email, COALESCE(created_on, updated_on, CURRENT_TIMESTAMP),
+       created_by, updated_on, updated_by, is_deleted
+FROM audit_trail_unpartitioned;
+
+DROP TABLE audit_trail_unpartitioned;
+
+COMMIT;
+
+-- audit filters: each narrows the entries while keeping the (created_on, id) keyset order,
+-- and a date range additionally prunes to the months it covers
+CREATE INDEX IF NOT EXISTS idx_audit_trail_created_by_keyset
+ON audit_trail(created_by, created_on DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_audit_trail_user_action_keyset
+ON audit_trail(user_action, created_on DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_audit_trail_email_keyset
+ON audit_trail(email, created_on DESC, id DESC);
+
+-- optimistic concurrency: every update bumps version and PUT /incidents/{id} can
+-- require the version the client last saw (If-Match), so concurrent edits are detected
+ALTER TABLE incident_tracker
+ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+
+-- rotating refresh tokens, only the sha256 of each token is stored. A family is one
+-- login session, every refresh revokes the presented token and adds the next one
+CREATE TABLE IF NOT EXISTS refresh_token (
+id TEXT PRIMARY KEY,
+user_id TEXT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+family_id TEXT NOT NULL,
+token_hash VARCHAR(64) NOT NULL UNIQUE,
+expires_at TIMESTAMPTZ NOT NULL,
+created_on TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+revoked_on TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_refresh_token_family
+ON refresh_token(family_id) WHERE revoked_on IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_refresh_token_user_expires
+ON refresh_token(user_id, expires_at);
+
+-- assignee typeahead: prefix range scans over active users' emails, in result order.
+-- The C collation makes a plain btree behave like text_pattern_ops and also serve ORDER BY
+CREATE INDEX IF NOT EXISTS idx_users_email_prefix
+ON users ((lower(email) COLLATE "C")) WHERE is_deleted = FALSE;
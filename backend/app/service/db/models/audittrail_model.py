@@ -10,6 +10,8 @@ from .base import Base
 class AuditTrail(Base):
     """
     Audit trail model matching the audit_trail table schema.
+    The table is range partitioned by month on created_on, which is why
+    created_on is part of the primary key.
     """
     __tablename__ = "audit_trail"
 
@@ -17,7 +19,7 @@ class AuditTrail(Base):
     user_action = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     email = Column(String, nullable=False)
-    created_on = Column(TIMESTAMP, nullable=False, server_default='CURRENT_TIMESTAMP')
+    created_on = Column(TIMESTAMP, primary_key=True, nullable=False, server_default='CURRENT_TIMESTAMP')
     created_by = Column(String, nullable=False)
     updated_on = Column(TIMESTAMP, nullable=False, server_default='CURRENT_TIMESTAMP')
     updated_by = Column(String, nullable=False)
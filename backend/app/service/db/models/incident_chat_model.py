@@ -0,0 +1,25 @@
+"""
+SQLAlchemy ORM models for incident chat.
+Uses the incident_chat table schema, one row per message.
+"""
+
+from sqlalchemy import Column, String, Text, TIMESTAMP, Integer, BigInteger, ForeignKey, func
+from .base import Base
+
+
+class IncidentChat(Base):
+    """
+    Chat message model matching the incident_chat table schema.
+    Messages are append only, ordered by (incident_id, created_at, id).
+    """
+    __tablename__ = "incident_chat"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True, nullable=False)
+    incident_id = Column(Integer, ForeignKey("incident_tracker.id"), nullable=False)
+    useremail = Column(String, nullable=False)
+    content = Column(Text, nullable=False)
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+
+    # when I print/debug the object, I dont want memory location rather this info
+    def __repr__(self):
+        return f"<IncidentChat(id='{self.id}', incident_id='{self.incident_id}', useremail='{self.useremail}')>"
@@ -1,9 +1,12 @@
 """
 SQLAlchemy ORM models for incidents.
 Uses the existing incident_tracker table schema.
+Chat messages live in their own table, see incident_chat_model.py.
 """
 
-from sqlalchemy import Column, String, Text, TIMESTAMP, Integer, Boolean, JSON
+from sqlalchemy import Column, String, Text, TIMESTAMP, Integer, Boolean, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 from .base import Base
 
 
@@ -19,12 +22,22 @@ class Incident(Base):
     status = Column(String(50), default="Open", nullable=False)
     priority = Column(String(50), default="Medium", nullable=False)
     assigned_to = Column(String, nullable=False)
-    chat = Column(JSON, default=[])
     created_on = Column(TIMESTAMP, nullable=False, server_default='CURRENT_TIMESTAMP')
     created_by = Column(String, nullable=False)
     updated_on = Column(TIMESTAMP, nullable=False, server_default='CURRENT_TIMESTAMP')
     updated_by = Column(String, nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False)
+    # bumped by every update, the ETag clients send back in If-Match
+    version = Column(Integer, default=1, server_default='1', nullable=False)
+    # generated by postgres for full text search, deferred so normal selects never load it
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True
+        )
+    ))
 
     # when I print/debug the object, I dont want memory location rather this info
     def __repr__(self):
@@ -0,0 +1,29 @@
+"""
+SQLAlchemy ORM models for refresh tokens.
+Uses the refresh_token table schema, one row per issued token.
+"""
+
+from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, func
+from .base import Base
+
+
+class RefreshToken(Base):
+    """
+    Refresh token model matching the refresh_token table schema.
+    Only the sha256 of a token is stored. Every refresh revokes the presented token and
+    issues a new one in the same family, so a revoked token coming back means it leaked
+    and the whole family is revoked.
+    """
+    __tablename__ = "refresh_token"
+
+    id = Column(String, primary_key=True, nullable=False)
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    family_id = Column(String, nullable=False)
+    token_hash = Column(String(64), unique=True, nullable=False)
+    expires_at = Column(TIMESTAMP(timezone=True), nullable=False)
+    created_on = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    revoked_on = Column(TIMESTAMP(timezone=True), nullable=True)
+
+    # when I print/debug the object, I dont want memory location rather this info
+    def __repr__(self):
+        return f"<RefreshToken(id='{self.id}', user_id='{self.user_id}', family_id='{self.family_id}')>"
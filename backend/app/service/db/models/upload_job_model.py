@@ -0,0 +1,39 @@
+"""
+SQLAlchemy ORM models for background upload jobs.
+Uses the incident_upload_job table schema, one row per uploaded file.
+"""
+
+from sqlalchemy import Column, String, Text, TIMESTAMP, Integer, LargeBinary, func
+from sqlalchemy.dialects.postgresql import JSONB
+from .base import Base
+
+
+class UploadJob(Base):
+    """
+    Upload job model matching the incident_upload_job table schema.
+    Workers claim queued jobs with SELECT ... FOR UPDATE SKIP LOCKED and keep
+    heartbeat_at fresh while running, so jobs of a dead worker can be reclaimed.
+    """
+    __tablename__ = "incident_upload_job"
+
+    id = Column(String, primary_key=True, nullable=False)
+    filename = Column(String, nullable=False)
+    file_path = Column(String, nullable=False)
+    status = Column(String(20), nullable=False, default="queued")
+    uploaded_by = Column(String, nullable=False)
+    user_permissions = Column(LargeBinary, nullable=True)
+    rows_processed = Column(Integer, nullable=False, default=0)
+    uploaded_count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)
+    errors = Column(JSONB, nullable=False, default=list)
+    error_message = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    worker_id = Column(String, nullable=True)
+    heartbeat_at = Column(TIMESTAMP, nullable=True)
+    created_on = Column(TIMESTAMP, nullable=False, server_default=func.now())
+    started_on = Column(TIMESTAMP, nullable=True)
+    finished_on = Column(TIMESTAMP, nullable=True)
+
+    # when I print/debug the object, I dont want memory location rather this info
+    def __repr__(self):
+        return f"<UploadJob(id='{self.id}', filename='{self.filename}', status='{self.status}')>"
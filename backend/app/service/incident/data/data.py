@@ -5,11 +5,97 @@ Handles all database operations for incident management with proper logging.
 
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_, or_
-from core import LOGGER, DatabaseError
+from sqlalchemy.orm import aliased
+from sqlalchemy import select, insert, update, delete, func, and_, or_, asc, desc, case, tuple_, literal, any_, bindparam, union_all, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from core import LOGGER, DatabaseError, ValidationError, PreconditionFailedError, CURSOR_NEXT, CURSOR_PREV, TTLCache, config
 from datetime import datetime,timezone
+from typing import AsyncIterator
 from service.db.models.incident_model import Incident
-from sqlalchemy.orm.attributes import flag_modified
+from service.db.models.incident_chat_model import IncidentChat
+from service.incident.model import IncidentFilterRequest, IncidentStatus, IncidentPriority
+
+# Status and priority sort by their workflow / severity rank rather than alphabetically
+STATUS_RANK = {status.value: rank for rank, status in enumerate(IncidentStatus)}
+PRIORITY_RANK = {priority.value: rank for rank, priority in enumerate(IncidentPriority)}
+
+# Text search configuration, must match the search_vector column definition
+SEARCH_CONFIG = "english"
+SEARCH_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+# Unfiltered incident totals per user email, invalidated when that user's incidents are
+# created or deleted. Per worker, so the TTL bounds how stale another worker's copy gets.
+INCIDENT_COUNT_CACHE = TTLCache(
+    ttl_seconds=config.PAGINATION.COUNT_CACHE_TTL_SECONDS,
+    max_entries=config.PAGINATION.COUNT_CACHE_MAX_ENTRIES
+)
+
+# Chat metadata for list rows, both answered from the (incident_id, created_at) index
+CHAT_COUNT = (
+    select(func.count())
+    .where(IncidentChat.incident_id == Incident.id)
+    .correlate(Incident)
+    .scalar_subquery()
+)
+LAST_MESSAGE_ON = (
+    select(func.max(IncidentChat.created_at))
+    .where(IncidentChat.incident_id == Incident.id)
+    .correlate(Incident)
+    .scalar_subquery()
+)
+
+INCIDENT_SORT_COLUMNS = {
+    "created_on": Incident.created_on,
+    "updated_on": Incident.updated_on,
+    "title": Incident.title,
+    "status": case(STATUS_RANK, value=Incident.status, else_=len(STATUS_RANK)),
+    "priority": case(PRIORITY_RANK, value=Incident.priority, else_=len(PRIORITY_RANK)),
+}
+
+
+def _sort_value(field: str, value):
+    """Map a raw column value from a cursor onto the value its sort expression compares against"""
+    if field == "status":
+        return STATUS_RANK.get(value, len(STATUS_RANK))
+    if field == "priority":
+        return PRIORITY_RANK.get(value, len(PRIORITY_RANK))
+    return value
+
+
+def _id_array(ids: list[int]):
+    """Incident ids as one array parameter, so id = ANY(:ids) is the same statement for any count"""
+    return bindparam("ids", ids, type_=ARRAY(Integer))
+
+
+def _keyset_condition(keys: list, values: list):
+    """
+    Rows strictly after the cursor row for a mixed-direction sort.
+    Expands to (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ... with < for descending keys.
+    When all keys share a direction a row comparison is used, which Postgres can seek on an index.
+    """
+    directions = {descending for _, descending in keys}
+    if len(directions) == 1:
+        row, cursor_row = tuple_(*[column for column, _ in keys]), tuple_(*values)
+        return row < cursor_row if directions.pop() else row > cursor_row
+
+    clauses = []
+    for i, (column, descending) in enumerate(keys):
+        equal_prefix = [keys[j][0] == values[j] for j in range(i)]
+        step = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*equal_prefix, step))
+    return or_(*clauses)
+
+def _scope_arms(emailID: str) -> list:
+    """
+    The user scope (creator or assignee) split into disjoint conditions. Postgres answers
+    the OR with a BitmapOr and sorts every matching row before LIMIT, while each arm on
+    its own is one ordered range of the created_by / assigned_to keyset index.
+    """
+    return [
+        Incident.created_by == emailID,
+        and_(Incident.assigned_to == emailID, Incident.created_by != emailID),
+    ]
+
 
 class IncidentDataAccess:
     """Data access class for incident operations"""
@@ -80,67 +166,267 @@ class IncidentDataAccess:
             LOGGER.error(f"Failed to query incident by ID {incident_id}: {str(e)}")
             raise DatabaseError(f"Failed to query incident: {str(e)}", operation="get_incident_by_id")
 
-    async def list_incidents_paginated(self, limit: int, offset: int, emailID: str) -> tuple[list[Incident], int]:
-        """List incidents with pagination filtered by created_by and assigned to"""
+    def invalidate_count_cache(self, *emails: str) -> None:
+        """
+        Drop cached incident totals for users whose incident set changed. Call it after the
+        transaction committed, earlier a concurrent list could cache the old total again.
+        """
+        INCIDENT_COUNT_CACHE.invalidate(*emails)
+
+    def _filter_conditions(self, emailID: str, filters: IncidentFilterRequest | None, search_query=None,
+                           scoped: bool = True) -> list:
+        """Build the WHERE conditions for the incident list from the user scope and filters"""
+        conditions = [Incident.is_deleted == False]
+        if scoped:
+            conditions.append(or_(Incident.created_by == emailID, Incident.assigned_to == emailID))
+        if filters is None:
+            return conditions
+
+        if filters.status is not None:
+            conditions.append(Incident.status == filters.status.value)
+        if filters.priority is not None:
+            conditions.append(Incident.priority == filters.priority.value)
+        if filters.assigned_to is not None:
+            conditions.append(Incident.assigned_to == filters.assigned_to)
+        if filters.created_from is not None:
+            conditions.append(Incident.created_on >= filters.created_from)
+        if filters.created_to is not None:
+            conditions.append(Incident.created_on <= filters.created_to)
+        if search_query is not None:
+            # matched against the GIN indexed tsvector instead of ILIKE scans
+            conditions.append(Incident.search_vector.op("@@")(search_query))
+        return conditions
+
+    async def list_incidents_paginated(self, limit: int, offset: int, emailID: str,
+                                       filters: IncidentFilterRequest | None = None,
+                                       cursor_values: list | None = None,
+                                       direction: str = CURSOR_NEXT) -> tuple[list[Incident], int, bool]:
+        """
+        List incidents filtered by created_by and assigned to plus the optional filters,
+        ordered by the requested sort (newest first by default) with id as tie breaker.
+        When cursor_values (one per sort field, then id) are given, seeks past that row using
+        keyset pagination instead of OFFSET so deep pages cost the same as the first one.
+        Returns the page, the total count and whether more rows exist in the paging direction.
+        """
         try:
-            LOGGER.debug(f"Querying incidents with pagination: limit={limit}, offset={offset} for user: {emailID}")
-
-            # Build base query - exclude deleted incidents and filter by created_by
-            query = select(Incident).where(
-                and_(Incident.is_deleted == False,or_(Incident.created_by == emailID,Incident.assigned_to==emailID))
+            LOGGER.debug(f"Querying incidents with pagination: limit={limit}, offset={offset}, cursor={cursor_values}, direction={direction} for user: {emailID}")
+
+            search_query = None
+            if filters is not None and filters.q is not None:
+                search_query = func.websearch_to_tsquery(SEARCH_CONFIG, filters.q)
+
+            # Build base query - exclude deleted incidents and apply the user scope and filters
+            conditions = self._filter_conditions(emailID, filters, search_query)
+            count_query = select(func.count()).select_from(Incident).where(and_(*conditions))
+
+            # The unfiltered per user total is cached, filtered totals are always computed
+            cacheable = filters is None or not filters.has_filters()
+            total_count = INCIDENT_COUNT_CACHE.get(emailID) if cacheable else None
+
+            window_count = False
+            if total_count is None and config.PAGINATION.COUNT_MODE != "window":
+                total_count = (await self.db.execute(count_query)).scalar()
+
+            # id is unique, so appending it gives a stable total order for the cursor
+            sort = filters.sort_spec() if filters is not None else [("created_on", True)]
+            sort_columns = dict(INCIDENT_SORT_COLUMNS)
+            rank = None
+            if search_query is not None:
+                rank = func.ts_rank(Incident.search_vector, search_query)
+                sort_columns["rank"] = rank
+            keys = [(sort_columns[field], descending) for field, descending in sort]
+            keys.append((Incident.id, sort[0][1]))
+
+            keyset = None
+            if cursor_values is not None:
+                if len(cursor_values) != len(keys):
+                    raise ValidationError("Pagination cursor does not match the requested sort", field="cursor")
+                # walking backwards means flipping every key, the page is flipped back below
+                if direction == CURSOR_PREV:
+                    keys = [(column, not descending) for column, descending in keys]
+                values = [_sort_value(field, value) for (field, _), value in zip(sort, cursor_values)]
+                values.append(cursor_values[-1])
+                keyset = _keyset_condition(keys, values)
+
+            # Each scope arm reads at most one page (plus the offset) in keyset order, the
+            # union of both is ordered and cut once more, so a page costs O(limit) rows
+            arm_limit = limit + 1 + (offset if keyset is None else 0)
+            arm_filters = self._filter_conditions(emailID, filters, search_query, scoped=False)
+            if keyset is not None:
+                arm_filters.append(keyset)
+            arm_order = [desc(column) if descending else asc(column) for column, descending in keys]
+            arms = [
+                select(
+                    select(Incident.id.label("id"), *[column.label(f"sort_{i}") for i, (column, _) in enumerate(keys)])
+                    .where(scope, *arm_filters)
+                    .order_by(*arm_order)
+                    .limit(arm_limit)
+                    .subquery()
+                )
+                for scope in _scope_arms(emailID)
+            ]
+            page = union_all(*arms).subquery("page")
+
+            # List rows never load the chat itself, only its size and the latest message time
+            query = (
+                select(Incident, CHAT_COUNT.label("chat_count"), LAST_MESSAGE_ON.label("last_message_on"))
+                .join(page, page.c.id == Incident.id)
             )
+            if total_count is None:
+                # evaluated once as an InitPlan, so the page query returns the total too
+                query = query.add_columns(count_query.scalar_subquery().label("total_count"))
+                window_count = True
+            if search_query is not None:
+                # snippets are only computed for the rows of the page
+                snippet = func.ts_headline(
+                    SEARCH_CONFIG, func.coalesce(Incident.description, Incident.title),
+                    search_query, SEARCH_HEADLINE_OPTIONS
+                )
+                query = query.add_columns(rank.label("rank"), snippet.label("snippet"))
 
-            # Get total count of non-deleted incidents for this user
-            count_query = select(func.count()).select_from(query.subquery())
-            total_count_result = await self.db.execute(count_query)
-            total_count = total_count_result.scalar()
+            query = query.order_by(*[
+                desc(page.c[f"sort_{i}"]) if descending else asc(page.c[f"sort_{i}"])
+                for i, (_, descending) in enumerate(keys)
+            ])
+            if keyset is None:
+                query = query.offset(offset)
 
-            # Apply pagination using limit and offset
-            query = query.offset(offset).limit(limit)
+            # Fetch one extra row to know whether another page exists
+            query = query.limit(limit + 1)
 
             # Execute query
             result = await self.db.execute(query)
-            incidents = result.scalars().all()
+            rows = result.all()
+            incidents = []
+            for row in rows:
+                incident = row[0]
+                incident.chat_count = row.chat_count
+                incident.last_message_on = row.last_message_on
+                if search_query is not None:
+                    # keep rank and snippet on the instances so the service can build cursors and responses
+                    incident.rank = row.rank
+                    incident.snippet = row.snippet
+                incidents.append(incident)
+
+            if window_count:
+                if rows:
+                    total_count = rows[0].total_count
+                elif cursor_values is None and offset == 0:
+                    total_count = 0
+                else:
+                    # paged past the end, the window had no rows to report the total on
+                    total_count = (await self.db.execute(count_query)).scalar()
+
+            if cacheable:
+                INCIDENT_COUNT_CACHE.set(emailID, total_count)
+
+            has_more = len(incidents) > limit
+            incidents = incidents[:limit]
+            if cursor_values is not None and direction == CURSOR_PREV:
+                incidents.reverse()
 
             LOGGER.debug(f"Found {len(incidents)} incidents out of {total_count} total for user: {emailID}")
-            return incidents, total_count
+            return incidents, total_count, has_more
 
+        except ValidationError:
+            raise
         except Exception as e:
             LOGGER.error(f"Failed to query incidents with pagination: {str(e)}")
             raise DatabaseError(f"Failed to query incidents: {str(e)}", operation="get_incidents_paginated")
 
-    async def update_incident(self, incident_id: str, update_data: dict, updated_by: str, emailID: str) -> Incident:
-        """Update an existing incident - only if created by the same user"""
+    async def stream_incidents(self, emailID: str, filters: IncidentFilterRequest | None,
+                               columns: list[str], batch_rows: int) -> AsyncIterator[list]:
+        """
+        Yield every incident the list would show for these filters, in the same order, as
+        tuples of columns, batch_rows at a time. Rows come from a server side cursor, so only
+        one batch is held in memory however many incidents match. Paging is ignored.
+        """
+        try:
+            LOGGER.debug(f"Streaming incidents: batch_rows={batch_rows} for user: {emailID}")
+
+            search_query = None
+            if filters is not None and filters.q is not None:
+                search_query = func.websearch_to_tsquery(SEARCH_CONFIG, filters.q)
+            conditions = self._filter_conditions(emailID, filters, search_query)
+
+            sort = filters.sort_spec() if filters is not None else [("created_on", True)]
+            sort_columns = dict(INCIDENT_SORT_COLUMNS)
+            if search_query is not None:
+                sort_columns["rank"] = func.ts_rank(Incident.search_vector, search_query)
+            keys = [(sort_columns[field], descending) for field, descending in sort]
+            keys.append((Incident.id, sort[0][1]))
+
+            query = (
+                select(*[getattr(Incident, column) for column in columns])
+                .where(and_(*conditions))
+                .order_by(*[desc(column) if descending else asc(column) for column, descending in keys])
+                .execution_options(yield_per=batch_rows)
+            )
+            result = await self.db.stream(query)
+            async for batch in result.partitions():
+                yield batch
+
+        except Exception as e:
+            LOGGER.error(f"Failed to stream incidents: {str(e)}")
+            raise DatabaseError(f"Failed to stream incidents: {str(e)}", operation="stream_incidents")
+
+    async def update_incident(self, incident_id: str, update_data: dict, updated_by: str, emailID: str,
+                              expected_versions: list[int] | None = None) -> Incident:
+        """
+        Update an existing incident the user created or is assigned, in one UPDATE ... RETURNING
+        that also bumps its version. With expected_versions the update only applies while the
+        incident is still at one of those versions; otherwise PreconditionFailedError is raised.
+        The returned incident carries previous_assigned_to, read in the same statement.
+        """
         try:
             # Convert string ID to integer for database query
             incident_id_int = int(incident_id)
-            LOGGER.debug(f"Updating incident {incident_id} (converted to int: {incident_id_int}) with data: {update_data} for user: {emailID}")
+            LOGGER.debug(f"Updating incident {incident_id} (converted to int: {incident_id_int}) with data: {update_data}, expected versions: {expected_versions} for user: {emailID}")
 
             # Add updated_by to the update data
             update_data['updated_by'] = updated_by
 
-            # Execute update - only allow update if incident was created by the same user
+            access = and_(
+                Incident.id == incident_id_int,
+                Incident.is_deleted == False,
+                or_(Incident.created_by == emailID, Incident.assigned_to == emailID)
+            )
+            conditions = [access]
+            if expected_versions is not None:
+                conditions.append(Incident.version.in_(expected_versions))
+
+            # RETURNING subqueries read the snapshot from before the update, i.e. the old assignee
+            previous = aliased(Incident)
+            previous_assigned_to = (
+                select(previous.assigned_to).where(previous.id == incident_id_int).scalar_subquery()
+            )
+
+            # Execute update - only allow update if incident was created by or assigned to the user
             result = await self.db.execute(
                 update(Incident)
-                .where(and_(
-                    Incident.id == incident_id_int,
-                    Incident.is_deleted == False,
-                    or_(Incident.created_by == emailID,Incident.assigned_to==emailID)
-                ))
-                .values(**update_data)
-                .returning(Incident)
+                .where(and_(*conditions))
+                .values(**update_data, version=Incident.version + 1)
+                .returning(Incident, previous_assigned_to.label("previous_assigned_to"))
             )
-
-            updated_incident = result.scalar_one_or_none()
-
-            if not updated_incident:
+            row = result.one_or_none()
+
+            if row is None:
+                if expected_versions is not None:
+                    # only the failure path pays for telling a stale version from a missing incident
+                    current_version = (await self.db.execute(select(Incident.version).where(access))).scalar_one_or_none()
+                    if current_version is not None:
+                        LOGGER.warning(f"Incident {incident_id} is at version {current_version}, expected one of {expected_versions}")
+                        raise PreconditionFailedError(
+                            "Incident was modified by someone else, reload it and retry",
+                            resource="incident", current_version=current_version
+                        )
                 LOGGER.warning(f"No incident found with ID: {incident_id} for user: {emailID}")
                 raise DatabaseError("Incident not found or access denied", operation="update_incident")
 
-            # Note: Transaction management moved to service layer
-            await self.db.refresh(updated_incident)
+            updated_incident = row[0]
+            updated_incident.previous_assigned_to = row.previous_assigned_to
 
-            LOGGER.info(f"Incident updated successfully: {incident_id}")
+            LOGGER.info(f"Incident updated successfully: {incident_id} (version {updated_incident.version})")
             return updated_incident
 
         except ValueError as e:
@@ -149,10 +435,78 @@ class IncidentDataAccess:
         except Exception as e:
             LOGGER.error(f"Failed to update incident {incident_id}: {str(e)}")
             # Note: Transaction rollback handled by service layer
-            if isinstance(e, DatabaseError):
+            if isinstance(e, (DatabaseError, PreconditionFailedError)):
                 raise
             raise DatabaseError(f"Failed to update incident: {str(e)}", operation="update_incident")
 
+    async def bulk_update_incidents(self, ids: list[int], update_data: dict, updated_by: str, emailID: str) -> list:
+        """
+        Apply the same change to every listed incident the user created or is assigned, in one
+        UPDATE ... WHERE id = ANY(:ids) RETURNING that also bumps each version. Ids that are
+        missing, deleted or not accessible are left alone. Returns (id, title, assigned_to,
+        previous_assigned_to, version, updated_on) rows of the updated incidents.
+        """
+        try:
+            LOGGER.debug(f"Bulk updating {len(ids)} incidents with data: {update_data} for user: {emailID}")
+
+            # RETURNING subqueries read the snapshot from before the update, i.e. the old assignee
+            previous = aliased(Incident)
+            previous_assigned_to = (
+                select(previous.assigned_to).where(previous.id == Incident.id).scalar_subquery()
+            )
+
+            result = await self.db.execute(
+                update(Incident)
+                .where(and_(
+                    Incident.id == any_(_id_array(ids)),
+                    Incident.is_deleted == False,
+                    or_(Incident.created_by == emailID, Incident.assigned_to == emailID)
+                ))
+                .values(**update_data, updated_by=updated_by, version=Incident.version + 1)
+                .returning(
+                    Incident.id, Incident.title, Incident.assigned_to,
+                    previous_assigned_to.label("previous_assigned_to"),
+                    Incident.version, Incident.updated_on
+                )
+                .execution_options(synchronize_session=False)
+            )
+            rows = result.all()
+
+            LOGGER.info(f"Bulk updated {len(rows)} of {len(ids)} incidents")
+            return rows
+
+        except Exception as e:
+            LOGGER.error(f"Failed to bulk update incidents: {str(e)}")
+            raise DatabaseError(f"Failed to bulk update incidents: {str(e)}", operation="bulk_update_incidents")
+
+    async def bulk_soft_delete_incidents(self, ids: list[int], deleted_by: str, created_by: str) -> list:
+        """
+        Soft delete every listed incident the user created, in one UPDATE ... WHERE id = ANY(:ids)
+        RETURNING. Returns (id, title, assigned_to) rows of the deleted incidents.
+        """
+        try:
+            LOGGER.debug(f"Bulk soft deleting {len(ids)} incidents for user: {created_by}")
+
+            result = await self.db.execute(
+                update(Incident)
+                .where(and_(
+                    Incident.id == any_(_id_array(ids)),
+                    Incident.is_deleted == False,
+                    Incident.created_by == created_by
+                ))
+                .values(is_deleted=True, updated_by=deleted_by, version=Incident.version + 1)
+                .returning(Incident.id, Incident.title, Incident.assigned_to)
+                .execution_options(synchronize_session=False)
+            )
+            rows = result.all()
+
+            LOGGER.info(f"Bulk soft deleted {len(rows)} of {len(ids)} incidents")
+            return rows
+
+        except Exception as e:
+            LOGGER.error(f"Failed to bulk soft delete incidents: {str(e)}")
+            raise DatabaseError(f"Failed to bulk soft delete incidents: {str(e)}", operation="bulk_soft_delete_incidents")
+
     async def soft_delete_incident(self, incident_id: str, deleted_by: str, created_by: str) -> bool:
         """Soft delete an incident - only if created by the same user"""
         try:
@@ -168,7 +522,7 @@ class IncidentDataAccess:
                     Incident.is_deleted == False,
                     Incident.created_by == created_by
                 ))
-                .values(is_deleted=True, updated_by=deleted_by)
+                .values(is_deleted=True, updated_by=deleted_by, version=Incident.version + 1)
             )
 
             if result.rowcount == 0:
@@ -187,52 +541,43 @@ class IncidentDataAccess:
             # Note: Transaction rollback handled by service layer
             raise DatabaseError(f"Failed to delete incident: {str(e)}", operation="soft_delete_incident")
 
-    async def add_chat_message(self, incident_id: str, user_email: str, content: str, emailID: str) -> Incident:
-        """Add a message to the incident's chat"""
+    async def add_chat_message(self, incident_id: str, user_email: str, content: str, emailID: str):
+        """
+        Append a message to the incident's chat.
+        A single INSERT ... SELECT that only inserts when the incident is visible to the user,
+        so concurrent posters never overwrite each other.
+        Returns the inserted message row, or None when no incident matched.
+        """
         try:
-            
             incident_id_int = int(incident_id)
             LOGGER.debug(f"Adding chat message to incident {incident_id} by user: {user_email}")
 
-            # Get current incident
+            visible_incident = select(
+                Incident.id, literal(user_email), literal(content)
+            ).where(
+                and_(
+                    Incident.id == incident_id_int,
+                    Incident.is_deleted == False,
+                    or_(Incident.created_by == emailID, Incident.assigned_to == emailID)
+                )
+            )
             result = await self.db.execute(
-                select(Incident).where(
-                    and_(
-                        Incident.id == incident_id_int,
-                        Incident.is_deleted == False,
-                        or_(Incident.created_by == emailID, Incident.assigned_to == emailID)
-                    )
+                insert(IncidentChat)
+                .from_select(["incident_id", "useremail", "content"], visible_incident)
+                .returning(
+                    IncidentChat.id, IncidentChat.incident_id, IncidentChat.useremail,
+                    IncidentChat.content, IncidentChat.created_at
                 )
             )
-            incident = result.scalar_one_or_none()
+            message = result.one_or_none()
 
-            if not incident:
+            if not message:
                 LOGGER.warning(f"No incident found with ID: {incident_id} for user: {emailID}")
-                raise DatabaseError("Incident not found or access denied", operation="add_chat_message")
-
-            # Initialize chat if None
-            if incident.chat is None:
-                incident.chat = []
-
-            # Add new message
-            new_message = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "useremail": user_email,
-                "content": content
-            }
-            incident.chat.append(new_message)
-
-            # Mark the chat field as modified for SQLAlchemy
-            # SQLAlchemy Issue: When you modify nested data in a JSON field, SQLAlchemy doesn't automatically detect the change
-            # Without flag_modified: The commit happens but the JSON field isn't updated in the database
-            # With flag_modified: SQLAlchemy knows the field changed and properly saves it
-            flag_modified(incident, 'chat')
+                return None
 
             # Note: Transaction management moved to service layer
-            # Refresh will be handled by service layer after commit
-
             LOGGER.info(f"Chat message added to incident: {incident_id}")
-            return incident
+            return message
 
         except ValueError as e:
             LOGGER.error(f"Invalid incident ID format: {incident_id}")
@@ -242,31 +587,71 @@ class IncidentDataAccess:
             # Note: Transaction rollback handled by service layer
             raise DatabaseError(f"Failed to add chat message: {str(e)}", operation="add_chat_message")
 
-    async def bulk_create_incidents(self, incidents_data: list[dict], created_by: str) -> list[Incident]:
-        """Bulk create multiple incidents in a single transaction"""
+    async def list_chat_messages(self, incident_id: int, limit: int, before_values: list | None = None) -> tuple[list[IncidentChat], bool]:
+        """
+        Get the latest chat messages of an incident older than the (created_at, id) cursor, walking
+        the (incident_id, created_at, id) index backwards. Access is checked by the caller.
+        Returns the page in time series order and whether older messages exist.
+        """
         try:
-            LOGGER.debug(f"Bulk creating {len(incidents_data)} incidents for user: {created_by}")
+            LOGGER.debug(f"Querying chat messages for incident: {incident_id}, limit={limit}, before={before_values}")
 
-            incidents = []
-            for data in incidents_data:
-                incident = Incident(
-                    title=data['title'],
-                    description=data.get('description'),
-                    status=data['status'],
-                    priority=data['priority'],
-                    assigned_to=data['assigned_to'],
-                    created_by=created_by,
-                    updated_by=created_by
+            query = select(IncidentChat).where(IncidentChat.incident_id == incident_id)
+            if before_values is not None:
+                query = query.where(
+                    tuple_(IncidentChat.created_at, IncidentChat.id) < tuple_(*before_values)
                 )
-                incidents.append(incident)
-                self.db.add(incident)
+            # Fetch one extra row to know whether older messages exist
+            query = query.order_by(desc(IncidentChat.created_at), desc(IncidentChat.id)).limit(limit + 1)
+
+            result = await self.db.execute(query)
+            messages = list(result.scalars().all())
 
-            # Flush to generate IDs but don't commit yet
-            await self.db.flush()
+            has_more = len(messages) > limit
+            messages = messages[:limit]
+            messages.reverse()
 
-            # Refresh all incidents to get their IDs
-            for incident in incidents:
-                await self.db.refresh(incident)
+            LOGGER.debug(f"Found {len(messages)} chat messages for incident: {incident_id}")
+            return messages, has_more
+
+        except Exception as e:
+            LOGGER.error(f"Failed to query chat messages for incident {incident_id}: {str(e)}")
+            raise DatabaseError(f"Failed to query chat messages: {str(e)}", operation="list_chat_messages")
+
+    async def bulk_create_incidents(self, incidents_data: list[dict], created_by: str) -> list:
+        """
+        Bulk create multiple incidents in the current transaction.
+        Rows go out as multi-row INSERT ... RETURNING statements (SQLAlchemy batches them
+        to stay under the bind parameter limit), so a large import takes a few round trips
+        instead of an INSERT and a refresh per incident. Returns rows of
+        (id, title, assigned_to, created_on) in input order.
+        """
+        try:
+            LOGGER.debug(f"Bulk creating {len(incidents_data)} incidents for user: {created_by}")
+            if not incidents_data:
+                return []
+
+            rows = [
+                {
+                    'title': data['title'],
+                    'description': data.get('description'),
+                    'status': data['status'],
+                    'priority': data['priority'],
+                    'assigned_to': data['assigned_to'],
+                    'created_by': created_by,
+                    'updated_by': created_by,
+                    'is_deleted': False
+                }
+                for data in incidents_data
+            ]
+            result = await self.db.execute(
+                insert(Incident).returning(
+                    Incident.id, Incident.title, Incident.assigned_to, Incident.created_on,
+                    sort_by_parameter_order=True
+                ),
+                rows
+            )
+            incidents = result.all()
 
             LOGGER.info(f"Bulk created {len(incidents)} incidents for user: {created_by}")
             return incidents
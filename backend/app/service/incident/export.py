@@ -0,0 +1,119 @@
+"""
+Incident export files.
+CSV and NDJSON are encoded batch by batch straight into the response. XLSX and
+Parquet need the whole file before it can be sent, so batches are spooled to a
+temporary CSV first and converted in the Excel process pool, keeping both the
+event loop and the worker's memory free of the full result.
+"""
+
+import os
+import csv
+import asyncio
+import tempfile
+from datetime import datetime
+from typing import AsyncIterator, Sequence
+
+import openpyxl
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from core import ValidationError, encode_csv, csv_header, config
+from .upload import excel_executor
+
+EXCEL_MAX_ROWS = 1048576  # sheet limit, header row included
+EXPORT_METADATA_COLUMNS = ("id", "created_on", "created_by", "updated_on", "updated_by")
+EXPORT_DATETIME_COLUMNS = ("created_on", "updated_on")
+
+
+def export_columns() -> list[str]:
+    """Upload fields first, so an export can be uploaded again as is, then the metadata columns"""
+    columns = list(config.INCIDENT.FIELDS)
+    return columns + [column for column in EXPORT_METADATA_COLUMNS if column not in columns]
+
+
+def csv_to_xlsx(src_path: str, dst_path: str, datetime_columns: Sequence[str] = ()) -> int:
+    """
+    Convert an export CSV into a single sheet workbook, returning the rows written. Runs in
+    the Excel process pool with openpyxl write-only mode, so rows are streamed to disk.
+    """
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("incidents")
+    rows_written = 0
+    with open(src_path, 'r', newline='', encoding='utf-8') as src:
+        reader = csv.reader(src)
+        header = next(reader, [])
+        sheet.append(header)
+        datetime_indexes = [i for i, column in enumerate(header) if column in datetime_columns]
+        for row in reader:
+            rows_written += 1
+            if rows_written >= EXCEL_MAX_ROWS:
+                raise ValidationError(f"XLSX exports are limited to {EXCEL_MAX_ROWS - 1} rows, narrow the filters or export CSV")
+            for i in datetime_indexes:
+                if row[i]:
+                    row[i] = datetime.fromisoformat(row[i])
+            sheet.append(row)
+    workbook.save(dst_path)
+    return rows_written
+
+
+def csv_to_parquet(src_path: str, dst_path: str, datetime_columns: Sequence[str] = ()) -> int:
+    """
+    Convert an export CSV into Parquet, returning the rows written. Runs in the Excel
+    process pool and reads the CSV in record batches, so memory stays constant.
+    Every column gets a fixed type, so the schema never comes from inferring the first
+    block, which a run of empty or numeric looking values would get wrong.
+    """
+    with open(src_path, 'r', newline='', encoding='utf-8') as src:
+        header = next(csv.reader(src), [])
+    column_types = {column: pa.string() for column in header}
+    column_types.update({column: pa.timestamp("us") for column in datetime_columns})
+    column_types["id"] = pa.int64()
+    reader = pa_csv.open_csv(
+        src_path,
+        convert_options=pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=False)
+    )
+    rows_written = 0
+    with pq.ParquetWriter(dst_path, reader.schema) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            rows_written += batch.num_rows
+    return rows_written
+
+
+FILE_CONVERTERS = {
+    "xlsx": csv_to_xlsx,
+    "parquet": csv_to_parquet,
+}
+
+
+async def build_export_file(batches: AsyncIterator[list], columns: Sequence[str], export_format: str) -> str:
+    """
+    Spool row batches to a temporary CSV and convert it into an export_format file in the
+    Excel process pool. Returns the path of the file, which the caller must remove.
+    """
+    csv_path = _temp_path('.csv')
+    dst_path = None
+    try:
+        with open(csv_path, 'wb') as spool:
+            await asyncio.to_thread(spool.write, csv_header(columns))
+            async for batch in batches:
+                await asyncio.to_thread(spool.write, encode_csv(batch))
+
+        dst_path = _temp_path(f'.{export_format}')
+        await asyncio.get_running_loop().run_in_executor(
+            excel_executor(), FILE_CONVERTERS[export_format], csv_path, dst_path, EXPORT_DATETIME_COLUMNS
+        )
+        return dst_path
+    except BaseException:
+        if dst_path is not None and os.path.exists(dst_path):
+            os.remove(dst_path)
+        raise
+    finally:
+        os.remove(csv_path)
+
+
+def _temp_path(suffix: str) -> str:
+    fd, path = tempfile.mkstemp(suffix=suffix, prefix="incident_export_")
+    os.close(fd)
+    return path
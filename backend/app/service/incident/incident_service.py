@@ -4,21 +4,36 @@ Contains business logic for incident operations with proper logging and error ha
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
-from core import LOGGER, ValidationError, NotFoundError, DatabaseError
-import pandas as pd
-import io
+from typing import List, BinaryIO, Callable, Optional, AsyncIterator
+from core import LOGGER, ValidationError, NotFoundError, DatabaseError, PreconditionFailedError
+from core import encode_cursor, decode_cursor, CURSOR_NEXT, CURSOR_PREV
+from core import csv_header, encode_csv, encode_ndjson
 from .data.data import IncidentDataAccess
+from .upload import iter_upload_batches, validate_upload_batch, canonical_options
+from .export import export_columns, build_export_file
 from .model import (
     CreateIncidentRequest, UpdateIncidentRequest, IncidentResponse,
-    IncidentListResponse
+    IncidentListResponse, IncidentFilterRequest, IncidentSummaryResponse,
+    ChatMessageResponse, ChatMessageListResponse, IncidentExportFormat,
+    BulkIncidentRequest, BulkIncidentResponse, BulkIncidentOperation
 )
 from service.audittrail import AuditTrailService, UserAction
-from service.audittrail.audittrail_model import CreateAuditTrailRequest
+from service.audittrail.audittrail_model import CreateAuditTrailRequest, BulkCreateAuditTrailRequest
 from service.rbac import has_permission, Permission
+from service.realtime import publish_incident_event, publish_incident_events
 from core.settings import config
 
 
+def _chat_message_dict(message) -> dict:
+    """Chat message row in the shape the chat has always been served in"""
+    return {
+        "incident_id": str(message.incident_id),
+        "timestamp": message.created_at,
+        "useremail": message.useremail,
+        "content": message.content
+    }
+
+
 class IncidentService:
     """Service class for incident operations"""
 
@@ -27,7 +42,7 @@ class IncidentService:
         self.incident_data = IncidentDataAccess(db)
         self.audit_service = AuditTrailService(db)
 
-    async def create_incident(self, request: CreateIncidentRequest, reported_by: str, user_permissions: bytes = None) -> IncidentResponse:
+    async def create_incident(self, request: CreateIncidentRequest, reported_by: str, user_permissions: bytes | int = None) -> IncidentResponse:
         """Create a new incident with validation and audit trail logging"""
         LOGGER.info(f"Processing incident creation for title: {request.title}")
 
@@ -65,8 +80,7 @@ class IncidentService:
 
                 LOGGER.info(f"Incident created successfully with ID: {incident.id}")
 
-                # Return response
-                return IncidentResponse(
+                response = IncidentResponse(
                     id=str(incident.id),  # Convert to string for consistency
                     title=incident.title,
                     description=incident.description,
@@ -77,8 +91,9 @@ class IncidentService:
                     created_by=incident.created_by,
                     updated_on=incident.updated_on,
                     updated_by=incident.updated_by,
-                    chat=incident.chat or [],
-                    is_deleted=incident.is_deleted
+                    chat=[],
+                    is_deleted=incident.is_deleted,
+                    version=incident.version
                 )
 
             except Exception as e:
@@ -87,7 +102,11 @@ class IncidentService:
                     raise
                 raise DatabaseError(f"Incident creation failed: {str(e)}", operation="create_incident")
 
-    async def get_incident(self, incident_id: str, created_by: str, user_permissions: bytes = None) -> IncidentResponse:
+        # committed, so no list request can cache the old total again
+        self.incident_data.invalidate_count_cache(reported_by, request.assigned_to)
+        return response
+
+    async def get_incident(self, incident_id: str, created_by: str, user_permissions: bytes | int = None) -> IncidentResponse:
         """Get a single incident by ID - only if created by the same user"""
         LOGGER.info(f"Processing incident retrieval for ID: {incident_id} by user: {created_by}")
 
@@ -102,6 +121,9 @@ class IncidentService:
                 LOGGER.warning(f"Incident not found: {incident_id} for user: {created_by}")
                 raise NotFoundError("Incident not found", resource="incident")
 
+            # Only the latest chat page, older messages are paged through get_chat
+            chat_page = await self._chat_page(incident.id, config.PAGINATION.CHAT_DEFAULT_LIMIT)
+
             LOGGER.debug(f"Incident retrieved successfully: {incident_id}")
 
             return IncidentResponse(
@@ -115,8 +137,10 @@ class IncidentService:
                 created_by=incident.created_by,
                 updated_on=incident.updated_on,
                 updated_by=incident.updated_by,
-                chat=incident.chat or [],
-                is_deleted=incident.is_deleted
+                chat=[message.model_dump() for message in chat_page.messages],
+                chat_before_cursor=chat_page.before_cursor,
+                is_deleted=incident.is_deleted,
+                version=incident.version
             )
 
         except Exception as e:
@@ -125,9 +149,11 @@ class IncidentService:
                 raise
             raise DatabaseError(f"Incident retrieval failed: {str(e)}", operation="get_incident")
 
-    async def list_incidents(self, created_by: str, limit: int = config.PAGINATION.INCIDENT_DEFAULT_LIMIT, offset: int = 0, user_permissions: bytes = None) -> IncidentListResponse:
-        """List incidents with pagination filtered by created_by"""
-        LOGGER.info(f"Processing incident list request with pagination: limit={limit}, offset={offset} for user: {created_by}")
+    async def list_incidents(self, created_by: str, filters: IncidentFilterRequest = None, user_permissions: bytes | int = None) -> IncidentListResponse:
+        """List incidents filtered by created_by and the requested filters. A cursor takes precedence over offset"""
+        filters = filters or IncidentFilterRequest()
+        limit, offset, cursor = filters.limit, filters.offset, filters.cursor
+        LOGGER.info(f"Processing incident list request with pagination: limit={limit}, offset={offset}, cursor={cursor}, sort={filters.sort} for user: {created_by}")
 
         # Check permission
         if not has_permission(user_permissions, Permission.PermViewIncident):
@@ -135,15 +161,38 @@ class IncidentService:
             raise ValidationError("You do not have permission to view incidents")
 
         try:
-            incidents, total_count = await self.incident_data.list_incidents_paginated(limit, offset, created_by)
+            decoded = decode_cursor(cursor)
+            cursor_values, direction = decoded if decoded else (None, CURSOR_NEXT)
+
+            incidents, total_count, has_more = await self.incident_data.list_incidents_paginated(
+                limit, offset, created_by, filters=filters, cursor_values=cursor_values, direction=direction
+            )
 
             # Calculate total pages
             total_pages = (total_count + limit - 1) // limit
 
+            # Work out which neighbouring pages exist. Paging backwards, has_more refers to
+            # newer rows; paging forwards (or from an offset), it refers to older rows.
+            if direction == CURSOR_PREV:
+                has_prev, has_next = has_more, True
+            else:
+                has_prev, has_next = cursor_values is not None or offset > 0, has_more
+
+            # Cursors carry the sort field values of the boundary rows followed by the id
+            sort_fields = [field for field, _ in filters.sort_spec()]
+            next_cursor = prev_cursor = None
+            if incidents:
+                if has_next:
+                    last = incidents[-1]
+                    next_cursor = encode_cursor([getattr(last, f) for f in sort_fields] + [last.id], CURSOR_NEXT)
+                if has_prev:
+                    first = incidents[0]
+                    prev_cursor = encode_cursor([getattr(first, f) for f in sort_fields] + [first.id], CURSOR_PREV)
+
             # Convert to response models
             incident_responses = []
             for incident in incidents:
-                incident_responses.append(IncidentResponse(
+                incident_responses.append(IncidentSummaryResponse(
                     id=str(incident.id),
                     title=incident.title,
                     description=incident.description,
@@ -154,8 +203,10 @@ class IncidentService:
                     created_by=incident.created_by,
                     updated_on=incident.updated_on,
                     updated_by=incident.updated_by,
-                    chat=incident.chat or [],
-                    is_deleted=incident.is_deleted
+                    is_deleted=incident.is_deleted,
+                    chat_count=incident.chat_count or 0,
+                    last_message_on=incident.last_message_on,
+                    search_snippet=getattr(incident, "snippet", None)
                 ))
 
             LOGGER.debug(f"Incident list retrieved successfully: {len(incident_responses)} incidents for user: {created_by}")
@@ -165,17 +216,21 @@ class IncidentService:
                 total_count=total_count,
                 page=(offset // limit) + 1,  # Calculate page from offset
                 page_size=limit,
-                total_pages=total_pages
+                total_pages=total_pages,
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor
             )
 
         except Exception as e:
             LOGGER.error(f"Incident list retrieval failed: {str(e)}")
-            if isinstance(e, DatabaseError):
+            if isinstance(e, (ValidationError, DatabaseError)):
                 raise
             raise DatabaseError(f"Incident list retrieval failed: {str(e)}", operation="list_incidents")
 
-    async def update_incident(self, incident_id: str, request: UpdateIncidentRequest, updated_by: str, created_by: str, user_permissions: bytes = None) -> IncidentResponse:
-        """Update an existing incident - only if created by the same user"""
+    async def update_incident(self, incident_id: str, request: UpdateIncidentRequest, updated_by: str, created_by: str,
+                              user_permissions: bytes | int = None, expected_versions: List[int] = None) -> IncidentResponse:
+        """Update an existing incident - only if created by the same user.
+        expected_versions (from If-Match) makes the update conditional on the version the client saw."""
         LOGGER.info(f"Processing incident update for ID: {incident_id} by user: {created_by}")
 
         # Check permission
@@ -183,44 +238,38 @@ class IncidentService:
             LOGGER.warning(f"User {created_by} does not have permission to update incidents")
             raise ValidationError("You do not have permission to update incidents")
 
+        # Business logic validation
+        if request.title is not None and not request.title.strip():
+            LOGGER.error("Empty title provided for incident update")
+            raise ValidationError("Title cannot be empty", field="title")
+
+        # Prepare update data (only fields that exist in existing schema)
+        update_data = {}
+        if request.title is not None:
+            update_data['title'] = request.title.strip()
+        if request.description is not None:
+            update_data['description'] = request.description
+        if request.status is not None:
+            update_data['status'] = request.status.value
+        if request.priority is not None:
+            update_data['priority'] = request.priority.value
+        if request.assigned_to is not None:
+            update_data['assigned_to'] = request.assigned_to
+
+        if not update_data:
+            LOGGER.warning("No fields to update for incident")
+            raise ValidationError("No fields provided for update")
+
         async with self.db.begin():  # Start transaction
             try:
-                # Check if incident exists and belongs to the user
-                existing_incident = await self.incident_data.get_incident_by_id(incident_id, created_by)
-                if not existing_incident:
-                    LOGGER.warning(f"Incident not found for update: {incident_id} for user: {created_by}")
-                    raise NotFoundError("Incident not found", resource="incident")
-
-                # Business logic validation
-                if request.title is not None and not request.title.strip():
-                    LOGGER.error("Empty title provided for incident update")
-                    raise ValidationError("Title cannot be empty", field="title")
-
-                # Prepare update data (only fields that exist in existing schema)
-                update_data = {}
-                if request.title is not None:
-                    update_data['title'] = request.title.strip()
-                if request.description is not None:
-                    update_data['description'] = request.description
-                if request.status is not None:
-                    update_data['status'] = request.status.value
-                if request.priority is not None:
-                    update_data['priority'] = request.priority.value
-                if request.assigned_to is not None:
-                    update_data['assigned_to'] = request.assigned_to
-
-                if not update_data:
-                    LOGGER.warning("No fields to update for incident")
-                    raise ValidationError("No fields provided for update")
-
-                # Update incident through data layer
+                # One conditional UPDATE ... RETURNING checks access and version and applies the change
                 updated_incident = await self.incident_data.update_incident(
                     incident_id=incident_id,
                     update_data=update_data,
                     updated_by=updated_by,
-                    emailID=created_by
+                    emailID=created_by,
+                    expected_versions=expected_versions
                 )
-
                 # Create audit trail entry
                 audit_request = CreateAuditTrailRequest(
                     user_action=UserAction.UPDATE_INCIDENT,
@@ -229,9 +278,17 @@ class IncidentService:
                 )
                 await self.audit_service.create_audittrail_entry(audit_request, updated_by)
 
+                # Live viewers get the changed fields once the transaction commits
+                await publish_incident_event(self.db, updated_incident.id, "incident_updated", {
+                    **update_data,
+                    "updated_on": updated_incident.updated_on,
+                    "updated_by": updated_incident.updated_by,
+                    "version": updated_incident.version
+                })
+
                 LOGGER.info(f"Incident updated successfully: {incident_id}")
 
-                return IncidentResponse(
+                response = IncidentResponse(
                     id=str(updated_incident.id),
                     title=updated_incident.title,
                     description=updated_incident.description,
@@ -242,17 +299,22 @@ class IncidentService:
                     created_by=updated_incident.created_by,
                     updated_on=updated_incident.updated_on,
                     updated_by=updated_incident.updated_by,
-                    chat=updated_incident.chat or [],
-                    is_deleted=updated_incident.is_deleted
+                    is_deleted=updated_incident.is_deleted,
+                    version=updated_incident.version
                 )
 
             except Exception as e:
                 LOGGER.error(f"Incident update failed for ID {incident_id}: {str(e)}")
-                if isinstance(e, (ValidationError, NotFoundError, DatabaseError)):
+                if isinstance(e, (ValidationError, NotFoundError, DatabaseError, PreconditionFailedError)):
                     raise
                 raise DatabaseError(f"Incident update failed: {str(e)}", operation="update_incident")
 
-    async def delete_incident(self, incident_id: str, deleted_by: str, created_by: str, user_permissions: bytes = None) -> bool:
+        if 'assigned_to' in update_data:
+            # reassignment moves the incident between two assignees' lists, cleared once committed
+            self.incident_data.invalidate_count_cache(updated_incident.previous_assigned_to, updated_incident.assigned_to)
+        return response
+
+    async def delete_incident(self, incident_id: str, deleted_by: str, created_by: str, user_permissions: bytes | int = None) -> bool:
         """Soft delete an incident - only if created by the same user"""
         LOGGER.info(f"Processing incident deletion for ID: {incident_id} by user: {created_by}")
 
@@ -284,20 +346,107 @@ class IncidentService:
                         email=deleted_by
                     )
                     await self.audit_service.create_audittrail_entry(audit_request, deleted_by)
+                    await publish_incident_event(self.db, existing_incident.id, "incident_deleted")
 
                     LOGGER.info(f"Incident deleted successfully: {incident_id}")
                 else:
                     LOGGER.warning(f"Incident deletion failed: {incident_id}")
 
-                return success
-
             except Exception as e:
                 LOGGER.error(f"Incident deletion failed for ID {incident_id}: {str(e)}")
                 if isinstance(e, (NotFoundError, DatabaseError)):
                     raise
                 raise DatabaseError(f"Incident deletion failed: {str(e)}", operation="delete_incident")
 
-    async def add_chat_message(self, incident_id: str, content: str, user_email: str, created_by: str, user_permissions: bytes = None) -> IncidentResponse:
+        if success:
+            # committed, so no list request can cache the old total again
+            self.incident_data.invalidate_count_cache(created_by, existing_incident.assigned_to)
+        return success
+
+    async def bulk_update_incidents(self, request: BulkIncidentRequest, updated_by: str, user_permissions: bytes | int = None) -> BulkIncidentResponse:
+        """
+        Apply one operation to many incidents with a single set-based UPDATE and one batched
+        audit write. Same scoping as the single incident endpoints: updates apply to incidents
+        the user created or is assigned, deletes only to incidents the user created.
+        """
+        LOGGER.info(f"Processing bulk {request.operation.value} of {len(request.ids)} incidents by user: {updated_by}")
+
+        deleting = request.operation == BulkIncidentOperation.DELETE
+        # Check permission
+        if deleting and not has_permission(user_permissions, Permission.PermDeleteIncident):
+            LOGGER.warning(f"User {updated_by} does not have permission to delete incidents")
+            raise ValidationError("You do not have permission to delete incidents")
+        if not deleting and not has_permission(user_permissions, Permission.PermUpdateIncident):
+            LOGGER.warning(f"User {updated_by} does not have permission to update incidents")
+            raise ValidationError("You do not have permission to update incidents")
+
+        update_data = {}
+        if request.operation == BulkIncidentOperation.SET_STATUS:
+            update_data['status'] = request.status.value
+        elif request.operation == BulkIncidentOperation.SET_PRIORITY:
+            update_data['priority'] = request.priority.value
+        elif request.operation == BulkIncidentOperation.ASSIGN:
+            update_data['assigned_to'] = request.assigned_to
+
+        async with self.db.begin():  # Start transaction
+            try:
+                if deleting:
+                    rows = await self.incident_data.bulk_soft_delete_incidents(request.ids, updated_by, updated_by)
+                    stale_counts = {updated_by, *{row.assigned_to for row in rows}} if rows else set()
+                    audit_action = UserAction.DELETE_INCIDENT
+                    descriptions = [f"Deleted incident {row.id}: {row.title} via bulk operation" for row in rows]
+                    events = [(row.id, "incident_deleted", None) for row in rows]
+                else:
+                    rows = await self.incident_data.bulk_update_incidents(request.ids, update_data, updated_by, updated_by)
+                    stale_counts = set()
+                    if 'assigned_to' in update_data and rows:
+                        # reassignment moves the incidents between assignees' lists
+                        stale_counts = {update_data['assigned_to'], *{row.previous_assigned_to for row in rows}}
+                    audit_action = UserAction.UPDATE_INCIDENT
+                    descriptions = [f"Updated incident {row.id}: {', '.join(update_data.keys())} via bulk operation" for row in rows]
+                    events = [
+                        (row.id, "incident_updated", {
+                            **update_data,
+                            "updated_on": row.updated_on,
+                            "updated_by": updated_by,
+                            "version": row.version
+                        })
+                        for row in rows
+                    ]
+
+                # Create audit trail entries for all affected incidents in one write
+                if rows:
+                    audit_request = BulkCreateAuditTrailRequest(
+                        user_action=audit_action,
+                        email=updated_by,
+                        descriptions=descriptions
+                    )
+                    await self.audit_service.create_audittrail_entries(audit_request, updated_by)
+
+                # Live viewers get the changes once the transaction commits
+                await publish_incident_events(self.db, events)
+
+                updated_ids = {row.id for row in rows}
+                LOGGER.info(f"Bulk {request.operation.value} applied to {len(updated_ids)} of {len(request.ids)} incidents")
+
+                response = BulkIncidentResponse(
+                    operation=request.operation,
+                    updated_count=len(updated_ids),
+                    updated_ids=[str(incident_id) for incident_id in request.ids if incident_id in updated_ids],
+                    skipped_ids=[str(incident_id) for incident_id in request.ids if incident_id not in updated_ids]
+                )
+
+            except Exception as e:
+                LOGGER.error(f"Bulk {request.operation.value} failed: {str(e)}")
+                if isinstance(e, (ValidationError, DatabaseError)):
+                    raise
+                raise DatabaseError(f"Bulk incident operation failed: {str(e)}", operation="bulk_update_incidents")
+
+        # committed, so no list request can cache the old totals again
+        self.incident_data.invalidate_count_cache(*stale_counts)
+        return response
+
+    async def add_chat_message(self, incident_id: str, content: str, user_email: str, created_by: str, user_permissions: bytes | int = None) -> ChatMessageResponse:
         """Add a message to the incident's chat"""
         LOGGER.info(f"Processing chat message addition for incident ID: {incident_id} by user: {user_email}")
 
@@ -309,12 +458,15 @@ class IncidentService:
         async with self.db.begin():  # Start transaction
             try:
                 # Add message through data layer
-                incident = await self.incident_data.add_chat_message(
+                message = await self.incident_data.add_chat_message(
                     incident_id=incident_id,
                     user_email=user_email,
                     content=content,
                     emailID=created_by
                 )
+                if not message:
+                    LOGGER.warning(f"Incident not found for chat message: {incident_id} for user: {created_by}")
+                    raise NotFoundError("Incident", incident_id)
 
                 # Create audit trail entry
                 audit_request = CreateAuditTrailRequest(
@@ -324,33 +476,24 @@ class IncidentService:
                 )
                 await self.audit_service.create_audittrail_entry(audit_request, user_email)
 
+                response = ChatMessageResponse(id=str(message.id), **_chat_message_dict(message))
+                await publish_incident_event(self.db, message.incident_id, "chat_message", response.model_dump(mode="json"))
+
                 LOGGER.info(f"Chat message added successfully to incident: {incident_id}")
 
                 # Return response
-                return IncidentResponse(
-                    id=str(incident.id),
-                    title=incident.title,
-                    description=incident.description,
-                    status=incident.status,
-                    priority=incident.priority,
-                    assigned_to=incident.assigned_to,
-                    created_on=incident.created_on,
-                    created_by=incident.created_by,
-                    updated_on=incident.updated_on,
-                    updated_by=incident.updated_by,
-                    chat=incident.chat or [],
-                    is_deleted=incident.is_deleted
-                )
+                return response
 
             except Exception as e:
                 LOGGER.error(f"Chat message addition failed for incident {incident_id}: {str(e)}")
-                if isinstance(e, (ValidationError, DatabaseError)):
+                if isinstance(e, (ValidationError, NotFoundError, DatabaseError)):
                     raise
                 raise DatabaseError(f"Chat message addition failed: {str(e)}", operation="add_chat_message")
 
-    async def get_chat(self, incident_id: str, created_by: str, user_permissions: bytes = None) -> List[dict]:
-        """Get the chat for an incident in time series order"""
-        LOGGER.info(f"Processing chat retrieval for incident ID: {incident_id} by user: {created_by}")
+    async def get_chat(self, incident_id: str, created_by: str, user_permissions: bytes | int = None,
+                       before: str = None, limit: int = config.PAGINATION.CHAT_DEFAULT_LIMIT) -> ChatMessageListResponse:
+        """Get a page of the incident's chat, latest first by page and in time series order within it"""
+        LOGGER.info(f"Processing chat retrieval for incident ID: {incident_id} by user: {created_by}, before={before}, limit={limit}")
 
         # Check permission
         if not has_permission(user_permissions, Permission.PermViewIncident):
@@ -358,26 +501,50 @@ class IncidentService:
             raise ValidationError("You do not have permission to view incidents")
 
         try:
+            decoded = decode_cursor(before)
+            before_values = decoded[0] if decoded else None
+            if before_values is not None and len(before_values) != 2:
+                raise ValidationError("Invalid pagination cursor", field="before")
+
             incident = await self.incident_data.get_incident_by_id(incident_id, created_by)
             if not incident:
                 LOGGER.warning(f"Incident not found: {incident_id} for user: {created_by}")
                 raise NotFoundError("Incident not found", resource="incident")
 
-            chat = incident.chat or []
-            # Sort by timestamp to ensure time series order
-            chat_sorted = sorted(chat, key=lambda x: x.get('timestamp', ''))
+            page = await self._chat_page(incident.id, limit, before_values)
 
             LOGGER.debug(f"Chat retrieved successfully for incident: {incident_id}")
-            return chat_sorted
+            return page
 
         except Exception as e:
             LOGGER.error(f"Chat retrieval failed for incident {incident_id}: {str(e)}")
-            if isinstance(e, (NotFoundError, DatabaseError)):
+            if isinstance(e, (ValidationError, NotFoundError, DatabaseError)):
                 raise
             raise DatabaseError(f"Chat retrieval failed: {str(e)}", operation="get_chat")
 
-    async def bulk_upload_incidents(self, file_content: bytes, filename: str, uploaded_by: str, user_permissions: bytes = None) -> dict:
-        """Bulk upload incidents from CSV/Excel file with all-or-nothing transaction"""
+    async def _chat_page(self, incident_id: int, limit: int, before_values: list = None) -> ChatMessageListResponse:
+        """Load one chat page and the cursor for the page before it"""
+        messages, has_more = await self.incident_data.list_chat_messages(incident_id, limit, before_values)
+        before_cursor = None
+        if has_more and messages:
+            before_cursor = encode_cursor([messages[0].created_at, messages[0].id])
+        return ChatMessageListResponse(
+            messages=[ChatMessageResponse(id=str(message.id), **_chat_message_dict(message)) for message in messages],
+            has_more=has_more,
+            before_cursor=before_cursor
+        )
+
+    async def bulk_upload_incidents(self, file: BinaryIO, filename: str, uploaded_by: str, user_permissions: bytes = None,
+                                    on_progress: Optional[Callable[[int, int, int, List[str]], None]] = None) -> dict:
+        """
+        Bulk upload incidents from a CSV/Excel file with an all-or-nothing transaction.
+        The file is streamed in batches of UPLOAD_BATCH_ROWS rows, each batch is validated
+        and inserted before the next one is read. After the first invalid row nothing more
+        is inserted, the rest of the file is only validated so every error is reported,
+        and the transaction is rolled back.
+        on_progress, when given, is called after every batch with
+        (rows processed, incidents inserted, error count, errors so far).
+        """
         LOGGER.info(f"Processing bulk upload of incidents from file: {filename} by user: {uploaded_by}")
 
         # Check permission
@@ -385,154 +552,130 @@ class IncidentService:
             LOGGER.warning(f"User {uploaded_by} does not have permission to create incidents")
             raise ValidationError("You do not have permission to create incidents")
 
-        try:
-            # Read file content
-            if filename.endswith('.csv'):
-                df = pd.read_csv(io.BytesIO(file_content))
-            elif filename.endswith(('.xlsx', '.xls')):
-                df = pd.read_excel(io.BytesIO(file_content))
-            else:
-                raise ValidationError("Unsupported file format. Only CSV and Excel files are supported.")
-
-            # Validate file size
-            if len(file_content) > config.INCIDENT.UPLOAD_MAX_SIZE_MB * 1024 * 1024:
-                raise ValidationError(f"File size exceeds maximum limit of {config.INCIDENT.UPLOAD_MAX_SIZE_MB}MB")
-
-            # Validate columns (case-insensitive matching)
-            required_fields = set(field.lower() for field in config.INCIDENT.FIELDS)
-            file_fields = set(df.columns.str.strip().str.lower())
-
-            if not required_fields.issubset(file_fields):
-                missing_fields = required_fields - file_fields
-                raise ValidationError(f"Missing required fields: {', '.join(missing_fields)}")
-
-            # Create mapping from lowercase to original column names
-            column_mapping = {col.lower(): col for col in df.columns}
-
-            # Validate all data first (no defaults, throw errors for missing required fields)
-            valid_incidents = []
-            errors = []
+        max_errors = config.INCIDENT.UPLOAD_MAX_ERRORS
+        errors = []
+        error_count = 0
+        uploaded_count = 0
+        rows_processed = 0
+        column_mapping = None
+        stale_counts = {uploaded_by}
+        # canonical spelling of each option, looked up by lowercase value
+        status_map = canonical_options(config.INCIDENT.STATUS_OPTIONS)
+        priority_map = canonical_options(config.INCIDENT.PRIORITY_OPTIONS)
 
-            for index, row in df.iterrows():
-                try:
-                    # Skip empty rows
-                    if row.isnull().all() or str(row.iloc[0]).strip() == '':
-                        continue
-
-                    # Get column references
-                    title_col = column_mapping.get('title')
-                    description_col = column_mapping.get('description')
-                    status_col = column_mapping.get('status')
-                    priority_col = column_mapping.get('priority')
-                    assigned_to_col = column_mapping.get('assigned_to')
-
-                    # Validate required fields exist
-                    if not title_col:
-                        errors.append(f"Row {index + 2}: Title column is missing")
-                        continue
-                    if not status_col:
-                        errors.append(f"Row {index + 2}: Status column is missing")
-                        continue
-                    if not priority_col:
-                        errors.append(f"Row {index + 2}: Priority column is missing")
-                        continue
-                    if not assigned_to_col:
-                        errors.append(f"Row {index + 2}: Assigned to column is missing")
-                        continue
-
-                    # Extract and validate data
-                    title = str(row.get(title_col, '')).strip()
-                    if not title:
-                        errors.append(f"Row {index + 2}: Title cannot be empty")
-                        continue
-
-                    description = None
-                    status_raw = str(row.get(status_col, '')).strip()
-                    priority_raw = str(row.get(priority_col, '')).strip()
-                    assigned_to = str(row.get(assigned_to_col, '')).strip()
-                    if description_col:
-                        value = row.get(description_col, None)
-                        if pd.notna(value):
-                            description = str(value)
-                    if not status_raw:
-                        errors.append(f"Row {index + 2}: Status cannot be empty")
-                        continue
-                    if not priority_raw:
-                        errors.append(f"Row {index + 2}: Priority cannot be empty")
-                        continue
-                    if not assigned_to:
-                        errors.append(f"Row {index + 2}: Assigned to cannot be empty")
-                        continue
-
-                    # Case-insensitive validation for status and priority
-                    status_options_lower = {opt.lower() for opt in config.INCIDENT.STATUS_OPTIONS}
-                    priority_options_lower = {opt.lower() for opt in config.INCIDENT.PRIORITY_OPTIONS}
-
-                    if status_raw.lower() not in status_options_lower:
-                        errors.append(f"Row {index + 2}: Invalid status '{status_raw}'. Must be one of: {', '.join(config.INCIDENT.STATUS_OPTIONS)}")
-                        continue
-
-                    if priority_raw.lower() not in priority_options_lower:
-                        errors.append(f"Row {index + 2}: Invalid priority '{priority_raw}'. Must be one of: {', '.join(config.INCIDENT.PRIORITY_OPTIONS)}")
+        try:
+            async with self.db.begin():
+                async for batch in iter_upload_batches(file, filename, config.INCIDENT.UPLOAD_MAX_SIZE_MB, config.INCIDENT.UPLOAD_BATCH_ROWS):
+                    if column_mapping is None:
+                        column_mapping = self._upload_column_mapping(batch.columns)
+                    rows_processed += len(batch)
+
+                    valid_incidents, batch_errors = validate_upload_batch(batch, column_mapping, status_map, priority_map)
+                    if batch_errors:
+                        error_count += len(batch_errors)
+                        errors.extend(batch_errors[:max(max_errors - len(errors), 0)])
+                    if error_count or not valid_incidents:
+                        if on_progress:
+                            on_progress(rows_processed, uploaded_count, error_count, errors)
                         continue
 
-                    # Map to correct case
-                    status = next(opt for opt in config.INCIDENT.STATUS_OPTIONS if opt.lower() == status_raw.lower())
-                    priority = next(opt for opt in config.INCIDENT.PRIORITY_OPTIONS if opt.lower() == priority_raw.lower())
-
-                    # Validate using pydantic model
-                    create_request = CreateIncidentRequest(
-                        title=title,
-                        description=description,
-                        status=status,
-                        priority=priority,
-                        assigned_to=assigned_to
-                    )
+                    try:
+                        created_incidents = await self.incident_data.bulk_create_incidents(valid_incidents, uploaded_by)
 
-                    valid_incidents.append({
-                        'title': title,
-                        'description': description,
-                        'status': status,
-                        'priority': priority,
-                        'assigned_to': assigned_to
-                    })
-
-                except Exception as e:
-                    errors.append(f"Row {index + 2}: {str(e)}")
-                    continue
-
-            # If there are any errors, fail the entire upload
-            if errors:
-                raise ValidationError(f"Bulk upload failed due to validation errors:\n" + "\n".join(errors))
-
-            # All validation passed, proceed with bulk insert in a single transaction
-            async with self.db.begin():
-                try:
-                    # Bulk create all incidents
-                    created_incidents = await self.incident_data.bulk_create_incidents(valid_incidents, uploaded_by)
-
-                    # Create audit trails for all incidents
-                    for incident in created_incidents:
-                        audit_request = CreateAuditTrailRequest(
+                        # Create audit trails for all incidents in one write
+                        audit_request = BulkCreateAuditTrailRequest(
                             user_action=UserAction.CREATE_INCIDENT,
-                            description=f"Created incident: {incident.title} (ID: {incident.id}) via bulk upload",
-                            email=uploaded_by
+                            email=uploaded_by,
+                            descriptions=[
+                                f"Created incident: {incident.title} (ID: {incident.id}) via bulk upload"
+                                for incident in created_incidents
+                            ]
                         )
-                        await self.audit_service.create_audittrail_entry(audit_request, uploaded_by)
+                        await self.audit_service.create_audittrail_entries(audit_request, uploaded_by)
+                    except Exception as e:
+                        LOGGER.error(f"Bulk insert failed: {str(e)}")
+                        raise DatabaseError(f"Bulk insert failed: {str(e)}", operation="bulk_upload_incidents")
+
+                    uploaded_count += len(created_incidents)
+                    stale_counts.update(incident.assigned_to for incident in created_incidents)
+                    LOGGER.debug(f"Bulk upload batch inserted: {len(created_incidents)} incidents, {uploaded_count} so far")
+                    if on_progress:
+                        on_progress(rows_processed, uploaded_count, error_count, errors)
+
+                # If there are any errors, fail the entire upload (raising rolls the transaction back)
+                if error_count:
+                    if error_count > len(errors):
+                        errors.append(f"... and {error_count - len(errors)} more errors")
+                    raise ValidationError(f"Bulk upload failed due to validation errors:\n" + "\n".join(errors))
+
+            # committed, so no list request can cache the old totals again
+            self.incident_data.invalidate_count_cache(*stale_counts)
+            LOGGER.info(f"Bulk upload successful: {uploaded_count} incidents created")
+
+            return {
+                "uploaded_count": uploaded_count,
+                "errors": []
+            }
 
-                    LOGGER.info(f"Bulk upload successful: {len(created_incidents)} incidents created")
+        except Exception as e:
+            LOGGER.error(f"Bulk upload failed: {str(e)}")
+            if isinstance(e, (ValidationError, DatabaseError)):
+                raise
+            raise DatabaseError(f"Bulk upload failed: {str(e)}", operation="bulk_upload_incidents")
+
+    def _upload_column_mapping(self, columns) -> dict:
+        """Check the header has every required field and map lowercase names to the file's columns"""
+        # Validate columns (case-insensitive matching)
+        required_fields = set(field.lower() for field in config.INCIDENT.FIELDS)
+        column_mapping = {str(col).strip().lower(): col for col in columns}
+
+        if not required_fields.issubset(column_mapping.keys()):
+            missing_fields = required_fields - column_mapping.keys()
+            raise ValidationError(f"Missing required fields: {', '.join(missing_fields)}")
+        return column_mapping
+
+    async def export_incidents(self, created_by: str, filters: IncidentFilterRequest = None, user_permissions: bytes | int = None,
+                               export_format: IncidentExportFormat = IncidentExportFormat.CSV) -> AsyncIterator[bytes]:
+        """Stream the incidents the list shows for these filters as CSV or NDJSON chunks"""
+        if not has_permission(user_permissions, Permission.PermViewIncident):
+            LOGGER.warning(f"User {created_by} does not have permission to view incidents")
+            raise ValidationError("You do not have permission to view incidents")
+        if export_format not in (IncidentExportFormat.CSV, IncidentExportFormat.NDJSON):
+            raise ValidationError(f"{export_format.value} exports are built as files, not streamed")
+        LOGGER.info(f"Processing incident export request: format={export_format.value} for user: {created_by}")
+
+        columns = export_columns()
+        exported = 0
+        if export_format == IncidentExportFormat.CSV:
+            yield csv_header(columns)
+        async for batch in self.incident_data.stream_incidents(created_by, filters, columns, config.INCIDENT.EXPORT_BATCH_ROWS):
+            if export_format == IncidentExportFormat.CSV:
+                yield encode_csv(batch)
+            else:
+                yield encode_ndjson(batch, columns)
+            exported += len(batch)
 
-                    return {
-                        "uploaded_count": len(created_incidents),
-                        "errors": []
-                    }
+        LOGGER.info(f"Incident export completed: {exported} incidents for user: {created_by}")
 
-                except Exception as e:
-                    LOGGER.error(f"Bulk insert failed: {str(e)}")
-                    raise DatabaseError(f"Bulk insert failed: {str(e)}", operation="bulk_upload_incidents")
+    async def build_incident_export(self, created_by: str, filters: IncidentFilterRequest = None, user_permissions: bytes | int = None,
+                                    export_format: IncidentExportFormat = IncidentExportFormat.XLSX) -> str:
+        """Build an XLSX or Parquet export in the worker process pool. Returns the temp file path, removed by the caller"""
+        if not has_permission(user_permissions, Permission.PermViewIncident):
+            LOGGER.warning(f"User {created_by} does not have permission to view incidents")
+            raise ValidationError("You do not have permission to view incidents")
+        if export_format not in (IncidentExportFormat.XLSX, IncidentExportFormat.PARQUET):
+            raise ValidationError(f"{export_format.value} exports are streamed, not built as files")
+        LOGGER.info(f"Processing incident export request: format={export_format.value} for user: {created_by}")
+
+        try:
+            columns = export_columns()
+            batches = self.incident_data.stream_incidents(created_by, filters, columns, config.INCIDENT.EXPORT_BATCH_ROWS)
+            path = await build_export_file(batches, columns, export_format.value)
+            LOGGER.info(f"Incident export file built: {path} for user: {created_by}")
+            return path
 
         except Exception as e:
-            LOGGER.error(f"Bulk upload failed: {str(e)}")
-            if isinstance(e, ValidationError):
+            LOGGER.error(f"Incident export failed: {str(e)}")
+            if isinstance(e, (ValidationError, DatabaseError)):
                 raise
-            raise DatabaseError(f"Bulk upload failed: {str(e)}", operation="bulk_upload_incidents")
\ No newline at end of file
+            raise DatabaseError(f"Incident export failed: {str(e)}", operation="build_incident_export")
@@ -4,7 +4,7 @@ Contains request/response models for incident operations.
 Supports both JSON and Form data parsing.
 """
 
-from pydantic import BaseModel, Field,field_validator
+from pydantic import BaseModel, Field,field_validator, model_validator
 from fastapi import Form
 from typing import Optional, List
 from datetime import datetime
@@ -27,6 +27,13 @@ class IncidentPriority(str, Enum):
     MEDIUM = "Medium"
     HIGH = "High"
 
+class IncidentExportFormat(str, Enum):
+    """Incident export formats, CSV and NDJSON stream while XLSX and Parquet are built first"""
+    CSV = "csv"
+    NDJSON = "ndjson"
+    XLSX = "xlsx"
+    PARQUET = "parquet"
+
 class CreateIncidentRequest(BaseModel):
     """Request model for creating a new incident - supports both JSON and Form data"""
     title: str = Field(..., min_length=1, max_length=200)  # VARCHAR(200)
@@ -93,6 +100,54 @@ class UpdateIncidentRequest(BaseModel):
         )
 
 
+class BulkIncidentOperation(str, Enum):
+    """Operations POST /incidents/bulk applies to every listed incident"""
+    SET_STATUS = "set_status"
+    SET_PRIORITY = "set_priority"
+    ASSIGN = "assign"
+    DELETE = "delete"
+
+
+class BulkIncidentRequest(BaseModel):
+    """Request model for applying one operation to many incidents"""
+    ids: List[int] = Field(..., min_length=1, max_length=config.INCIDENT.BULK_MAX_IDS)
+    operation: BulkIncidentOperation
+    status: Optional[IncidentStatus] = None  # set_status
+    priority: Optional[IncidentPriority] = None  # set_priority
+    assigned_to: Optional[str] = Field(None, min_length=1)  # assign
+
+    @field_validator("ids")
+    def unique_ids(cls, v: List[int]) -> List[int]:
+        return list(dict.fromkeys(v))
+
+    @field_validator("assigned_to")
+    def blank_to_none(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None:
+            v = v.strip()
+            if not v:
+                return None
+        return v
+
+    @model_validator(mode="after")
+    def operation_value(self):
+        required = {
+            BulkIncidentOperation.SET_STATUS: ("status", self.status),
+            BulkIncidentOperation.SET_PRIORITY: ("priority", self.priority),
+            BulkIncidentOperation.ASSIGN: ("assigned_to", self.assigned_to),
+        }.get(self.operation)
+        if required is not None and required[1] is None:
+            raise ValueError(f"{self.operation.value} requires {required[0]}")
+        return self
+
+
+class BulkIncidentResponse(BaseModel):
+    """Response model for a bulk operation"""
+    operation: BulkIncidentOperation
+    updated_count: int
+    updated_ids: List[str]
+    skipped_ids: List[str] = Field(default_factory=list)  # not found, deleted or not accessible to the user
+
+
 class IncidentResponse(BaseModel):
     """Response model for incident data"""
     id: str
@@ -105,26 +160,110 @@ class IncidentResponse(BaseModel):
     created_by: str
     updated_on: datetime
     updated_by: str
-    chat: List[dict] = Field(default_factory=list)
+    chat: List[dict] = Field(default_factory=list)  # latest chat page, only loaded when fetching a single incident
+    chat_before_cursor: Optional[str] = None  # pass to GET /incidents/{id}/chat?before= for older messages
     is_deleted: bool
+    version: int = 1  # also sent as the ETag, send it back in If-Match when updating
+
+
+class IncidentSummaryResponse(BaseModel):
+    """Response model for an incident row in list views - carries chat metadata instead of the chat"""
+    id: str
+    title: str
+    description: Optional[str]
+    status: IncidentStatus
+    priority: IncidentPriority
+    assigned_to: str
+    created_on: datetime
+    created_by: str
+    updated_on: datetime
+    updated_by: str
+    is_deleted: bool
+    chat_count: int = 0
+    last_message_on: Optional[datetime] = None
+    search_snippet: Optional[str] = None  # highlighted match, only set for q= searches
 
 
 class IncidentListResponse(BaseModel):
     """Response model for incident list with pagination"""
-    incidents: List[IncidentResponse]
+    incidents: List[IncidentSummaryResponse]
     total_count: int
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None  # opaque keyset cursor for the following (older) page
+    prev_cursor: Optional[str] = None  # opaque keyset cursor for the preceding (newer) page
+
+
+# Columns the incident list can be sorted on, rank is only available with a text search
+INCIDENT_SORT_FIELDS = ("created_on", "updated_on", "title", "status", "priority", "rank")
 
 
 class IncidentFilterRequest(BaseModel):
-    """Request model for filtering incidents"""
+    """Request model for filtering, sorting and paginating incidents"""
     status: Optional[IncidentStatus] = None
     priority: Optional[IncidentPriority] = None
-    search: Optional[str] = None  # Search in title and description
+    q: Optional[str] = Field(None, max_length=200)  # Ranked full text search in title and description
+    search: Optional[str] = Field(None, max_length=200)  # Older alias of q
+    assigned_to: Optional[str] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    # comma separated sort fields, "-" prefix for descending e.g. "-priority,created_on"
+    # defaults to best match first with q, newest first otherwise
+    sort: Optional[str] = None
     limit: int = Field(config.PAGINATION.INCIDENT_DEFAULT_LIMIT, ge=1, le=config.PAGINATION.MAX_LIMIT)
     offset: int = Field(0, ge=0)
+    cursor: Optional[str] = None
+
+    @field_validator("q", "search", "assigned_to")
+    def blank_to_none(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None:
+            v = v.strip()
+            if not v:
+                return None
+        return v
+
+    @field_validator("sort")
+    def validate_sort(cls, v: Optional[str]) -> Optional[str]:
+        if v is None:
+            return None
+        fields = [part.strip() for part in v.split(",") if part.strip()]
+        if not fields:
+            return None
+        names = [field.lstrip("-") for field in fields]
+        for name in names:
+            if name not in INCIDENT_SORT_FIELDS:
+                raise ValueError(f"Invalid sort field '{name}'. Must be one of: {', '.join(INCIDENT_SORT_FIELDS)}")
+        if len(set(names)) != len(names):
+            raise ValueError("Sort fields must not repeat")
+        return ",".join(fields)
+
+    @field_validator("created_to")
+    def validate_date_range(cls, v: Optional[datetime], values) -> Optional[datetime]:
+        if v is not None and values.data.get("created_from") is not None:
+            if v < values.data["created_from"]:
+                raise ValueError("created_to must be after created_from")
+        return v
+
+    @model_validator(mode="after")
+    def resolve_search(self):
+        if self.q is None and self.search is not None:
+            self.q = self.search
+        if self.q is None and self.sort is not None and "rank" in self.sort.replace("-", "").split(","):
+            raise ValueError("Sorting by rank requires a search query (q)")
+        return self
+
+    def has_filters(self) -> bool:
+        """Whether any filter narrows the user's incidents (sort and paging do not)"""
+        return any(value is not None for value in (
+            self.status, self.priority, self.q, self.assigned_to, self.created_from, self.created_to
+        ))
+
+    def sort_spec(self) -> List[tuple[str, bool]]:
+        """Parsed sort as (field, descending) pairs"""
+        if self.sort is None:
+            return [("rank", True)] if self.q is not None else [("created_on", True)]
+        return [(field.lstrip("-"), field.startswith("-")) for field in self.sort.split(",")]
 
 
 class AddChatMessageRequest(BaseModel):
@@ -132,6 +271,22 @@ class AddChatMessageRequest(BaseModel):
     content: str = Field(..., min_length=1, max_length=1000)  # Message content
 
 
+class ChatMessageResponse(BaseModel):
+    """Response model for a single chat message"""
+    id: str
+    incident_id: str
+    timestamp: datetime
+    useremail: str
+    content: str
+
+
+class ChatMessageListResponse(BaseModel):
+    """Response model for a page of chat messages in time series order"""
+    messages: List[ChatMessageResponse]
+    has_more: bool
+    before_cursor: Optional[str] = None  # cursor for the next older page, None when at the start
+
+
 class IncidentConfigResponse(BaseModel):
     """Response model for incident configuration"""
     fields: List[str]
@@ -0,0 +1,23 @@
+import pytest
+from pydantic import ValidationError
+from service.incident.model import BulkIncidentRequest, BulkIncidentOperation
+
+class TestBulkIncidentRequest:
+    def test_ids_are_deduplicated_in_order(self):
+        """Test repeated ids are applied once and the order is kept for the response"""
+        request = BulkIncidentRequest(ids=[3, 1, 3, 2, 1], operation="delete")
+        assert request.ids == [3, 1, 2]
+        assert request.operation == BulkIncidentOperation.DELETE
+
+    def test_operation_requires_its_value(self):
+        """Test each update operation must carry the value it sets"""
+        with pytest.raises(ValidationError):
+            BulkIncidentRequest(ids=[1], operation="set_status")
+        with pytest.raises(ValidationError):
+            BulkIncidentRequest(ids=[1], operation="assign", assigned_to="   ")
+        assert BulkIncidentRequest(ids=[1], operation="set_priority", priority="High").priority.value == "High"
+
+    def test_ids_are_required(self):
+        """Test an empty id list is rejected"""
+        with pytest.raises(ValidationError):
+            BulkIncidentRequest(ids=[], operation="delete")
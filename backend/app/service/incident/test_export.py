@@ -0,0 +1,68 @@
+import os
+import asyncio
+import openpyxl
+import pyarrow.parquet as pq
+from datetime import datetime
+from service.incident.export import export_columns, build_export_file, csv_to_xlsx, csv_to_parquet
+from service.incident.upload import excel_to_csv, shutdown_excel_pool
+
+ROWS = [
+    ("Disk full", "node-1, /var", "Open", "High", "a@b.io", 1, datetime(2025, 1, 2, 3, 4, 5), "a@b.io", datetime(2025, 1, 2, 3, 4, 5), "a@b.io"),
+    ("Login slow", "", "Resolved", "Low", "c@d.io", 2, datetime(2025, 1, 3), "c@d.io", datetime(2025, 1, 4), "c@d.io"),
+]
+
+async def _batches():
+    yield ROWS[:1]
+    yield ROWS[1:]
+
+class TestIncidentExport:
+    def test_upload_fields_come_first(self):
+        """Test exports lead with the upload fields so they can be uploaded again"""
+        columns = export_columns()
+        assert columns[:5] == ["title", "description", "status", "priority", "assigned_to"]
+        assert columns[5:] == ["id", "created_on", "created_by", "updated_on", "updated_by"]
+
+    def test_xlsx_round_trips_through_upload_conversion(self, tmp_path):
+        """Test an XLSX export converts back into the CSV the upload reads"""
+        src, dst, back = tmp_path / "export.csv", tmp_path / "export.xlsx", tmp_path / "back.csv"
+        src.write_text("title,created_on\nDisk full,2025-01-02T03:04:05\nLogin slow,\n")
+        assert csv_to_xlsx(str(src), str(dst), ["created_on"]) == 2
+        assert excel_to_csv(str(dst), str(back)) == 2
+        assert back.read_text().splitlines() == ["title,created_on", "Disk full,2025-01-02 03:04:05", "Login slow,"]
+
+    def test_xlsx_file_is_built_in_the_process_pool(self):
+        """Test batches are spooled and converted, with the temp CSV removed"""
+        try:
+            path = asyncio.run(build_export_file(_batches(), export_columns(), "xlsx"))
+        finally:
+            shutdown_excel_pool()
+        try:
+            rows = list(openpyxl.load_workbook(path, read_only=True).worksheets[0].iter_rows(values_only=True))
+            assert len(rows) == 3
+            assert rows[1][0] == "Disk full" and rows[1][6] == datetime(2025, 1, 2, 3, 4, 5)
+        finally:
+            os.remove(path)
+
+    def test_parquet_keeps_column_types(self, tmp_path):
+        """Test Parquet exports carry integer ids and timestamps"""
+        src, dst = tmp_path / "export.csv", tmp_path / "export.parquet"
+        src.write_text("id,title,created_on\n1,Disk full,2025-01-02T03:04:05\n")
+        assert csv_to_parquet(str(src), str(dst), ["created_on"]) == 1
+        table = pq.read_table(str(dst))
+        assert table.column("id").to_pylist() == [1]
+        assert table.column("created_on").to_pylist() == [datetime(2025, 1, 2, 3, 4, 5)]
+
+    def test_parquet_types_do_not_depend_on_the_first_block(self, tmp_path):
+        """Test a first block of empty descriptions and numeric titles still converts later text"""
+        src, dst = tmp_path / "export.csv", tmp_path / "export.parquet"
+        with open(src, "w") as f:
+            f.write("id,title,description,created_on\n")
+            for i in range(60000):
+                f.write(f"{i},{i},,2025-01-02T03:04:05\n")
+            f.write("60000,Disk full,has text,\n")
+        assert csv_to_parquet(str(src), str(dst), ["created_on"]) == 60001
+        table = pq.read_table(str(dst))
+        assert table.column("title").to_pylist()[-1] == "Disk full"
+        assert table.column("description").to_pylist()[-1] == "has text"
+        assert table.column("description").to_pylist()[0] == ""
+        assert table.column("created_on").to_pylist()[-1] is None
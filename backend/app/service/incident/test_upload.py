@@ -0,0 +1,100 @@
+import io
+import asyncio
+import pytest
+import openpyxl
+import pandas as pd
+from service.incident.upload import iter_upload_batches, validate_upload_batch, canonical_options, excel_to_csv, shutdown_excel_pool
+from core.exceptions import ValidationError
+
+def _collect(data: bytes, filename: str = "incidents.csv", max_size_mb: float = 1, batch_rows: int = 2):
+    async def run():
+        return [batch async for batch in iter_upload_batches(io.BytesIO(data), filename, max_size_mb, batch_rows)]
+    return asyncio.run(run())
+
+class TestUploadBatches:
+    def test_csv_is_read_in_batches_with_continuous_row_index(self):
+        """Test batches are bounded and index + 2 stays the file row number"""
+        rows = "".join(f"title {i},Open\n" for i in range(5))
+        batches = _collect(("title,status\n" + rows).encode())
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert list(batches[2].index) == [4]
+        assert batches[2].iloc[0]["title"] == "title 4"
+
+    def test_values_are_read_as_text(self):
+        """Test blank cells are empty strings and numbers are not converted"""
+        batches = _collect(b"title,description\n007,\n")
+        assert batches[0].iloc[0]["title"] == "007"
+        assert batches[0].iloc[0]["description"] == ""
+
+    def test_size_limit_is_enforced_while_reading(self):
+        """Test oversized files fail without being parsed to the end"""
+        data = b"title\n" + b"x" * 200 + b"\n"
+        with pytest.raises(ValidationError):
+            _collect(data, max_size_mb=100 / (1024 * 1024))
+
+    def test_excel_is_streamed_through_the_csv_pipeline(self, tmp_path):
+        """Test workbooks are converted in the process pool and batched like CSV"""
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["title", "status"])
+        for i in range(3):
+            sheet.append([f"title {i}", "Open"])
+        path = tmp_path / "incidents.xlsx"
+        workbook.save(path)
+        try:
+            batches = _collect(path.read_bytes(), filename="incidents.xlsx")
+        finally:
+            shutdown_excel_pool()
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert batches[1].iloc[0]["title"] == "title 2"
+
+    def test_unsupported_format(self):
+        """Test only CSV and Excel files are accepted"""
+        with pytest.raises(ValidationError):
+            _collect(b"title\n", filename="incidents.txt")
+
+
+class TestValidateUploadBatch:
+    status_map = canonical_options(["Open", "In Progress", "Resolved"])
+    priority_map = canonical_options(["Low", "Medium", "High"])
+    column_mapping = {"title": "Title", "description": "Description", "status": "Status", "priority": "Priority", "assigned_to": "Assigned_To"}
+
+    def _validate(self, rows):
+        df = pd.DataFrame(rows, columns=["Title", "Description", "Status", "Priority", "Assigned_To"])
+        return validate_upload_batch(df, self.column_mapping, self.status_map, self.priority_map)
+
+    def test_valid_rows_use_canonical_case(self):
+        """Test values are stripped and options mapped to their configured spelling"""
+        valid, errors = self._validate([[" Disk full ", "", " in progress", "HIGH", "a@b.io "]])
+        assert errors == []
+        assert valid == [{"title": "Disk full", "description": None, "status": "In Progress", "priority": "High", "assigned_to": "a@b.io"}]
+
+    def test_errors_keep_row_numbers_and_first_problem(self):
+        """Test each invalid row reports its first problem with the file row number"""
+        valid, errors = self._validate([
+            ["ok", "", "Open", "Low", "a@b.io"],
+            ["", "", "", "", ""],
+            ["no status", "", "", "Low", "a@b.io"],
+            ["bad", "", "Closed", "Urgent", "a@b.io"],
+            ["x" * 201, "", "Open", "Low", "a@b.io"],
+        ])
+        assert len(valid) == 1
+        assert errors == [
+            "Row 4: Status cannot be empty",
+            "Row 5: Invalid status 'Closed'. Must be one of: Open, In Progress, Resolved",
+            "Row 6: Title cannot be longer than 200 characters",
+        ]
+
+
+class TestExcelToCsv:
+    def test_rows_are_written_as_text_to_header_width(self, tmp_path):
+        """Test empty cells become blanks and cells past the header are dropped"""
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["title", "priority", None])
+        sheet.append(["disk full", None, "stray"])
+        sheet.append([42, "High"])
+        src, dst = tmp_path / "in.xlsx", tmp_path / "out.csv"
+        workbook.save(src)
+        assert excel_to_csv(str(src), str(dst)) == 2
+        assert dst.read_text().splitlines() == ["title,priority", "disk full,", "42,High"]
@@ -0,0 +1,242 @@
+"""
+Streaming readers for incident bulk upload files.
+Uploads are read in bounded chunks and yielded as DataFrames of at most
+batch_rows rows, so memory stays flat however large the file is. The size
+limit is enforced while reading instead of after the whole file is parsed.
+"""
+
+import io
+import os
+import csv
+import asyncio
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, BinaryIO, Optional
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from core import ValidationError, config
+
+READ_CHUNK_BYTES = 1024 * 1024
+TITLE_MAX_LENGTH = 200  # incident.title is VARCHAR(200)
+
+
+class SizeLimitedReader(io.RawIOBase):
+    """Read-only binary stream that fails as soon as more than max_bytes are read"""
+
+    def __init__(self, raw: BinaryIO, max_bytes: int, max_size_mb: float):
+        self.raw = raw
+        self.max_bytes = max_bytes
+        self.max_size_mb = max_size_mb
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.raw.read(min(len(buffer), READ_CHUNK_BYTES))
+        self.bytes_read += len(data)
+        if self.bytes_read > self.max_bytes:
+            raise ValidationError(f"File size exceeds maximum limit of {self.max_size_mb}MB")
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _limited(file: BinaryIO, max_size_mb: float) -> io.BufferedReader:
+    return io.BufferedReader(SizeLimitedReader(file, int(max_size_mb * 1024 * 1024), max_size_mb), READ_CHUNK_BYTES)
+
+
+def save_upload(file: BinaryIO, path: str, max_size_mb: float) -> int:
+    """Copy an upload to path enforcing the size limit while copying. Returns the bytes written"""
+    reader = _limited(file, max_size_mb)
+    written = 0
+    try:
+        with open(path, 'wb') as out:
+            while True:
+                chunk = reader.read(READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                out.write(chunk)
+                written += len(chunk)
+    except Exception:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    return written
+
+
+def excel_to_csv(src_path: str, dst_path: str) -> int:
+    """
+    Convert the first sheet of a workbook to CSV, returning the rows written. Runs in
+    the Excel process pool. .xlsx is streamed row by row with openpyxl read-only mode
+    so memory stays constant; legacy .xls has no streaming reader and goes through pandas.
+    """
+    if src_path.lower().endswith('.xls'):
+        df = pd.read_excel(src_path, dtype=str)
+        df.to_csv(dst_path, index=False)
+        return len(df)
+
+    workbook = openpyxl.load_workbook(src_path, read_only=True, data_only=True)
+    rows_written = 0
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            raise ValidationError("Uploaded workbook is empty")
+        # read-only sheets can report trailing empty cells, the header decides the width
+        width = max((i + 1 for i, value in enumerate(header) if value is not None), default=0)
+        with open(dst_path, 'w', newline='', encoding='utf-8') as out:
+            writer = csv.writer(out)
+            writer.writerow(['' if value is None else str(value) for value in header[:width]])
+            for row in rows:
+                values = ['' if value is None else str(value) for value in row[:width]]
+                values.extend([''] * (width - len(values)))
+                writer.writerow(values)
+                rows_written += 1
+    finally:
+        workbook.close()
+    return rows_written
+
+
+_excel_pool: Optional[ProcessPoolExecutor] = None
+
+
+def excel_executor() -> ProcessPoolExecutor:
+    global _excel_pool
+    if _excel_pool is None:
+        # spawn, forking a process with a running event loop and open connections is unsafe
+        _excel_pool = ProcessPoolExecutor(
+            max_workers=config.INCIDENT.EXCEL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _excel_pool
+
+
+def shutdown_excel_pool() -> None:
+    global _excel_pool
+    if _excel_pool is not None:
+        _excel_pool.shutdown(wait=False, cancel_futures=True)
+        _excel_pool = None
+
+
+async def _iter_csv_batches(stream: BinaryIO, batch_rows: int) -> AsyncIterator[pd.DataFrame]:
+    # every column as text, validation decides what is acceptable
+    reader = await asyncio.to_thread(pd.read_csv, stream, chunksize=batch_rows, dtype=str, keep_default_na=False)
+    try:
+        while True:
+            chunk = await asyncio.to_thread(next, reader, None)
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        reader.close()
+
+
+async def iter_upload_batches(file: BinaryIO, filename: str, max_size_mb: float, batch_rows: int) -> AsyncIterator[pd.DataFrame]:
+    """
+    Yield the upload as DataFrames of at most batch_rows rows. Row index values
+    continue across batches, so index + 2 is always the spreadsheet row number.
+    CSV parsing runs in a worker thread to keep the event loop free. Excel files
+    are converted to CSV in the Excel process pool first and then read the same way.
+    """
+    name = filename.lower()
+    if name.endswith('.csv'):
+        async for batch in _iter_csv_batches(_limited(file, max_size_mb), batch_rows):
+            yield batch
+    elif name.endswith(('.xlsx', '.xls')):
+        temp_paths = []
+        try:
+            # a file already on disk (queued upload jobs) is converted in place
+            src_path = getattr(file, 'name', None)
+            if isinstance(src_path, str) and os.path.isfile(src_path):
+                if os.path.getsize(src_path) > max_size_mb * 1024 * 1024:
+                    raise ValidationError(f"File size exceeds maximum limit of {max_size_mb}MB")
+            else:
+                src_path = _temp_path(os.path.splitext(name)[1], temp_paths)
+                await asyncio.to_thread(save_upload, file, src_path, max_size_mb)
+
+            csv_path = _temp_path('.csv', temp_paths)
+            await asyncio.get_running_loop().run_in_executor(excel_executor(), excel_to_csv, src_path, csv_path)
+
+            with open(csv_path, 'rb') as csv_file:
+                async for batch in _iter_csv_batches(csv_file, batch_rows):
+                    yield batch
+        finally:
+            for path in temp_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+    else:
+        raise ValidationError("Unsupported file format. Only CSV and Excel files are supported.")
+
+
+def _temp_path(suffix: str, temp_paths: list[str]) -> str:
+    fd, path = tempfile.mkstemp(suffix=suffix, prefix="incident_upload_")
+    os.close(fd)
+    temp_paths.append(path)
+    return path
+
+
+def canonical_options(options: list[str]) -> dict[str, str]:
+    """Map lowercase option values to their configured spelling"""
+    return {option.lower(): option for option in options}
+
+
+def _text(df: pd.DataFrame, column) -> pd.Series:
+    # short rows leave NaN even when reading as text
+    return df[column].fillna('').astype(str)
+
+
+def validate_upload_batch(df: pd.DataFrame, column_mapping: dict, status_map: dict[str, str],
+                          priority_map: dict[str, str]) -> tuple[list[dict], list[str]]:
+    """
+    Validate one batch of upload rows column by column, returning (valid incidents, errors).
+    Rows whose first column is blank are skipped. Each invalid row reports only its first
+    problem, as "Row {index + 2}: ..." so the number matches the spreadsheet row.
+    """
+    title = _text(df, column_mapping['title']).str.strip()
+    status_raw = _text(df, column_mapping['status']).str.strip()
+    priority_raw = _text(df, column_mapping['priority']).str.strip()
+    assigned_to = _text(df, column_mapping['assigned_to']).str.strip()
+    description_col = column_mapping.get('description')
+    if description_col is not None:
+        description = _text(df, description_col)
+    else:
+        description = pd.Series('', index=df.index)
+
+    skip = _text(df, df.columns[0]).str.strip() == ''
+    status = status_raw.str.lower().map(status_map)
+    priority = priority_raw.str.lower().map(priority_map)
+
+    # np.select takes the first matching condition, so the order is the order checks are reported in
+    checks = [
+        (title == '', "Title cannot be empty"),
+        (title.str.len() > TITLE_MAX_LENGTH, f"Title cannot be longer than {TITLE_MAX_LENGTH} characters"),
+        (status_raw == '', "Status cannot be empty"),
+        (priority_raw == '', "Priority cannot be empty"),
+        (assigned_to == '', "Assigned to cannot be empty"),
+        (status.isna(), "Invalid status '" + status_raw + f"'. Must be one of: {', '.join(status_map.values())}"),
+        (priority.isna(), "Invalid priority '" + priority_raw + f"'. Must be one of: {', '.join(priority_map.values())}"),
+    ]
+    messages = np.select(
+        [condition.to_numpy() for condition, _ in checks],
+        [np.broadcast_to(np.asarray(message, dtype=object), len(df)) for _, message in checks],
+        default=None
+    )
+    invalid = (~skip & pd.Series(messages, index=df.index).notna()).to_numpy()
+    valid = (~skip).to_numpy() & ~invalid
+
+    row_numbers = (df.index[invalid] + 2).astype(str)
+    errors = [f"Row {row}: {message}" for row, message in zip(row_numbers, messages[invalid])]
+
+    # plain lists are much faster to turn into dicts than DataFrame.to_dict
+    valid_incidents = [
+        {'title': t, 'description': d or None, 'status': s, 'priority': p, 'assigned_to': a}
+        for t, d, s, p, a in zip(
+            title[valid].tolist(), description[valid].tolist(), status[valid].tolist(),
+            priority[valid].tolist(), assigned_to[valid].tolist()
+        )
+    ]
+    return valid_incidents, errors
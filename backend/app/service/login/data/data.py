@@ -4,13 +4,14 @@ Handles all database operations for user management with proper logging.
 """
 
 import uuid
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, delete, func
 from core import LOGGER, DatabaseError
 
 # Simplified import for Makefile compatibility
 from service.db.models.user_model import User
-from service.auth.auth import AuthService
+from service.db.models.refresh_token_model import RefreshToken
 
 
 class UserDataAccess:
@@ -18,18 +19,14 @@ class UserDataAccess:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.auth_service = AuthService()
 
-    async def create_user(self, email: str, password: str, role_name: str, role_permission: bytes) -> User:
-        """Create a new user in the database"""
+    async def create_user(self, email: str, hashed_password: str, role_name: str, role_permission: bytes) -> User:
+        """Create a new user in the database, the password must already be hashed"""
         try:
             # Generate a unique ID for the user
             user_id = str(uuid.uuid4())
             LOGGER.debug(f"Creating user with ID: {user_id}, email: {email}")
 
-            # Hash the password before saving
-            hashed_password = self.auth_service.hash_password(password)
-
             # Create user instance
             user = User(
                 id=user_id,
@@ -74,22 +71,130 @@ class UserDataAccess:
             LOGGER.error(f"Failed to query user by email {email}: {str(e)}")
             raise DatabaseError(f"Failed to query user: {str(e)}", operation="get_user_by_email")
 
+    async def update_password(self, user_id: str, hashed_password: str) -> None:
+        """Replace a user's password hash, used to move old hashes to the current work factor"""
+        try:
+            await self.db.execute(
+                update(User).where(User.id == user_id).values(password=hashed_password)
+            )
+            await self.db.commit()
+            LOGGER.debug(f"Password hash updated for user: {user_id}")
+
+        except Exception as e:
+            LOGGER.error(f"Failed to update password hash for user {user_id}: {str(e)}")
+            await self.db.rollback()
+            raise DatabaseError(f"Failed to update password: {str(e)}", operation="update_password")
+
     async def get_user_by_id(self, user_id: str) -> User | None:
         """Get user by ID"""
         try:
-            self.logger.debug(f"Querying user by ID: {user_id}")
+            LOGGER.debug(f"Querying user by ID: {user_id}")
             result = await self.db.execute(
                 select(User).where(User.id == user_id)
             )
             user = result.scalar_one_or_none()
 
             if user:
-                self.logger.debug(f"User found: {user_id}")
+                LOGGER.debug(f"User found: {user_id}")
             else:
-                self.logger.debug(f"No user found with ID: {user_id}")
+                LOGGER.debug(f"No user found with ID: {user_id}")
 
             return user
 
         except Exception as e:
-            self.logger.error(f"Failed to query user by ID {user_id}: {str(e)}")
-            raise DatabaseError(f"Failed to query user: {str(e)}", operation="get_user_by_id")
\ No newline at end of file
+            LOGGER.error(f"Failed to query user by ID {user_id}: {str(e)}")
+            raise DatabaseError(f"Failed to query user: {str(e)}", operation="get_user_by_id")
+
+
+class RefreshTokenDataAccess:
+    """Data access class for refresh tokens, every method takes the sha256 of the token"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_token(self, user_id: str, token_hash: str, expires_at: datetime, family_id: str = None) -> RefreshToken:
+        """Store a new token, a new family when family_id is None. Expired tokens of the user are dropped on the way"""
+        try:
+            await self.db.execute(
+                delete(RefreshToken).where(RefreshToken.user_id == user_id, RefreshToken.expires_at < func.now())
+            )
+            token = RefreshToken(
+                id=str(uuid.uuid4()),
+                user_id=user_id,
+                family_id=family_id or str(uuid.uuid4()),
+                token_hash=token_hash,
+                expires_at=expires_at
+            )
+            self.db.add(token)
+            await self.db.commit()
+
+            LOGGER.debug(f"Refresh token issued for user: {user_id}, family: {token.family_id}")
+            return token
+
+        except Exception as e:
+            LOGGER.error(f"Failed to create refresh token for user {user_id}: {str(e)}")
+            await self.db.rollback()
+            raise DatabaseError(f"Failed to create refresh token: {str(e)}", operation="create_refresh_token")
+
+    async def rotate_token(self, token_hash: str, new_token_hash: str, expires_at: datetime) -> RefreshToken | None:
+        """
+        Revoke a live token and store its successor in the same family, in one transaction.
+        The conditional UPDATE makes a token single use even under concurrent refreshes.
+        Returns None when the token is unknown, expired or already revoked.
+        """
+        try:
+            result = await self.db.execute(
+                update(RefreshToken)
+                .where(
+                    RefreshToken.token_hash == token_hash,
+                    RefreshToken.revoked_on.is_(None),
+                    RefreshToken.expires_at > func.now()
+                )
+                .values(revoked_on=func.now())
+                .returning(RefreshToken.user_id, RefreshToken.family_id)
+            )
+            row = result.first()
+            if row is None:
+                await self.db.rollback()
+                return None
+
+            token = RefreshToken(
+                id=str(uuid.uuid4()),
+                user_id=row.user_id,
+                family_id=row.family_id,
+                token_hash=new_token_hash,
+                expires_at=expires_at
+            )
+            self.db.add(token)
+            await self.db.commit()
+            return token
+
+        except Exception as e:
+            LOGGER.error(f"Failed to rotate refresh token: {str(e)}")
+            await self.db.rollback()
+            raise DatabaseError(f"Failed to rotate refresh token: {str(e)}", operation="rotate_refresh_token")
+
+    async def get_token(self, token_hash: str) -> RefreshToken | None:
+        try:
+            result = await self.db.execute(select(RefreshToken).where(RefreshToken.token_hash == token_hash))
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            LOGGER.error(f"Failed to query refresh token: {str(e)}")
+            raise DatabaseError(f"Failed to query refresh token: {str(e)}", operation="get_refresh_token")
+
+    async def revoke_family(self, family_id: str) -> int:
+        """Revoke every live token of a family, returns how many were revoked"""
+        try:
+            result = await self.db.execute(
+                update(RefreshToken)
+                .where(RefreshToken.family_id == family_id, RefreshToken.revoked_on.is_(None))
+                .values(revoked_on=func.now())
+            )
+            await self.db.commit()
+            return result.rowcount
+
+        except Exception as e:
+            LOGGER.error(f"Failed to revoke refresh token family {family_id}: {str(e)}")
+            await self.db.rollback()
+            raise DatabaseError(f"Failed to revoke refresh tokens: {str(e)}", operation="revoke_refresh_family")
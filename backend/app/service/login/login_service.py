@@ -3,11 +3,12 @@ Login service layer.
 Contains business logic for authentication operations with proper logging and error handling.
 """
 
+from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from core import LOGGER, ValidationError, ConflictError, NotFoundError, DatabaseError
-from .data.data import UserDataAccess
+from core import LOGGER, ValidationError, ConflictError, NotFoundError, DatabaseError, ServiceUnavailableError, AuthenticationError, config
+from .data.data import UserDataAccess, RefreshTokenDataAccess
 from .model import RegisterRequest, RegisterResponse, LoginRequest, LoginResponse
-from service.auth.auth import AuthService
+from service.auth.auth import auth_service
 from service.rbac import get_role_permissions, roles
 
 
@@ -17,7 +18,8 @@ class LoginService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.user_data = UserDataAccess(db)
-        self.auth_service = AuthService()
+        self.refresh_tokens = RefreshTokenDataAccess(db)
+        self.auth_service = auth_service
 
     async def register_user(self, request: RegisterRequest) -> RegisterResponse:
         """Register a new user with validation"""
@@ -43,25 +45,30 @@ class LoginService:
                 LOGGER.warning(f"Attempted registration with existing email: {request.email}")
                 raise ConflictError("Email already registered", resource="user")
 
+            # Hash the password before saving, in the bcrypt pool so the event loop stays free
+            hashed_password = await self.auth_service.hash_password(request.password)
+
             # Create user through data layer
-            user = await self.user_data.create_user(request.email, request.password, request.role_name, role_permission)
+            user = await self.user_data.create_user(request.email, hashed_password, request.role_name, role_permission)
             LOGGER.info(f"User registered successfully with ID: {user.id}")
 
             # Generate JWT token
             token = self.auth_service.generate_jwt(user.id, user.email, user.role)
             LOGGER.debug(f"JWT token generated for user: {user.id}")
+            refresh_token = await self._issue_refresh_token(user.id)
 
             # Return response with token
             return RegisterResponse(
                 message="User registered successfully",
                 user_id=user.id,
                 email=user.email,
-                token=token
+                token=token,
+                refresh_token=refresh_token
             )
 
         except Exception as e:
             LOGGER.error(f"Registration failed for email {request.email}: {str(e)}")
-            if isinstance(e, (ValidationError, ConflictError)):
+            if isinstance(e, (ValidationError, ConflictError, ServiceUnavailableError)):
                 raise
             raise DatabaseError(f"Registration failed: {str(e)}", operation="user_registration")
 
@@ -77,24 +84,107 @@ class LoginService:
                 raise NotFoundError("User not found", "user")
 
             # Verify the password hash
-            if not self.auth_service.verify_password(request.password, user.password):
+            if not await self.auth_service.verify_password(request.password, user.password):
                 LOGGER.error(f"Invalid password attempt for email: {request.email}")
                 raise ValidationError("Invalid email or password")
 
+            if self.auth_service.needs_rehash(user.password):
+                await self._rehash_password(user.id, request.password)
+
              # Generate JWT token
             token = self.auth_service.generate_jwt(user.id, user.email, user.role)
             LOGGER.debug(f"JWT token generated for user: {user.id}")
+            refresh_token = await self._issue_refresh_token(user.id)
 
             LOGGER.info(f"Login successful for user ID: {user.id}")
             return LoginResponse(
                 message="Login successful",
                 user_id=user.id,
                 email=user.email,
-                token=token
+                token=token,
+                refresh_token=refresh_token
             )
 
         except Exception as e:
             LOGGER.error(f"Login failed for email {request.email}: {str(e)}")
-            if isinstance(e, (NotFoundError, ValidationError)):
+            if isinstance(e, (NotFoundError, ValidationError, ServiceUnavailableError)):
+                raise
+            raise DatabaseError(f"Login failed: {str(e)}", operation="user_login")
+
+    async def refresh_session(self, refresh_token: str) -> LoginResponse:
+        """
+        Exchange a refresh token for a new access JWT and the next refresh token.
+        No password check, so no bcrypt, just a couple of indexed queries.
+        """
+        if not refresh_token:
+            raise AuthenticationError("Refresh token required")
+
+        try:
+            token_hash = self.auth_service.hash_refresh_token(refresh_token)
+            new_refresh_token, new_token_hash = self.auth_service.generate_refresh_token()
+            rotated = await self.refresh_tokens.rotate_token(
+                token_hash, new_token_hash, self.auth_service.refresh_token_expiry()
+            )
+            if rotated is None:
+                await self._check_refresh_reuse(token_hash)
+                raise AuthenticationError("Invalid or expired refresh token")
+
+            # the user is read again, so a changed role applies from the next refresh on
+            user = await self.user_data.get_user_by_id(rotated.user_id)
+            if not user or user.is_deleted:
+                await self.refresh_tokens.revoke_family(rotated.family_id)
+                raise AuthenticationError("Invalid or expired refresh token")
+
+            token = self.auth_service.generate_jwt(user.id, user.email, user.role)
+            LOGGER.debug(f"Session refreshed for user ID: {user.id}")
+            return LoginResponse(
+                message="Session refreshed",
+                user_id=user.id,
+                email=user.email,
+                token=token,
+                refresh_token=new_refresh_token
+            )
+
+        except Exception as e:
+            LOGGER.error(f"Session refresh failed: {str(e)}")
+            if isinstance(e, AuthenticationError):
                 raise
-            raise DatabaseError(f"Login failed: {str(e)}", operation="user_login")
\ No newline at end of file
+            raise DatabaseError(f"Session refresh failed: {str(e)}", operation="refresh_session")
+
+    async def logout_user(self, refresh_token: str) -> None:
+        """Revoke the session behind a refresh token, a no-op without one"""
+        if not refresh_token:
+            return
+        token = await self.refresh_tokens.get_token(self.auth_service.hash_refresh_token(refresh_token))
+        if token:
+            await self.refresh_tokens.revoke_family(token.family_id)
+            LOGGER.info(f"Refresh tokens revoked on logout for user ID: {token.user_id}")
+
+    async def _issue_refresh_token(self, user_id: str) -> str:
+        refresh_token, token_hash = self.auth_service.generate_refresh_token()
+        await self.refresh_tokens.create_token(user_id, token_hash, self.auth_service.refresh_token_expiry())
+        return refresh_token
+
+    async def _check_refresh_reuse(self, token_hash: str) -> None:
+        """
+        A token that was already rotated away coming back means someone else holds a copy,
+        so its whole family is revoked. Shortly after rotation it is most likely a second tab
+        that raced the first one, so within the grace period it is only rejected.
+        """
+        token = await self.refresh_tokens.get_token(token_hash)
+        if token is None or token.revoked_on is None:
+            return
+        if (datetime.now(timezone.utc) - token.revoked_on).total_seconds() <= config.AUTH.REFRESH_REUSE_GRACE_SECONDS:
+            return
+        revoked = await self.refresh_tokens.revoke_family(token.family_id)
+        if revoked:
+            LOGGER.warning(f"Refresh token reuse detected for user ID {token.user_id}, revoked {revoked} tokens")
+
+    async def _rehash_password(self, user_id: str, password: str) -> None:
+        """Move a verified password to the configured work factor. Best effort, never fails the login"""
+        try:
+            hashed_password = await self.auth_service.hash_password(password)
+            await self.user_data.update_password(user_id, hashed_password)
+            LOGGER.info(f"Password rehashed to the current work factor for user ID: {user_id}")
+        except Exception as e:
+            LOGGER.warning(f"Password rehash skipped for user ID {user_id}: {str(e)}")
\ No newline at end of file
@@ -39,6 +39,7 @@ class RegisterResponse(BaseModel):
     user_id: str
     email: EmailStr
     token: str # jwt
+    refresh_token: Optional[str] = None
 
 
 class LoginRequest(BaseModel):
@@ -60,8 +61,9 @@ class LoginRequest(BaseModel):
 
 
 class LoginResponse(BaseModel):
-    """Response model for user login"""
+    """Response model for user login and session refresh"""
     message: str
     user_id: str
     email: EmailStr
-    token: str
\ No newline at end of file
+    token: str
+    refresh_token: Optional[str] = None
\ No newline at end of file
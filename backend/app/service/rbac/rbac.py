@@ -1,12 +1,12 @@
 from .master_permission import Permission,role_permissions
 
-def has_permission(user_permissions: bytes, required_permission: Permission) -> bool:
+def has_permission(user_permissions: bytes | int, required_permission: Permission) -> bool:
     """
     Check if user has the required permission.
     Returns True if has permission, False otherwise.
-    Input: user_permissions (bytes from DB/JWT), required_permission (Permission enum, e.g., Permission.PermUpdateIncident)
+    Input: user_permissions (bytes from DB/JWT, or the already parsed int), required_permission (Permission enum, e.g., Permission.PermUpdateIncident)
     """
-    perm_int = bytes_to_permissions(user_permissions)
+    perm_int = user_permissions if isinstance(user_permissions, int) else bytes_to_permissions(user_permissions)
     if perm_int == 0:  # Has all permissions
         return True
     perm_mask = 1 << required_permission.value
@@ -61,4 +61,10 @@ class TestRBAC:
     def test_invalid_role(self):
         """Test invalid role returns empty permissions"""
         result = get_role_permissions("InvalidRole")
-        assert result == b'\x00'  # No permissions
\ No newline at end of file
+        assert result == b'\x00'  # No permissions
+    def test_has_permission_accepts_parsed_int(self):
+        """Test the parsed permission integer gives the same answers as the bytes"""
+        for role in ("Admin", "User"):
+            perms = get_role_permissions(role)
+            for perm in (Permission.PermViewIncident, Permission.PermDeleteIncident):
+                assert has_permission(bytes_to_permissions(perms), perm) == has_permission(perms, perm)
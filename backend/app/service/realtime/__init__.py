@@ -0,0 +1,9 @@
+"""
+Realtime service package.
+Live incident events (chat messages, updates, deletes) for streaming clients.
+"""
+
+from .hub import EventHub, Subscription
+from .events import hub, publish_incident_event, publish_incident_events, start_realtime, stop_realtime
+
+__all__ = ["EventHub", "Subscription", "hub", "publish_incident_event", "publish_incident_events", "start_realtime", "stop_realtime"]
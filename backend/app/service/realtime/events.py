@@ -0,0 +1,87 @@
+"""
+Publishing and lifecycle for live incident events.
+Events are small JSON objects: {"type", "incident_id", "data"}.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, func, text, event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core import LOGGER, config
+from .hub import EventHub
+from .pg_listener import PostgresListener
+
+# NOTIFY payloads must stay under 8000 bytes, larger events go out without data
+# and clients refetch the incident instead
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+
+hub = EventHub(queue_size=config.REALTIME.QUEUE_SIZE)
+_listener: Optional[PostgresListener] = None
+
+
+async def start_realtime() -> None:
+    """Start the cross-worker listener when LISTEN/NOTIFY delivery is enabled"""
+    global _listener
+    if not config.REALTIME.ENABLED or not config.REALTIME.USE_PG_NOTIFY:
+        LOGGER.info("Realtime cross-worker delivery disabled, events are delivered in-process only")
+        return
+
+    # imported here so the hub stays usable without a configured database
+    from service.db import engine
+    dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    _listener = PostgresListener(dsn, config.REALTIME.CHANNEL, hub)
+    _listener.start()
+
+
+async def stop_realtime() -> None:
+    global _listener
+    if _listener is not None:
+        await _listener.stop()
+        _listener = None
+
+
+def _event_payload(incident_id: int, event_type: str, data: Optional[Dict[str, Any]]) -> str:
+    event = {"type": event_type, "incident_id": int(incident_id), "data": data}
+    payload = json.dumps(event, default=str)
+    if len(payload.encode("utf-8")) > MAX_NOTIFY_PAYLOAD_BYTES:
+        event["data"] = None
+        payload = json.dumps(event, default=str)
+    return payload
+
+
+async def publish_incident_event(db: AsyncSession, incident_id: int, event_type: str, data: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Publish an incident event once the current transaction commits.
+    With LISTEN/NOTIFY the NOTIFY is part of the transaction itself, otherwise the
+    event is handed to the local hub from an after_commit hook. Rolled back changes
+    never produce events either way.
+    """
+    await publish_incident_events(db, [(incident_id, event_type, data)])
+
+
+async def publish_incident_events(db: AsyncSession, events: List[Tuple[int, str, Optional[Dict[str, Any]]]]) -> None:
+    """Publish many (incident_id, event_type, data) events like publish_incident_event, in one statement"""
+    if not config.REALTIME.ENABLED or not events:
+        return
+
+    payloads = [_event_payload(incident_id, event_type, data) for incident_id, event_type, data in events]
+
+    if config.REALTIME.USE_PG_NOTIFY:
+        if len(payloads) == 1:
+            await db.execute(select(func.pg_notify(config.REALTIME.CHANNEL, payloads[0])))
+        else:
+            await db.execute(
+                text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+                {"channel": config.REALTIME.CHANNEL, "payloads": payloads}
+            )
+        return
+
+    local_events = [json.loads(payload) for payload in payloads]
+
+    def _after_commit(session):
+        for local_event in local_events:
+            hub.publish_local(local_event["incident_id"], local_event)
+
+    sa_event.listen(db.sync_session, "after_commit", _after_commit, once=True)
@@ -0,0 +1,65 @@
+"""
+In-process pub/sub hub for live incident events.
+Each subscriber gets a bounded queue. Publishing never waits on a subscriber:
+when a queue is full the subscriber is marked lagged and dropped, and its
+stream tells the client to resync instead of buffering without limit.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, Optional, Set
+
+from core import LOGGER
+
+
+class Subscription:
+    """A single live consumer of one incident's events"""
+
+    def __init__(self, incident_id: int, queue_size: int):
+        self.incident_id = incident_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.lagged = False
+
+    async def next_event(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Wait for the next event, None when nothing arrived within timeout"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventHub:
+    """Fan out incident events to the subscribers of that incident in this process"""
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, incident_id: int) -> Subscription:
+        subscription = Subscription(incident_id, self.queue_size)
+        self._subscribers[incident_id].add(subscription)
+        LOGGER.debug(f"Realtime subscriber added for incident {incident_id}")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.incident_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.incident_id]
+        LOGGER.debug(f"Realtime subscriber removed for incident {subscription.incident_id}")
+
+    def publish_local(self, incident_id: int, event: Dict[str, Any]) -> None:
+        """Deliver an event to this process' subscribers. Must run on the event loop thread"""
+        for subscription in list(self._subscribers.get(incident_id, ())):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # slow consumer: stop feeding it, the stream sends a lagged event and closes
+                LOGGER.warning(f"Realtime subscriber for incident {incident_id} lagged, dropping it")
+                subscription.lagged = True
+                self.unsubscribe(subscription)
+
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
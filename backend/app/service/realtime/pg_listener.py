@@ -0,0 +1,76 @@
+"""
+Cross-worker delivery of incident events through Postgres LISTEN/NOTIFY.
+Services NOTIFY inside their transaction, so an event is only delivered once the
+change is committed. Every worker keeps one dedicated LISTEN connection and hands
+what it receives to its local hub.
+"""
+
+import json
+import asyncio
+from typing import Optional
+
+import asyncpg
+
+from core import LOGGER
+from .hub import EventHub
+
+
+class PostgresListener:
+    """Keeps a LISTEN connection open and republishes notifications to the hub"""
+
+    def __init__(self, dsn: str, channel: str, hub: EventHub, reconnect_seconds: float = 5.0):
+        self.dsn = dsn
+        self.channel = channel
+        self.hub = hub
+        self.reconnect_seconds = reconnect_seconds
+        self._connection: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close()
+
+    async def _close(self) -> None:
+        if self._connection is not None and not self._connection.is_closed():
+            try:
+                await self._connection.close()
+            except Exception as e:
+                LOGGER.debug(f"Error closing realtime listen connection: {str(e)}")
+        self._connection = None
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+            self.hub.publish_local(int(event["incident_id"]), event)
+        except Exception as e:
+            LOGGER.error(f"Invalid realtime notification payload: {str(e)}")
+
+    async def _run(self) -> None:
+        # reconnect forever, a dropped connection only pauses live updates
+        while not self._stopping:
+            try:
+                self._connection = await asyncpg.connect(self.dsn)
+                await self._connection.add_listener(self.channel, self._on_notification)
+                LOGGER.info(f"Realtime listener subscribed to channel: {self.channel}")
+                while not self._connection.is_closed():
+                    await asyncio.sleep(self.reconnect_seconds)
+                LOGGER.warning("Realtime listen connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                LOGGER.error(f"Realtime listener failed: {str(e)}")
+            await self._close()
+            await asyncio.sleep(self.reconnect_seconds)
@@ -0,0 +1,30 @@
+from .hub import EventHub
+
+class TestEventHub:
+    def test_publish_reaches_incident_subscribers_only(self):
+        """Test events are delivered to subscribers of the same incident"""
+        hub = EventHub(queue_size=10)
+        watching = hub.subscribe(1)
+        other = hub.subscribe(2)
+        hub.publish_local(1, {"type": "chat_message", "incident_id": 1})
+        assert watching.queue.qsize() == 1
+        assert other.queue.qsize() == 0
+
+    def test_slow_subscriber_is_marked_lagged_and_dropped(self):
+        """Test a full queue drops the subscriber instead of blocking the publisher"""
+        hub = EventHub(queue_size=2)
+        slow = hub.subscribe(1)
+        for _ in range(3):
+            hub.publish_local(1, {"type": "incident_updated", "incident_id": 1})
+        assert slow.lagged
+        assert hub.subscriber_count() == 0
+
+    def test_unsubscribe(self):
+        """Test unsubscribed consumers stop receiving events"""
+        hub = EventHub()
+        subscription = hub.subscribe(1)
+        hub.unsubscribe(subscription)
+        hub.unsubscribe(subscription)
+        hub.publish_local(1, {"type": "incident_deleted", "incident_id": 1})
+        assert subscription.queue.qsize() == 0
+        assert hub.subscriber_count() == 0
@@ -0,0 +1,10 @@
+"""
+Upload job service package.
+Background processing of large incident bulk uploads with progress reporting.
+"""
+
+from .uploadjob_service import UploadJobService
+from .uploadjob_model import UploadJobStatus, UploadJobResponse
+from .worker import start_upload_workers, stop_upload_workers
+
+__all__ = ["UploadJobService", "UploadJobStatus", "UploadJobResponse", "start_upload_workers", "stop_upload_workers"]
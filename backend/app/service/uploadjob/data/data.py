@@ -0,0 +1,201 @@
+"""
+Data access layer for upload job service.
+Handles the incident_upload_job queue table: enqueue, claim, progress and completion.
+"""
+
+import uuid
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, and_, or_
+from core import LOGGER, DatabaseError
+from service.db.models.upload_job_model import UploadJob
+from service.uploadjob.uploadjob_model import UploadJobStatus
+
+
+def _stale_before(stale_seconds: int):
+    # running jobs whose heartbeat is older than this belong to a dead worker
+    return func.now() - func.make_interval(0, 0, 0, 0, 0, 0, stale_seconds)
+
+
+class UploadJobDataAccess:
+    """Data access class for upload job operations"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_job(self, filename: str, file_path: str, uploaded_by: str, user_permissions: bytes = None, job_id: str = None) -> UploadJob:
+        """Add a queued upload job to the session"""
+        try:
+            job = UploadJob(
+                id=job_id or str(uuid.uuid4()),
+                filename=filename,
+                file_path=file_path,
+                status=UploadJobStatus.QUEUED.value,
+                uploaded_by=uploaded_by,
+                user_permissions=user_permissions,
+                rows_processed=0,
+                uploaded_count=0,
+                error_count=0,
+                errors=[],
+                attempts=0
+            )
+            self.db.add(job)
+            await self.db.flush()
+            await self.db.refresh(job)
+
+            LOGGER.info(f"Upload job queued with ID: {job.id}")
+            return job
+
+        except Exception as e:
+            LOGGER.error(f"Failed to create upload job for {filename}: {str(e)}")
+            raise DatabaseError(f"Failed to create upload job: {str(e)}", operation="create_job")
+
+    async def get_job(self, job_id: str, uploaded_by: str) -> UploadJob | None:
+        """Get an upload job, only if it was uploaded by the same user"""
+        try:
+            result = await self.db.execute(
+                select(UploadJob).where(and_(UploadJob.id == job_id, UploadJob.uploaded_by == uploaded_by))
+            )
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            LOGGER.error(f"Failed to get upload job {job_id}: {str(e)}")
+            raise DatabaseError(f"Failed to get upload job: {str(e)}", operation="get_job")
+
+    async def fail_abandoned_jobs(self, stale_seconds: int, max_attempts: int) -> list[UploadJob]:
+        """Fail running jobs whose worker died and that have used up their attempts"""
+        try:
+            result = await self.db.execute(
+                update(UploadJob)
+                .where(and_(
+                    UploadJob.status == UploadJobStatus.RUNNING.value,
+                    UploadJob.heartbeat_at < _stale_before(stale_seconds),
+                    UploadJob.attempts >= max_attempts
+                ))
+                .values(
+                    status=UploadJobStatus.FAILED.value,
+                    error_message=f"Upload job abandoned after {max_attempts} attempts",
+                    worker_id=None,
+                    finished_on=func.now()
+                )
+                .returning(UploadJob)
+            )
+            return list(result.scalars().all())
+
+        except Exception as e:
+            LOGGER.error(f"Failed to fail abandoned upload jobs: {str(e)}")
+            raise DatabaseError(f"Failed to fail abandoned upload jobs: {str(e)}", operation="fail_abandoned_jobs")
+
+    async def claim_job(self, worker_id: str, stale_seconds: int, max_running: int) -> UploadJob | None:
+        """
+        Claim the oldest queued job, or a running job whose worker stopped heartbeating.
+        SKIP LOCKED lets concurrent workers claim different jobs without waiting on each
+        other. The running-jobs cap is checked in the same statement; two workers racing
+        for the last slot can briefly exceed it by one.
+        """
+        try:
+            stale_before = _stale_before(stale_seconds)
+            running_count = (
+                select(func.count())
+                .where(and_(UploadJob.status == UploadJobStatus.RUNNING.value, UploadJob.heartbeat_at >= stale_before))
+                .scalar_subquery()
+            )
+            next_job = (
+                select(UploadJob.id)
+                .where(and_(
+                    or_(
+                        UploadJob.status == UploadJobStatus.QUEUED.value,
+                        and_(UploadJob.status == UploadJobStatus.RUNNING.value, UploadJob.heartbeat_at < stale_before)
+                    ),
+                    running_count < max_running
+                ))
+                .order_by(UploadJob.created_on, UploadJob.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            result = await self.db.execute(
+                update(UploadJob)
+                .where(UploadJob.id == next_job)
+                .values(
+                    status=UploadJobStatus.RUNNING.value,
+                    worker_id=worker_id,
+                    attempts=UploadJob.attempts + 1,
+                    heartbeat_at=func.now(),
+                    started_on=func.coalesce(UploadJob.started_on, func.now()),
+                    rows_processed=0,
+                    uploaded_count=0,
+                    error_count=0,
+                    errors=[]
+                )
+                .returning(UploadJob)
+            )
+            return result.scalar_one_or_none()
+
+        except Exception as e:
+            LOGGER.error(f"Failed to claim upload job for worker {worker_id}: {str(e)}")
+            raise DatabaseError(f"Failed to claim upload job: {str(e)}", operation="claim_job")
+
+    async def update_progress(self, job_id: str, worker_id: str, rows_processed: int, uploaded_count: int, error_count: int,
+                              errors: list[str] = None) -> bool:
+        """Record progress, row errors so far and refresh the heartbeat. False when the job is no longer ours"""
+        try:
+            result = await self.db.execute(
+                update(UploadJob)
+                .where(and_(UploadJob.id == job_id, UploadJob.worker_id == worker_id, UploadJob.status == UploadJobStatus.RUNNING.value))
+                .values(
+                    rows_processed=rows_processed,
+                    uploaded_count=uploaded_count,
+                    error_count=error_count,
+                    errors=errors or [],
+                    heartbeat_at=func.now()
+                )
+            )
+            return result.rowcount > 0
+
+        except Exception as e:
+            LOGGER.error(f"Failed to update upload job progress {job_id}: {str(e)}")
+            raise DatabaseError(f"Failed to update upload job progress: {str(e)}", operation="update_progress")
+
+    async def finish_job(self, job_id: str, worker_id: str, status: UploadJobStatus, rows_processed: int, uploaded_count: int,
+                         error_count: int, errors: list[str] = None, error_message: str = None) -> bool:
+        """Move a running job to a final state. False when the job is no longer ours"""
+        try:
+            result = await self.db.execute(
+                update(UploadJob)
+                .where(and_(UploadJob.id == job_id, UploadJob.worker_id == worker_id, UploadJob.status == UploadJobStatus.RUNNING.value))
+                .values(
+                    status=status.value,
+                    rows_processed=rows_processed,
+                    uploaded_count=uploaded_count,
+                    error_count=error_count,
+                    errors=errors or [],
+                    error_message=error_message,
+                    worker_id=None,
+                    finished_on=func.now()
+                )
+            )
+            return result.rowcount > 0
+
+        except Exception as e:
+            LOGGER.error(f"Failed to finish upload job {job_id}: {str(e)}")
+            raise DatabaseError(f"Failed to finish upload job: {str(e)}", operation="finish_job")
+
+    async def release_job(self, job_id: str, worker_id: str, error_message: str = None, refund_attempt: bool = False) -> bool:
+        """Put a running job back in the queue, after a transient failure or on shutdown (refund_attempt)"""
+        try:
+            result = await self.db.execute(
+                update(UploadJob)
+                .where(and_(UploadJob.id == job_id, UploadJob.worker_id == worker_id, UploadJob.status == UploadJobStatus.RUNNING.value))
+                .values(
+                    status=UploadJobStatus.QUEUED.value,
+                    worker_id=None,
+                    heartbeat_at=None,
+                    error_message=error_message,
+                    attempts=UploadJob.attempts - 1 if refund_attempt else UploadJob.attempts
+                )
+            )
+            return result.rowcount > 0
+
+        except Exception as e:
+            LOGGER.error(f"Failed to release upload job {job_id}: {str(e)}")
+            raise DatabaseError(f"Failed to release upload job: {str(e)}", operation="release_job")
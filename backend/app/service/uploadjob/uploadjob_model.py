@@ -0,0 +1,31 @@
+"""
+Pydantic models for upload job service.
+Contains response models for background bulk upload jobs.
+"""
+
+from enum import Enum
+from pydantic import BaseModel
+from typing import Optional, List
+from datetime import datetime
+
+
+class UploadJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class UploadJobResponse(BaseModel):
+    """Response model for an upload job and its progress"""
+    job_id: str
+    filename: str
+    status: UploadJobStatus
+    rows_processed: int = 0
+    uploaded_count: int = 0
+    error_count: int = 0
+    errors: List[str] = []  # row errors, capped at INCIDENT.UPLOAD_MAX_ERRORS
+    error_message: Optional[str] = None
+    created_on: datetime
+    started_on: Optional[datetime] = None
+    finished_on: Optional[datetime] = None
@@ -0,0 +1,104 @@
+"""
+Upload job service layer.
+Queues bulk incident uploads as background jobs and reports their progress.
+"""
+
+import os
+import uuid
+import asyncio
+from pathlib import Path
+from typing import BinaryIO
+from sqlalchemy.ext.asyncio import AsyncSession
+from core import LOGGER, ValidationError, NotFoundError, DatabaseError
+from core.settings import config
+from service.rbac import has_permission, Permission
+from service.incident.upload import save_upload
+from .data.data import UploadJobDataAccess
+from .uploadjob_model import UploadJobResponse
+
+
+def upload_storage_dir() -> Path:
+    """Directory queued upload files wait in until a worker has processed them"""
+    storage_dir = Path(config.UPLOAD_JOBS.STORAGE_DIR)
+    if not storage_dir.is_absolute():
+        storage_dir = Path(__file__).parent.parent.parent / storage_dir
+    storage_dir.mkdir(parents=True, exist_ok=True)
+    return storage_dir
+
+
+def job_response(job) -> UploadJobResponse:
+    return UploadJobResponse(
+        job_id=job.id,
+        filename=job.filename,
+        status=job.status,
+        rows_processed=job.rows_processed,
+        uploaded_count=job.uploaded_count,
+        error_count=job.error_count,
+        errors=job.errors or [],
+        error_message=job.error_message,
+        created_on=job.created_on,
+        started_on=job.started_on,
+        finished_on=job.finished_on
+    )
+
+
+class UploadJobService:
+    """Service class for upload job operations"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.job_data = UploadJobDataAccess(db)
+
+    async def enqueue_upload(self, file: BinaryIO, filename: str, uploaded_by: str, user_permissions: bytes = None) -> UploadJobResponse:
+        """Store the upload and queue a job for it. Returns as soon as the job is queued"""
+        LOGGER.info(f"Processing upload job creation for file: {filename} by user: {uploaded_by}")
+
+        # Check permission
+        if not has_permission(user_permissions, Permission.PermCreateIncident):
+            LOGGER.warning(f"User {uploaded_by} does not have permission to create incidents")
+            raise ValidationError("You do not have permission to create incidents")
+
+        if not filename or not filename.lower().endswith(('.csv', '.xlsx', '.xls')):
+            raise ValidationError("Unsupported file format. Only CSV and Excel files are supported.")
+
+        job_id = str(uuid.uuid4())
+        file_path = str(upload_storage_dir() / f"{job_id}{Path(filename).suffix.lower()}")
+
+        # copied off the event loop, the size limit is enforced while copying
+        await asyncio.to_thread(save_upload, file, file_path, config.INCIDENT.UPLOAD_MAX_SIZE_MB)
+
+        try:
+            async with self.db.begin():
+                job = await self.job_data.create_job(
+                    filename=filename,
+                    file_path=file_path,
+                    uploaded_by=uploaded_by,
+                    user_permissions=user_permissions,
+                    job_id=job_id
+                )
+            return job_response(job)
+
+        except Exception as e:
+            LOGGER.error(f"Upload job creation failed for file {filename}: {str(e)}")
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            if isinstance(e, (ValidationError, DatabaseError)):
+                raise
+            raise DatabaseError(f"Upload job creation failed: {str(e)}", operation="enqueue_upload")
+
+    async def get_job(self, job_id: str, uploaded_by: str) -> UploadJobResponse:
+        """Get an upload job's status and progress - only if uploaded by the same user"""
+        LOGGER.info(f"Processing upload job retrieval for ID: {job_id} by user: {uploaded_by}")
+
+        try:
+            job = await self.job_data.get_job(job_id, uploaded_by)
+            if not job:
+                LOGGER.warning(f"Upload job not found: {job_id} for user: {uploaded_by}")
+                raise NotFoundError("Upload job", job_id)
+            return job_response(job)
+
+        except Exception as e:
+            LOGGER.error(f"Upload job retrieval failed for ID {job_id}: {str(e)}")
+            if isinstance(e, (NotFoundError, DatabaseError)):
+                raise
+            raise DatabaseError(f"Upload job retrieval failed: {str(e)}", operation="get_job")
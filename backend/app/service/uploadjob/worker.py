@@ -0,0 +1,224 @@
+"""
+Background worker pool for upload jobs.
+Every app process runs UPLOAD_JOBS.CONCURRENCY runners. A runner claims one job
+at a time from the incident_upload_job table, runs the normal bulk upload in its
+own session and reports progress from a separate short session, which doubles
+as the heartbeat that keeps the job from being reclaimed.
+
+Restart safety: the upload itself is one transaction, so a job interrupted by a
+crash leaves no incidents behind. Its heartbeat goes stale and another runner
+claims it again, up to UPLOAD_JOBS.MAX_ATTEMPTS times.
+"""
+
+import os
+import socket
+import asyncio
+from typing import List, Optional
+
+from core import LOGGER, ValidationError
+from core.settings import config
+from service.db import async_session
+from service.incident.incident_service import IncidentService
+from .data.data import UploadJobDataAccess
+from .uploadjob_model import UploadJobStatus
+
+
+class _JobProgress:
+    """Latest progress of the running job, written by the upload and read by the heartbeat"""
+
+    def __init__(self):
+        self.rows_processed = 0
+        self.uploaded_count = 0
+        self.error_count = 0
+        self.errors: List[str] = []
+
+    def update(self, rows_processed: int, uploaded_count: int, error_count: int, errors: List[str]) -> None:
+        self.rows_processed = rows_processed
+        self.uploaded_count = uploaded_count
+        self.error_count = error_count
+        self.errors = list(errors)
+
+
+class UploadJobWorker:
+    """Pool of runners claiming and processing upload jobs"""
+
+    def __init__(self, concurrency: int, poll_seconds: float, heartbeat_seconds: float,
+                 stale_seconds: int, max_running: int, max_attempts: int):
+        self.concurrency = concurrency
+        self.poll_seconds = poll_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.stale_seconds = stale_seconds
+        self.max_running = max_running
+        self.max_attempts = max_attempts
+        self._tasks: List[asyncio.Task] = []
+        self._running_jobs: dict[str, str] = {}  # job id -> worker id
+        self._stopping = False
+
+    def start(self) -> None:
+        self._stopping = False
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        for index in range(self.concurrency):
+            self._tasks.append(asyncio.create_task(self._run(f"{prefix}:{index}")))
+        LOGGER.info(f"Upload job worker started with {self.concurrency} runners")
+
+    async def stop(self) -> None:
+        """Stop the runners and put their unfinished jobs back in the queue"""
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        for job_id, worker_id in list(self._running_jobs.items()):
+            try:
+                async with async_session() as db:
+                    async with db.begin():
+                        await UploadJobDataAccess(db).release_job(job_id, worker_id, refund_attempt=True)
+                LOGGER.info(f"Upload job {job_id} returned to the queue on shutdown")
+            except Exception as e:
+                LOGGER.error(f"Failed to release upload job {job_id} on shutdown: {str(e)}")
+        self._running_jobs.clear()
+        LOGGER.info("Upload job worker stopped")
+
+    async def _run(self, worker_id: str) -> None:
+        while not self._stopping:
+            try:
+                job = await self._claim(worker_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                LOGGER.error(f"Upload job runner {worker_id} failed to claim a job: {str(e)}")
+                job = None
+
+            if job is None:
+                await asyncio.sleep(self.poll_seconds)
+                continue
+
+            self._running_jobs[job.id] = worker_id
+            try:
+                await self._process(job, worker_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # recording the outcome failed, the job's heartbeat goes stale and it is claimed again
+                LOGGER.error(f"Upload job runner {worker_id} failed to finish job {job.id}: {str(e)}")
+            finally:
+                if not self._stopping:
+                    self._running_jobs.pop(job.id, None)
+
+    async def _claim(self, worker_id: str):
+        async with async_session() as db:
+            async with db.begin():
+                job_data = UploadJobDataAccess(db)
+                for abandoned in await job_data.fail_abandoned_jobs(self.stale_seconds, self.max_attempts):
+                    LOGGER.warning(f"Upload job {abandoned.id} failed after {abandoned.attempts} attempts")
+                    self._remove_file(abandoned.file_path)
+                job = await job_data.claim_job(worker_id, self.stale_seconds, self.max_running)
+        if job is not None:
+            LOGGER.info(f"Upload job {job.id} claimed by {worker_id} (attempt {job.attempts})")
+        return job
+
+    async def _process(self, job, worker_id: str) -> None:
+        progress = _JobProgress()
+        heartbeat = asyncio.create_task(self._heartbeat(job.id, worker_id, progress))
+        status: Optional[UploadJobStatus] = None
+        error_message = None
+        try:
+            async with async_session() as db:
+                with open(job.file_path, "rb") as file:
+                    result = await IncidentService(db).bulk_upload_incidents(
+                        file=file,
+                        filename=job.filename,
+                        uploaded_by=job.uploaded_by,
+                        user_permissions=job.user_permissions,
+                        on_progress=progress.update
+                    )
+            progress.uploaded_count = result["uploaded_count"]
+            status = UploadJobStatus.SUCCEEDED
+        except asyncio.CancelledError:
+            # shutdown, stop() puts the job back in the queue
+            raise
+        except (ValidationError, FileNotFoundError) as e:
+            # bad file content never succeeds on retry
+            status = UploadJobStatus.FAILED
+            error_message = str(e).split("\n")[0]
+        except Exception as e:
+            LOGGER.error(f"Upload job {job.id} failed: {str(e)}")
+            if job.attempts >= self.max_attempts:
+                status = UploadJobStatus.FAILED
+            error_message = str(e)
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+        async with async_session() as db:
+            async with db.begin():
+                job_data = UploadJobDataAccess(db)
+                if status is None:
+                    await job_data.release_job(job.id, worker_id, error_message=error_message)
+                    LOGGER.info(f"Upload job {job.id} returned to the queue for another attempt")
+                    return
+                owned = await job_data.finish_job(
+                    job.id, worker_id, status,
+                    rows_processed=progress.rows_processed,
+                    uploaded_count=progress.uploaded_count if status == UploadJobStatus.SUCCEEDED else 0,
+                    error_count=progress.error_count,
+                    errors=progress.errors,
+                    error_message=error_message
+                )
+        if owned:
+            self._remove_file(job.file_path)
+            LOGGER.info(f"Upload job {job.id} {status.value}: {progress.uploaded_count} incidents, {progress.error_count} errors")
+        else:
+            LOGGER.warning(f"Upload job {job.id} was reclaimed by another worker before it finished")
+
+    async def _heartbeat(self, job_id: str, worker_id: str, progress: _JobProgress) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                async with async_session() as db:
+                    async with db.begin():
+                        await UploadJobDataAccess(db).update_progress(
+                            job_id, worker_id, progress.rows_processed, progress.uploaded_count, progress.error_count,
+                            errors=progress.errors
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                LOGGER.error(f"Upload job {job_id} heartbeat failed: {str(e)}")
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            LOGGER.error(f"Failed to remove upload file {path}: {str(e)}")
+
+
+_worker: Optional[UploadJobWorker] = None
+
+
+async def start_upload_workers() -> None:
+    """Start this process' upload job runners when enabled"""
+    global _worker
+    if not config.UPLOAD_JOBS.ENABLED:
+        LOGGER.info("Upload job worker disabled by configuration")
+        return
+    _worker = UploadJobWorker(
+        concurrency=config.UPLOAD_JOBS.CONCURRENCY,
+        poll_seconds=config.UPLOAD_JOBS.POLL_SECONDS,
+        heartbeat_seconds=config.UPLOAD_JOBS.HEARTBEAT_SECONDS,
+        stale_seconds=config.UPLOAD_JOBS.STALE_SECONDS,
+        max_running=config.UPLOAD_JOBS.MAX_RUNNING,
+        max_attempts=config.UPLOAD_JOBS.MAX_ATTEMPTS
+    )
+    _worker.start()
+
+
+async def stop_upload_workers() -> None:
+    global _worker
+    if _worker is not None:
+        await _worker.stop()
+        _worker = None
@@ -5,9 +5,25 @@ Handles all database operations for user management with proper logging.
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from core import LOGGER, DatabaseError
+from core import LOGGER, DatabaseError, TTLCache, config
 from service.db.models.user_model import User
 
+# Typeahead results per (prefix, after, limit). Short lived, a new user shows up within the TTL
+USER_SEARCH_CACHE = TTLCache(
+    ttl_seconds=config.USERS.SEARCH_CACHE_TTL_SECONDS,
+    max_entries=config.USERS.SEARCH_CACHE_MAX_ENTRIES
+)
+
+# Must match idx_users_email_prefix. Under the C collation strings sort by code point, so
+# a plain btree answers the prefix as a range scan already in ORDER BY order. That is what
+# text_pattern_ops gives LIKE, but it also serves the ordering and works with bind params
+SEARCH_EMAIL = func.lower(User.email).collate("C")
+
+
+def prefix_range(prefix: str) -> tuple[str, str]:
+    """[lower, upper) bounds holding every string that starts with prefix, in code point order"""
+    return prefix, prefix + "\U0010ffff"
+
 
 class UserDataAccess:
     """Data access class for user operations"""
@@ -16,12 +32,12 @@ class UserDataAccess:
         self.db = db
 
     async def get_all_emails(self) -> list[str]:
-        """Get all email addresses from users table"""
+        """Get all email addresses of active users"""
         try:
             LOGGER.debug("Querying all user emails")
 
             result = await self.db.execute(
-                select(User.email)
+                select(User.email).where(User.is_deleted == False)
             )
             emails = result.scalars().all()
 
@@ -30,4 +46,35 @@ class UserDataAccess:
 
         except Exception as e:
             LOGGER.error(f"Failed to query user emails: {str(e)}")
-            raise DatabaseError(f"Failed to query user emails: {str(e)}", operation="get_all_emails")
\ No newline at end of file
+            raise DatabaseError(f"Failed to query user emails: {str(e)}", operation="get_all_emails")
+
+    async def search_emails(self, prefix: str, limit: int, after: str = None) -> tuple[list[str], bool]:
+        """
+        Emails of active users starting with prefix (case insensitive) in alphabetical order,
+        continuing after the email `after` when given. Returns (emails, has_more).
+        """
+        key = (prefix.lower(), after.lower() if after else None, limit)
+        cached = USER_SEARCH_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            LOGGER.debug(f"Searching user emails with prefix: {prefix!r}, after: {after!r}")
+
+            # is_deleted = false literally, so the partial index applies
+            query = select(User.email).where(User.is_deleted == False)
+            if prefix:
+                lower, upper = prefix_range(prefix.lower())
+                query = query.where(SEARCH_EMAIL >= lower, SEARCH_EMAIL < upper)
+            if after:
+                query = query.where(SEARCH_EMAIL > after.lower())
+            result = await self.db.execute(query.order_by(SEARCH_EMAIL).limit(limit + 1))
+            emails = list(result.scalars().all())
+
+            found = (emails[:limit], len(emails) > limit)
+            USER_SEARCH_CACHE.set(key, found)
+            return found
+
+        except Exception as e:
+            LOGGER.error(f"Failed to search user emails: {str(e)}")
+            raise DatabaseError(f"Failed to search user emails: {str(e)}", operation="search_emails")
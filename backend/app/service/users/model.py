@@ -20,4 +20,10 @@ class UserResponse(BaseModel):
 class EmailListResponse(BaseModel):
     """Response model for list of emails"""
     emails: List[str]
-    total_count: int
\ No newline at end of file
+    total_count: int
+
+
+class UserSearchResponse(BaseModel):
+    """Response model for the email typeahead, pass the last email as after for the next page"""
+    emails: List[str]
+    has_more: bool
@@ -0,0 +1,58 @@
+import asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from api.routes.users_route import router
+from service.db import get_db
+from service.auth.auth import get_current_user
+from service.users.data.data import UserDataAccess, USER_SEARCH_CACHE, prefix_range
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+class _Session:
+    """Stands in for AsyncSession, counts queries and answers with fixed emails"""
+    def __init__(self, emails):
+        self.emails = emails
+        self.queries = 0
+
+    async def execute(self, query):
+        self.queries += 1
+        return _Result(self.emails)
+
+class TestPrefixRange:
+    def test_range_holds_exactly_the_prefixed_emails(self):
+        """Test the [lower, upper) range selects what startswith would, in code point order"""
+        emails = sorted(["al@x.io", "alice@x.io", "alicé@x.io", "alj@x.io", "ak@x.io", "al"])
+        lower, upper = prefix_range("ali")
+        assert [e for e in emails if lower <= e < upper] == [e for e in emails if e.startswith("ali")]
+
+class TestUserSearch:
+    def setup_method(self):
+        USER_SEARCH_CACHE.clear()
+
+    def test_results_are_cached_case_insensitively(self):
+        """Test a repeated typeahead query, in any case, is answered from the cache"""
+        db = _Session(["ann@x.io", "anna@x.io", "annie@x.io"])
+        data = UserDataAccess(db)
+        assert asyncio.run(data.search_emails("An", 2)) == (["ann@x.io", "anna@x.io"], True)
+        assert asyncio.run(data.search_emails("an", 2)) == (["ann@x.io", "anna@x.io"], True)
+        assert db.queries == 1
+
+    def test_limit_is_bounded(self):
+        """Test a limit above the configured maximum is rejected before any query runs"""
+        db = _Session([])
+        app = FastAPI()
+        app.include_router(router, prefix="/api")
+        app.dependency_overrides[get_db] = lambda: db
+        app.dependency_overrides[get_current_user] = lambda: {"email": "a@b.io"}
+        client = TestClient(app)
+        assert client.get("/api/users/search", params={"prefix": "a", "limit": 10_000}).status_code == 422
+        assert client.get("/api/users/search", params={"prefix": "a", "limit": 0}).status_code == 422
+        assert db.queries == 0
@@ -4,9 +4,9 @@ Contains business logic for user operations with proper logging and error handli
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from core import LOGGER, DatabaseError
+from core import LOGGER, DatabaseError, config
 from .data.data import UserDataAccess
-from .model import EmailListResponse
+from .model import EmailListResponse, UserSearchResponse
 
 
 class UserService:
@@ -34,4 +34,20 @@ class UserService:
             LOGGER.error(f"Failed to list user emails: {str(e)}")
             if isinstance(e, DatabaseError):
                 raise
-            raise DatabaseError(f"Failed to list user emails: {str(e)}", operation="list_emails")
\ No newline at end of file
+            raise DatabaseError(f"Failed to list user emails: {str(e)}", operation="list_emails")
+
+    async def search_emails(self, prefix: str = "", limit: int = None, after: str = None) -> UserSearchResponse:
+        """Emails of active users starting with prefix, one page at a time"""
+        if limit is None:
+            limit = config.USERS.SEARCH_DEFAULT_LIMIT
+
+        try:
+            emails, has_more = await self.user_data.search_emails(prefix.strip(), limit, after=after or None)
+            LOGGER.debug(f"User search for prefix {prefix!r} returned {len(emails)} emails")
+            return UserSearchResponse(emails=emails, has_more=has_more)
+
+        except Exception as e:
+            LOGGER.error(f"Failed to search user emails: {str(e)}")
+            if isinstance(e, DatabaseError):
+                raise
+            raise DatabaseError(f"Failed to search user emails: {str(e)}", operation="search_emails")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: API latency while a login storm is running.
+
+Drives an in-process ASGI app with two routes, a cheap /api/ping standing in for
+every other API request and /api/login doing a bcrypt check. A number of clients
+hammer /api/login while a probe sends /api/ping every 10ms and records its
+latency. Runs twice: bcrypt inline on the event loop (the old behaviour) and
+through the bounded bcrypt pool. No database needed.
+
+    python bench_login_storm.py --logins 64 --seconds 10 --rounds 12
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "backend" / "app"))
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from core import ServiceUnavailableError
+from service.auth.hashing import BcryptPool, hash_password_sync, verify_password_sync
+
+
+def build_app(hashed_password: str, pool: BcryptPool | None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.post("/api/login")
+    async def login():
+        if pool is None:
+            ok = verify_password_sync("password", hashed_password)
+        else:
+            try:
+                ok = await pool.run(verify_password_sync, "password", hashed_password)
+            except ServiceUnavailableError as e:
+                raise HTTPException(status_code=503, detail=e.message, headers={"Retry-After": str(e.retry_after)})
+        return {"ok": ok}
+
+    return app
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(label: str, app: FastAPI, logins: int, seconds: float) -> None:
+    transport = httpx.ASGITransport(app=app)
+    deadline = time.perf_counter() + seconds
+    statuses: dict[int, int] = {}
+    ping_ms: list[float] = []
+    login_ms: list[float] = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def storm():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.post("/api/login")
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                if response.status_code == 200:
+                    login_ms.append((time.perf_counter() - started) * 1000)
+                else:
+                    # a shed client backs off briefly like a browser retrying would
+                    await asyncio.sleep(0.05)
+
+        async def probe():
+            # a ping arrives every 10ms, its latency counts from when it arrived, so time
+            # spent waiting for a blocked event loop to even start it is included
+            arrives_at = time.perf_counter()
+            while arrives_at < deadline:
+                await asyncio.sleep(max(0.0, arrives_at - time.perf_counter()))
+                await client.get("/api/ping")
+                ping_ms.append((time.perf_counter() - arrives_at) * 1000)
+                arrives_at += 0.01
+
+        await asyncio.gather(probe(), *(storm() for _ in range(logins)))
+
+    print(f"\n{label}")
+    print(f"  /api/ping  n={len(ping_ms)} p50={statistics.median(ping_ms):.1f}ms "
+          f"p99={percentile(ping_ms, 99):.1f}ms max={max(ping_ms):.1f}ms")
+    if login_ms:
+        print(f"  /api/login n={len(login_ms)} p50={statistics.median(login_ms):.1f}ms "
+              f"p99={percentile(login_ms, 99):.1f}ms")
+    print(f"  /api/login statuses {dict(sorted(statuses.items()))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=64, help="concurrent login clients")
+    parser.add_argument("--seconds", type=float, default=10, help="duration of each run")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt work factor")
+    parser.add_argument("--workers", type=int, default=4, help="bcrypt pool threads")
+    parser.add_argument("--max-queue", type=int, default=32, help="bcrypt pool queue depth")
+    args = parser.parse_args()
+
+    hashed_password = hash_password_sync("password", args.rounds)
+    print(f"{args.logins} login clients, {args.seconds}s per run, bcrypt rounds {args.rounds}")
+
+    asyncio.run(run("bcrypt inline on the event loop", build_app(hashed_password, None), args.logins, args.seconds))
+
+    pool = BcryptPool(workers=args.workers, max_queue=args.max_queue)
+    try:
+        asyncio.run(run(f"bcrypt pool, {args.workers} workers, queue {args.max_queue}",
+                        build_app(hashed_password, pool), args.logins, args.seconds))
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
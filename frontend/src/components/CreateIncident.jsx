@@ -3,6 +3,9 @@ import { useSearchParams } from 'react-router-dom';
 import Header from './Header';
 import Footer from './Footer';
 
+const ASSIGNEE_SEARCH_LIMIT = 10;
+const ASSIGNEE_SEARCH_DEBOUNCE_MS = 200;
+
 const CreateIncident = () => {
   const [searchParams] = useSearchParams();
   const incidentId = searchParams.get('id'); // Get incident ID from query params
@@ -16,6 +19,8 @@ const CreateIncident = () => {
     assigned_to: ''
   });
   const [emails, setEmails] = useState([]);
+  // ETag of the incident being edited, sent back as If-Match so concurrent edits are not overwritten
+  const [etag, setEtag] = useState(null);
 
   // Check if we're in edit mode
   useEffect(() => {
@@ -25,31 +30,36 @@ const CreateIncident = () => {
     }
   }, [incidentId]);
 
-  // Fetch emails for dropdown
+  // Assignee typeahead, asks the server for a page of matching emails as the user types
   useEffect(() => {
-    const fetchEmails = async () => {
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
       try {
-        const response = await fetch('/api/users/emails', {
+        const params = new URLSearchParams({ prefix: formData.assigned_to, limit: String(ASSIGNEE_SEARCH_LIMIT) });
+        const response = await fetch(`/api/users/search?${params.toString()}`, {
           method: 'GET',
           credentials: 'include',
-          headers: {
-            'Content-Type': 'application/json',
-          },
+          signal: controller.signal,
         });
 
         if (response.ok) {
           const data = await response.json();
           setEmails(data.emails || []);
         } else {
-          console.error('Failed to fetch emails');
+          console.error('Failed to search emails');
         }
       } catch (error) {
-        console.error('Error fetching emails:', error);
+        if (error.name !== 'AbortError') {
+          console.error('Error searching emails:', error);
+        }
       }
-    };
+    }, ASSIGNEE_SEARCH_DEBOUNCE_MS);
 
-    fetchEmails();
-  }, []);
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [formData.assigned_to]);
 
   const fetchIncidentData = async (incidentId) => {
     try {
@@ -64,6 +74,7 @@ const CreateIncident = () => {
 
       if (response.ok) {
         const incident = await response.json();
+        setEtag(response.headers.get('ETag'));
         setFormData({
           title: incident.title || '',
           description: incident.description || '',
@@ -123,12 +134,17 @@ const CreateIncident = () => {
                   // Prepare form data
                   let submitData = { ...formData };
 
+                  const headers = {
+                    'Content-Type': 'application/x-www-form-urlencoded',
+                  };
+                  if (isEditing && etag) {
+                    headers['If-Match'] = etag;
+                  }
+
                   const response = await fetch(url, {
                     method: method,
                     credentials: 'include',
-                    headers: {
-                      'Content-Type': 'application/x-www-form-urlencoded',
-                    },
+                    headers,
                     body: new URLSearchParams(submitData).toString(),
                   });
 
@@ -145,6 +161,10 @@ const CreateIncident = () => {
                     // Authentication failed, redirect to login
                     alert('Session expired. Please log in again.');
                     window.location.href = '/login';
+                  } else if (response.status === 412) {
+                    // Someone else saved the incident since it was loaded
+                    alert('This incident was changed by someone else. The latest version will be loaded, please apply your changes again.');
+                    fetchIncidentData(incidentId);
                   } else {
                     alert(isEditing ? 'Failed to update incident' : 'Failed to create incident');
                   }
@@ -231,21 +251,22 @@ const CreateIncident = () => {
               <div className="flex max-w-[480px] flex-wrap items-end gap-4 px-4 py-3">
                 <label className="flex flex-col min-w-40 flex-1">
                   <p className="text-[#111418] text-base font-medium leading-normal pb-2">Assigned To *</p>
-                  <select
+                  <input
+                    type="email"
                     name="assigned_to"
+                    list="assignee-options"
+                    autoComplete="off"
+                    placeholder="Start typing an email"
                     value={formData.assigned_to}
                     onChange={handleInputChange}
                     className="form-input flex w-full min-w-0 flex-1 resize-none overflow-hidden rounded-lg text-[#111418] focus:outline-0 focus:ring-0 border border-[#dbe0e6] bg-white focus:border-[#dbe0e6] h-14 placeholder:text-[#617589] p-[15px] text-base font-normal leading-normal"
-                    style={{backgroundImage: 'url("data:image/svg+xml,%3csvg xmlns=%27http://www.w3.org/2000/svg%27 width=%2724px%27 height=%2724px%27 fill=%27rgb(97,117,137)%27 viewBox=%270 0 256 256%27%3e%3cpath d=%27M181.66,170.34a8,8,0,0,1,0,11.32l-48,48a8,8,0,0,1-11.32,0l-48-48a8,8,0,0,1,11.32-11.32L128,212.69l42.34-42.35A8,8,0,0,1,181.66,170.34Zm-96-84.68L128,43.31l42.34,42.35a8,8,0,0,0,11.32-11.32l-48-48a8,8,0,0,0-11.32,0l-48,48A8,8,0,0,0,85.66,85.66Z%27%3e%3c/path%3e%3c/svg%3e")', backgroundPosition: 'right 15px center', backgroundRepeat: 'no-repeat', backgroundSize: '20px'}}
                     required
-                  >
-                    <option value="">Select User</option>
+                  />
+                  <datalist id="assignee-options">
                     {emails.map((email) => (
-                      <option key={email} value={email}>
-                        {email}
-                      </option>
+                      <option key={email} value={email} />
                     ))}
-                  </select>
+                  </datalist>
                 </label>
               </div>
 
@@ -1,4 +1,4 @@
-import React, { useEffect } from 'react';
+import React from 'react';
 import Header from './Header';
 import IncidentTable from './IncidentTable';
 import IncidentFilters from './IncidentFilters';
@@ -7,11 +7,8 @@ import Footer from './Footer';
 import { IncidentProvider, useIncidentContext } from '../contexts/IncidentContext';
 
 const HomePageContent = () => {
-  const { fetchIncidents, error, pagination, handlePageChange } = useIncidentContext();
-
-  useEffect(() => {
-    fetchIncidents();
-  }, []); // Empty dependency array to run only once on mount
+  // The incident context fetches the first page itself once filters are initialised
+  const { error, pagination, handlePageChange } = useIncidentContext();
 
   return (
     <div className="relative flex size-full min-h-screen flex-col bg-white group/design-root overflow-x-hidden" style={{fontFamily: 'Inter, "Noto Sans", sans-serif'}}>
@@ -1,12 +1,62 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect } from 'react';
 import Chat from './Chat';
 
 const IncidentDetails = ({ incident: initialIncident, onClose }) => {
   const [incident, setIncident] = useState(initialIncident);
   const [loading, setLoading] = useState(false);
+  const incidentId = incident?.id;
+
+  // Live chat messages and updates from other users
+  useEffect(() => {
+    if (!incidentId) return undefined;
+    const source = new EventSource(`/api/incidents/${incidentId}/events`, { withCredentials: true });
+
+    source.addEventListener('chat_message', (e) => {
+      const { data: message } = JSON.parse(e.data);
+      setIncident(prev => ({ ...prev, chat: appendMessage(prev.chat, message) }));
+    });
+    source.addEventListener('incident_updated', (e) => {
+      const { data } = JSON.parse(e.data);
+      if (data) {
+        setIncident(prev => ({ ...prev, ...data }));
+      } else {
+        refetchIncident();
+      }
+    });
+    source.addEventListener('incident_deleted', () => {
+      setIncident(prev => ({ ...prev, is_deleted: true }));
+    });
+    // The server dropped us for falling behind, reload and let EventSource reconnect
+    source.addEventListener('lagged', () => {
+      refetchIncident();
+    });
+
+    return () => source.close();
+  }, [incidentId]);
 
   if (!incident) return null;
 
+  // Append a message unless it is already shown (it may arrive by POST and by event)
+  function appendMessage(chat, message) {
+    const messages = chat || [];
+    if (message.id && messages.some(m => m.id === message.id)) return messages;
+    return [...messages, message];
+  }
+
+  async function refetchIncident() {
+    try {
+      const response = await fetch(`/api/incidents/${incidentId}`, {
+        method: 'GET',
+        credentials: 'include',
+      });
+      if (response.ok) {
+        setIncident(await response.json());
+      }
+    } catch (error) {
+      console.error('Error refreshing incident:', error);
+    }
+  }
+
   const formatDate = (dateString) => {
     const date = new Date(dateString);
     return date.toLocaleDateString('en-US', {
@@ -31,8 +81,9 @@ const IncidentDetails = ({ incident: initialIncident, onClose }) => {
       });
 
       if (response.ok) {
-        const updatedIncident = await response.json();
-        setIncident(updatedIncident);
+        // The server returns only the new message, append it to what is already shown
+        const message = await response.json();
+        setIncident(prev => ({ ...prev, chat: appendMessage(prev.chat, message) }));
       } else if (response.status === 401) {
         alert('Session expired. Please log in again.');
         window.location.href = '/login';
@@ -47,6 +98,40 @@ const IncidentDetails = ({ incident: initialIncident, onClose }) => {
     }
   };
 
+  // Fetch the page of chat messages before the oldest one shown
+  const handleLoadOlderMessages = async () => {
+    try {
+      setLoading(true);
+      const params = new URLSearchParams({ before: incident.chat_before_cursor });
+      const response = await fetch(`/api/incidents/${incident.id}/chat?${params.toString()}`, {
+        method: 'GET',
+        credentials: 'include',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+      });
+
+      if (response.ok) {
+        const page = await response.json();
+        setIncident(prev => ({
+          ...prev,
+          chat: [...page.messages, ...(prev.chat || [])],
+          chat_before_cursor: page.before_cursor,
+        }));
+      } else if (response.status === 401) {
+        alert('Session expired. Please log in again.');
+        window.location.href = '/login';
+      } else {
+        alert('Failed to load older messages');
+      }
+    } catch (error) {
+      console.error('Error loading older messages:', error);
+      alert('Error loading older messages');
+    } finally {
+      setLoading(false);
+    }
+  };
+
   // Get current user email (you might need to implement this based on your auth system)
   const getCurrentUserEmail = () => {
     // This should come from your authentication context or state
@@ -165,6 +250,15 @@ const IncidentDetails = ({ incident: initialIncident, onClose }) => {
 
           {/* Chat Section */}
           <div className="px-4 pb-4">
+            {incident.chat_before_cursor && (
+              <button
+                onClick={handleLoadOlderMessages}
+                disabled={loading}
+                className="mb-2 text-sm font-medium text-[#1172d4] hover:underline disabled:opacity-50"
+              >
+                Load older messages
+              </button>
+            )}
             <Chat
               messages={incident.chat || []}
               onAddMessage={handleAddChatMessage}
@@ -188,7 +188,7 @@ const IncidentTable = () => {
                     {incident.assigned_to}
                   </td>
                   <td className="h-[72px] px-2 py-2 text-[#617589] text-sm font-normal leading-normal">
-                    {(incident.chat || []).length}
+                    {incident.chat_count ?? 0}
                   </td>
                   <td className="h-[72px] px-2 py-2 text-sm font-normal leading-normal">
                     <ActionMenu
@@ -297,7 +297,7 @@ const IncidentTable = () => {
                 <span className="font-medium text-[#111418]">Assigned to:</span> {incident.assigned_to}
               </p>
               <p className="text-[#617589] text-sm">
-                <span className="font-medium text-[#111418]">Chat messages:</span> {(incident.chat || []).length}
+                <span className="font-medium text-[#111418]">Chat messages:</span> {incident.chat_count ?? 0}
               </p>
             </div>
 
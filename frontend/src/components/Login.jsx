@@ -1,7 +1,18 @@
+import { useEffect } from 'react';
 import { Link } from 'react-router-dom';
 import Footer from './Footer';
+import { refreshSession } from '../session';
 
 function Login() {
+  // An expired access token lands here, a still valid refresh token skips the form
+  useEffect(() => {
+    refreshSession().then((refreshed) => {
+      if (refreshed) {
+        window.location.replace('/home');
+      }
+    });
+  }, []);
+
   const handleSubmit = (e) => {
     e.preventDefault();
     // TODO: Handle login logic
@@ -1,11 +1,14 @@
 import React, { useState, useEffect } from 'react';
 import { UPLOAD_CONFIG } from '../constants';
 
+const UPLOAD_JOB_POLL_MS = 1000;
+
 const UploadIncidentsModal = ({ isOpen, onClose, onUpload }) => {
   const [selectedFile, setSelectedFile] = useState(null);
   const [config, setConfig] = useState(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
+  const [progress, setProgress] = useState('');
 
   // Format file size for display
   const formatFileSize = (bytes) => {
@@ -69,6 +72,29 @@ const UploadIncidentsModal = ({ isOpen, onClose, onUpload }) => {
     }
   };
 
+  // Poll the upload job until a worker has finished it
+  const waitForJob = async (jobId) => {
+    while (true) {
+      await new Promise(resolve => setTimeout(resolve, UPLOAD_JOB_POLL_MS));
+      const response = await fetch(`/api/incidents/upload/${jobId}`, {
+        method: 'GET',
+        credentials: 'include',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+      });
+      if (!response.ok) {
+        const errorData = await response.json();
+        throw new Error(errorData.detail || 'Failed to get upload status');
+      }
+      const job = await response.json();
+      if (job.status === 'succeeded' || job.status === 'failed') {
+        return job;
+      }
+      setProgress(job.status === 'queued' ? 'Waiting to start...' : `Processed ${job.rows_processed} rows`);
+    }
+  };
+
   const handleUpload = async () => {
     if (!selectedFile) {
       setError('Please select a file');
@@ -77,35 +103,46 @@ const UploadIncidentsModal = ({ isOpen, onClose, onUpload }) => {
 
     setLoading(true);
     setError('');
+    setProgress('');
 
     try {
       const formData = new FormData();
       formData.append('file', selectedFile);
 
-      const response = await fetch('/api/incidents/upload', {
+      // Large files are processed in the background, the request only queues the job
+      const response = await fetch('/api/incidents/upload/jobs', {
         method: 'POST',
         credentials: 'include',
         body: formData,
       });
 
-      if (response.ok) {
-        const result = await response.json();
-        let message = `Successfully uploaded ${result.uploaded_count} incidents`;
-        if (result.errors && result.errors.length > 0) {
-          message += `\n\nErrors encountered:\n${result.errors.join('\n')}`;
-        }
-        alert(message);
+      if (!response.ok) {
+        const errorData = await response.json();
+        setError(errorData.detail || 'Upload failed');
+        return;
+      }
+
+      const job = await waitForJob((await response.json()).job_id);
+      if (job.status === 'succeeded') {
+        alert(`Successfully uploaded ${job.uploaded_count} incidents`);
         onClose();
         if (onUpload) onUpload();
       } else {
-        const errorData = await response.json();
-        setError(errorData.detail || 'Upload failed');
+        let message = job.error_message || 'Upload failed';
+        if (job.errors && job.errors.length > 0) {
+          message += `\n${job.errors.join('\n')}`;
+          if (job.error_count > job.errors.length) {
+            message += `\n... and ${job.error_count - job.errors.length} more errors`;
+          }
+        }
+        setError(message);
       }
     } catch (error) {
       console.error('Error uploading file:', error);
       setError('Upload failed. Please try again.');
     } finally {
       setLoading(false);
+      setProgress('');
     }
   };
 
@@ -146,7 +183,13 @@ const UploadIncidentsModal = ({ isOpen, onClose, onUpload }) => {
 
         {error && (
           <div className="mb-4 p-3 bg-red-50 border border-red-200 rounded">
-            <p className="text-sm text-red-600">{error}</p>
+            <p className="text-sm text-red-600 whitespace-pre-line">{error}</p>
+          </div>
+        )}
+
+        {progress && (
+          <div className="mb-4 p-3 bg-blue-50 border border-blue-200 rounded">
+            <p className="text-sm text-blue-700">{progress}</p>
           </div>
         )}
 
@@ -2,6 +2,9 @@ import { StrictMode } from 'react'
 import { createRoot } from 'react-dom/client'
 import './index.css'
 import App from './App.jsx'
+import { installSessionRefresh } from './session.js'
+
+installSessionRefresh()
 
 createRoot(document.getElementById('root')).render(
   <StrictMode>
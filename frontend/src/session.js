@@ -0,0 +1,40 @@
+// Keeps the session alive with the refresh token cookie.
+// The access token is short lived, so an API call answered with 401 first tries
+// POST /api/refresh and, when that worked, is sent once more. Concurrent 401s
+// share a single refresh, a refresh token can only be used once.
+
+const NO_REFRESH_PATHS = ['/api/refresh', '/api/login', '/api/reg', '/api/logout'];
+
+let refreshing = null;
+
+export function refreshSession(fetchImpl = window.fetch) {
+  if (!refreshing) {
+    refreshing = fetchImpl('/api/refresh', { method: 'POST', credentials: 'include' })
+      .then((response) => response.ok)
+      .catch(() => false)
+      .finally(() => { refreshing = null; });
+  }
+  return refreshing;
+}
+
+export function installSessionRefresh() {
+  const originalFetch = window.fetch.bind(window);
+
+  window.fetch = async (input, init) => {
+    const url = new URL(typeof input === 'string' ? input : input.url, window.location.origin);
+    const retryable = url.origin === window.location.origin
+      && url.pathname.startsWith('/api/')
+      && !NO_REFRESH_PATHS.includes(url.pathname);
+    // a Request body can only be read once, keep a copy for the retry
+    const retryInput = retryable && input instanceof Request ? input.clone() : input;
+
+    const response = await originalFetch(input, init);
+    if (response.status !== 401 || !retryable) {
+      return response;
+    }
+    if (!(await refreshSession(originalFetch))) {
+      return response;
+    }
+    return originalFetch(retryInput, init);
+  };
+}